@@ -28,7 +28,7 @@ class AuthService:
         user = await self.user_repository.get_user_by_email(email)
         print(f"Authenticating user: {user}")
         print(f"Provided password: {password}")
-        if user and verify_password(password, user.password):
+        if user and await verify_password(password, user.password):
             return user
         return None
 
@@ -42,5 +42,5 @@ class AuthService:
         if existing_user:
             raise ValueError("User with this email already exists.")
 
-        user_data.password = hash_password(user_data.password)
+        user_data.password = await hash_password(user_data.password)
         return await self.auth_repository.create(user_data)
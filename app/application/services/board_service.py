@@ -1,8 +1,12 @@
-from typing import Optional
+from datetime import datetime
+from typing import Optional, Tuple
 
 from app.domain.entities.board import Board, BoardCreate, BoardUpdate
+from app.domain.entities.user import User
 from app.domain.repositories.board_repository import IBoardRepository
 from app.domain.repositories.user_repository import IUserRepository
+from app.utils.fields import FieldSelection
+from app.utils.pagination import decode_cursor, encode_cursor
 
 
 class BoardService:
@@ -14,74 +18,97 @@ class BoardService:
         self.user_repository = user_repository
         self.MAX_COLLABORATORS = 10
 
-    async def get_all(self, email: str, offset: int = 0, limit: int = 100) -> dict:
+    async def get_all(
+        self,
+        user: User,
+        offset: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        fields: Optional[FieldSelection] = None,
+    ) -> dict:
         """
         Retrieve all boards.
+        Pages by offset, or by keyset when a cursor from a previous page is given.
         """
-        user = await self.user_repository.get_user_by_email(email)
-        if not user:
-            raise ValueError("User not found.")
-        boards = await self.board_repository.get_all(
-            offset=offset, limit=limit, admin_id=user.id
+        after = decode_cursor(cursor) if cursor else None
+        boards, total = await self.board_repository.get_all(
+            offset=offset,
+            limit=limit,
+            admin_id=user.id,
+            after=after,
+            include_total=include_total,
+            fields=fields,
+        )
+        next_cursor = (
+            encode_cursor(boards[-1].created_at, boards[-1].id)
+            if boards and len(boards) == limit
+            else None
         )
-        total = await self.board_repository.count()
-        return {"items": boards, "total": total, "offset": offset, "limit": limit}
+        return {
+            "items": boards,
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+            "next_cursor": next_cursor,
+        }
 
     async def get_by_id(
         self,
-        board_id: str,
-        email: str,
+        board_id: int,
+        user: User,
         status: Optional[str] = None,
         priority: Optional[str] = None,
+        fields: Optional[FieldSelection] = None,
+        task_limit: Optional[int] = None,
     ) -> Optional[Board]:
         """
         Retrieve a board by its ID.
         """
-        user = await self.user_repository.get_user_by_email(email)
-        if not user:
-            raise ValueError("User not found.")
         board = await self.board_repository.get_by_id(
-            board_id, admin_id=user.id, status=status, priority=priority
+            board_id,
+            admin_id=user.id,
+            status=status,
+            priority=priority,
+            fields=fields,
+            task_limit=task_limit,
         )
         return board
 
-    async def create(self, board_data: BoardCreate, email: str) -> Board:
+    async def get_version(self, board_id: int, user: User) -> Tuple[int, datetime]:
+        """
+        Return the version and last modification time of a board,
+        without loading its tasks.
+        """
+        version = await self.board_repository.get_version(board_id, admin_id=user.id)
+        if not version:
+            raise ValueError(f"Board with ID {board_id} not found.")
+        return version
+
+    async def create(self, board_data: BoardCreate, user: User) -> Board:
         """
         Create a new board.
         """
-        user = await self.user_repository.get_user_by_email(email)
-        if not user:
-            raise ValueError("User not found.")
         return await self.board_repository.create(board_data, admin_id=user.id)
 
     async def update(
-        self, board_id: str, board_data: BoardUpdate, email: str
+        self, board_id: int, board_data: BoardUpdate, user: User
     ) -> Optional[Board]:
         """
         Update an existing board.
         """
-        user = await self.user_repository.get_user_by_email(email)
-        if not user:
-            raise ValueError("User not found.")
         board = await self.board_repository.update(
             board_id, board_data, admin_id=user.id
         )
         return board
 
-    async def delete(self, board_id: str, email: str) -> None:
+    async def delete(self, board_id: int, user: User) -> None:
         """
         Delete a board by its ID.
         """
-        user = await self.user_repository.get_user_by_email(email)
-        if not user:
-            raise ValueError("User not found.")
         await self.board_repository.delete(board_id, admin_id=user.id)
 
-    async def add_collaborator(self, board_id: str, user_id: str, email: str) -> None:
-        user = await self.user_repository.get_user_by_email(email)
-        if not user:
-            raise ValueError("User not found.")
-
+    async def add_collaborator(self, board_id: int, user_id: int, user: User) -> None:
         board = await self.board_repository.get_by_id(board_id, admin_id=user.id)
         if not board:
             raise ValueError("Board not found.")
@@ -103,12 +130,8 @@ class BoardService:
         await self.board_repository.add_collaborator(board_id, user_id)
 
     async def remove_collaborator(
-        self, board_id: str, user_id: str, email: str
+        self, board_id: int, user_id: int, user: User
     ) -> None:
-        user = await self.user_repository.get_user_by_email(email)
-        if not user:
-            raise ValueError("User not found.")
-
         collaborator = await self.user_repository.get_by_id(user_id)
         if not collaborator:
             raise ValueError("Collaborator not found.")
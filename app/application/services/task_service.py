@@ -1,9 +1,110 @@
-from typing import Optional
+import logging
+import re
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
-from app.domain.entities.task import Task, TaskCreate
+from pydantic import ValidationError
+
+from app.core.settings import settings
+from app.domain.entities.task import (
+    PRIORITY_ORDER,
+    STATUS_ORDER,
+    SortOrder,
+    Task,
+    TaskBulkError,
+    TaskBulkUpdateStatus,
+    TaskCreate,
+    TaskFileFormat,
+    TaskPriority,
+    TaskSearchResult,
+    TaskSortField,
+    TaskStatus,
+    TaskUpdate,
+)
+from app.domain.entities.user import User
 from app.domain.repositories.board_repository import IBoardRepository
 from app.domain.repositories.task_repository import ITaskRepository
 from app.domain.repositories.user_repository import IUserRepository
+from app.utils.datetime import get_current_utc_time
+from app.utils.export import encode_tasks
+from app.utils.fields import FieldSelection
+from app.utils.pagination import decode_keyset, encode_keyset
+from app.utils.task_import import parse_records
+
+logger = logging.getLogger(__name__)
+
+
+def _bulk_error(index: int, error: ValidationError) -> TaskBulkError:
+    return TaskBulkError(
+        index=index,
+        errors=[{"loc": e["loc"], "msg": e["msg"]} for e in error.errors()],
+    )
+
+
+def _validate_record(
+    number: int, record: Union[Dict[str, Any], str]
+) -> Tuple[Optional[TaskCreate], Optional[TaskBulkError]]:
+    # Parsers report records they could not read as an error message.
+    if isinstance(record, str):
+        return None, TaskBulkError(index=number, errors=[{"loc": [], "msg": record}])
+    try:
+        return TaskCreate.model_validate(record), None
+    except ValidationError as e:
+        return None, _bulk_error(number, e)
+
+
+def _sort_key(task: Task, sort: TaskSortField) -> Union[str, int]:
+    if sort is TaskSortField.STATUS:
+        return STATUS_ORDER.index(task.status)
+    if sort is TaskSortField.PRIORITY:
+        return PRIORITY_ORDER.index(task.priority)
+    return task.created_at.isoformat()
+
+
+def _encode_task_cursor(task: Task, sort: TaskSortField, order: SortOrder) -> str:
+    # The sort travels with the cursor so it cannot be replayed under another.
+    return encode_keyset(sort.value, order.value, _sort_key(task, sort), task.id)
+
+
+def _decode_task_cursor(
+    cursor: str, sort: TaskSortField, order: SortOrder
+) -> Tuple[Union[datetime, int], int]:
+    cursor_sort, cursor_order, key, task_id = decode_keyset(cursor, 4)
+    if (cursor_sort, cursor_order) != (sort.value, order.value):
+        raise ValueError("Cursor does not match the requested sort.")
+    try:
+        if sort is TaskSortField.CREATED_AT:
+            return datetime.fromisoformat(key), int(task_id)
+        return int(key), int(task_id)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor.")
+
+
+def _encode_sync_token(board_id: int, position: Tuple[datetime, int]) -> str:
+    changed_at, task_id = position
+    return encode_keyset(board_id, changed_at.isoformat(), task_id)
+
+
+def _decode_sync_token(token: str, board_id: int) -> Tuple[datetime, int]:
+    try:
+        token_board_id, changed_at, task_id = decode_keyset(token, 3)
+    except ValueError:
+        raise ValueError("Invalid sync token.")
+    if token_board_id != board_id:
+        raise ValueError("Sync token does not belong to this board.")
+    try:
+        return datetime.fromisoformat(changed_at), int(task_id)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid sync token.")
+
+
+def _parse_filter(enum_type: type, value: Optional[str], name: str) -> Any:
+    if not value:
+        return None
+    try:
+        return enum_type(value)
+    except ValueError:
+        raise ValueError(f"Invalid {name}: {value}")
 
 
 class TaskService:
@@ -17,34 +118,180 @@ class TaskService:
         self.task_repository = task_repository
         self.board_repository = board_repository
         self.user_repository = user_repository
+        self.MAX_BULK_TASKS = 1000
+        self.EXPORT_BATCH_SIZE = 500
+        self.IMPORT_BATCH_SIZE = 1000
+        self.MAX_IMPORT_ERRORS = 100
+        self.MAX_SEARCH_TERMS = 10
 
-    async def create(self, board_id: str, task_data: TaskCreate, email: str) -> Task:
+    async def create(self, board_id: int, task_data: TaskCreate, user: User) -> Task:
         """
         Create a new task in the specified board.
         """
-        user = await self.user_repository.get_user_by_email(email)
-        if not user:
-            raise ValueError("User not found.")
-        board = await self.board_repository.get_by_id(board_id, admin_id=user.id)
-        if not board:
+        if not await self.board_repository.is_admin(board_id, user.id):
             raise ValueError("Board not found or user does not have access to it.")
-        if board.admin_id != user.id:
+
+        return await self.task_repository.create(board_id, task_data)
+
+    async def create_many(
+        self,
+        board_id: int,
+        items: List[Dict[str, Any]],
+        user: User,
+        allow_partial: bool = False,
+    ) -> dict:
+        """
+        Create many tasks in the specified board with a single insert.
+        Invalid items are reported by index; unless `allow_partial` is set,
+        any invalid item prevents the whole batch from being created.
+        """
+        if len(items) > self.MAX_BULK_TASKS:
             raise ValueError(
-                "User does not have permission to create tasks in this board."
+                f"A bulk request may contain at most {self.MAX_BULK_TASKS} tasks."
             )
+        if not await self.board_repository.is_admin(board_id, user.id):
+            raise ValueError("Board not found or user does not have access to it.")
 
-        return await self.task_repository.create(board_id, task_data)
+        tasks: List[TaskCreate] = []
+        errors: List[TaskBulkError] = []
+        for index, item in enumerate(items):
+            try:
+                tasks.append(TaskCreate.model_validate(item))
+            except ValidationError as e:
+                errors.append(_bulk_error(index, e))
+
+        if errors and not allow_partial:
+            return {"created_ids": [], "errors": errors}
+
+        created_ids = await self.task_repository.create_many(board_id, tasks)
+        return {"created_ids": created_ids, "errors": errors}
+
+    async def list_by_board(
+        self,
+        board_id: int,
+        user: User,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        sort: TaskSortField = TaskSortField.CREATED_AT,
+        order: SortOrder = SortOrder.ASC,
+        status: Optional[str] = None,
+        priority: Optional[str] = None,
+        fields: Optional[FieldSelection] = None,
+    ) -> dict:
+        """
+        Retrieve a page of a board's tasks, sorted and filtered.
+        Pages by keyset; pass the next_cursor of a page to get the next one.
+        """
+        status_filter = _parse_filter(TaskStatus, status, "status")
+        priority_filter = _parse_filter(TaskPriority, priority, "priority")
+        after = _decode_task_cursor(cursor, sort, order) if cursor else None
+        if not await self.board_repository.is_admin(board_id, user.id):
+            raise ValueError("Board not found or user does not have access to it.")
+
+        tasks = await self.task_repository.list_by_board(
+            board_id,
+            limit=limit,
+            sort=sort,
+            order=order,
+            after=after,
+            status=status_filter,
+            priority=priority_filter,
+            fields=fields,
+        )
+        next_cursor = (
+            _encode_task_cursor(tasks[-1], sort, order) if len(tasks) == limit else None
+        )
+        return {"items": tasks, "limit": limit, "next_cursor": next_cursor}
+
+    async def list_changes(
+        self,
+        board_id: int,
+        user: User,
+        since: Optional[str] = None,
+        limit: int = 100,
+    ) -> dict:
+        """
+        Retrieve the tasks of a board created, updated or deleted since a
+        sync token, or all of its tasks without one, oldest change first.
+        Pass next_token back to continue; a page with has_more set is
+        followed by more changes right away.
+        """
+        after = _decode_sync_token(since, board_id) if since else None
+        if not await self.board_repository.is_admin(board_id, user.id):
+            raise ValueError("Board not found or user does not have access to it.")
+
+        # Cut-off taken before reading, so it never passes an unread change.
+        cutoff = (
+            get_current_utc_time() - timedelta(seconds=settings.sync_overlap_seconds),
+            0,
+        )
+        tasks, tombstones = await self.task_repository.list_changes(
+            board_id, limit=limit + 1, after=after
+        )
+        changes = sorted(
+            [((task.updated_at or task.created_at, task.id), task) for task in tasks]
+            + [
+                ((tombstone.deleted_at, tombstone.task_id), tombstone)
+                for tombstone in tombstones
+            ],
+            key=lambda change: change[0],
+        )
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+
+        position = changes[-1][0] if changes else after or cutoff
+        if not has_more:
+            # Caught up: stay behind the overlap window, so a write that
+            # commits late with an earlier timestamp is sent next time.
+            # Clients may see the window's changes twice.
+            position = min(position, cutoff)
+        return {
+            "updated": [change for _, change in changes if isinstance(change, Task)],
+            "deleted": [
+                change.task_id for _, change in changes if not isinstance(change, Task)
+            ],
+            "next_token": _encode_sync_token(board_id, position),
+            "has_more": has_more,
+        }
 
-    async def get_by_id(self, task_id: str, email: str) -> Optional[Task]:
+    async def search(
+        self, query: str, user: User, limit: int = 20, offset: int = 0
+    ) -> dict:
+        """
+        Search the tasks of every board the user administers or collaborates
+        on by the words of `query`, best matches first.
+        """
+        terms = re.findall(r"\w+", query.lower())
+        if not terms:
+            raise ValueError("Search query must contain at least one word.")
+        if len(terms) > self.MAX_SEARCH_TERMS:
+            raise ValueError(
+                f"Search query may contain at most {self.MAX_SEARCH_TERMS} words."
+            )
+
+        matches = await self.task_repository.search(
+            user.id, terms, limit=limit, offset=offset
+        )
+        items = [
+            TaskSearchResult.model_validate({**task.model_dump(), "score": score})
+            for task, score in matches
+        ]
+        next_offset = offset + limit if len(items) == limit else None
+        return {
+            "items": items,
+            "offset": offset,
+            "limit": limit,
+            "next_offset": next_offset,
+        }
+
+    async def get_by_id(
+        self, task_id: int, user: User, fields: Optional[FieldSelection] = None
+    ) -> Optional[Task]:
         """
         Retrieve a task by its ID.
         Returns None if the task does not exist.
         """
-        user = await self.user_repository.get_user_by_email(email)
-        if not user:
-            raise ValueError("User not found.")
-
-        task = await self.task_repository.get_by_id(task_id)
+        task = await self.task_repository.get_by_id(task_id, fields=fields)
 
         if not task:
             raise ValueError("Task not found.")
@@ -57,39 +304,107 @@ class TaskService:
 
         return task
 
-    async def delete(self, task_id: str, email: str) -> None:
+    async def delete(self, task_id: int, user: User) -> None:
         """
         Delete a task by its ID.
         Raises an exception if the task does not exist.
         """
-        user = await self.user_repository.get_user_by_email(email)
-        if not user:
-            raise ValueError("User not found.")
-
         await self.task_repository.delete(task_id, admin_id=user.id)
 
     async def update(
-        self, task_id: str, task_data: TaskCreate, email: str
+        self, task_id: int, task_data: TaskCreate, user: User
     ) -> Optional[Task]:
         """
         Update an existing task with the provided data.
         Returns None if the task does not exist.
         """
-        user = await self.user_repository.get_user_by_email(email)
-        if not user:
-            raise ValueError("User not found.")
-
         task = await self.task_repository.update(task_id, task_data, admin_id=user.id)
         return task
 
-    async def assign_task(self, task_id: str, user_id: str, email: str) -> None:
+    async def export(
+        self, board_id: int, export_format: TaskFileFormat, user: User
+    ) -> AsyncIterator[str]:
         """
-        Assign a task to a user.
+        Check access to the board, then return an iterator that streams
+        its tasks encoded in the requested format.
+        """
+        if not await self.board_repository.is_admin(board_id, user.id):
+            raise ValueError("Board not found or user does not have access to it.")
+
+        batches = self.task_repository.stream_by_board(
+            board_id, batch_size=self.EXPORT_BATCH_SIZE
+        )
+        return encode_tasks(batches, export_format)
+
+    async def import_tasks(
+        self,
+        board_id: int,
+        chunks: AsyncIterator[bytes],
+        file_format: TaskFileFormat,
+        user: User,
+    ) -> dict:
+        """
+        Import tasks from a streamed CSV or NDJSON upload.
+        Records are parsed and validated as they arrive and inserted in
+        batches that commit independently; invalid records are skipped
+        and the first MAX_IMPORT_ERRORS of them are reported.
         """
-        user = await self.user_repository.get_user_by_email(email)
-        if not user:
-            raise ValueError("User not found.")
+        if not await self.board_repository.is_admin(board_id, user.id):
+            raise ValueError("Board not found or user does not have access to it.")
+
+        summary = {"imported": 0, "rejected": 0, "batches": 0, "errors": []}
+        batch: List[TaskCreate] = []
 
+        async def flush() -> None:
+            await self.task_repository.import_batch(board_id, batch)
+            summary["imported"] += len(batch)
+            summary["batches"] += 1
+            batch.clear()
+            logger.info(
+                "Importing into board %d: %d imported, %d rejected.",
+                board_id,
+                summary["imported"],
+                summary["rejected"],
+            )
+
+        async for number, record in parse_records(chunks, file_format):
+            task, error = _validate_record(number, record)
+            if error:
+                summary["rejected"] += 1
+                if len(summary["errors"]) < self.MAX_IMPORT_ERRORS:
+                    summary["errors"].append(error)
+                continue
+            batch.append(task)
+            if len(batch) >= self.IMPORT_BATCH_SIZE:
+                await flush()
+
+        if batch:
+            await flush()
+        return summary
+
+    async def update_many(
+        self, task_ids: List[int], task_data: TaskUpdate, user: User
+    ) -> Dict[int, TaskBulkUpdateStatus]:
+        """
+        Apply the same changes to many tasks at once.
+        Returns the outcome for each requested task ID.
+        """
+        task_ids = list(dict.fromkeys(task_ids))
+        if len(task_ids) > self.MAX_BULK_TASKS:
+            raise ValueError(
+                f"A bulk request may contain at most {self.MAX_BULK_TASKS} tasks."
+            )
+        if not task_data.model_fields_set:
+            raise ValueError("No changes provided.")
+
+        return await self.task_repository.update_many(
+            task_ids, task_data, admin_id=user.id
+        )
+
+    async def assign_task(self, task_id: int, user_id: int, user: User) -> None:
+        """
+        Assign a task to a user.
+        """
         task = await self.task_repository.get_by_id(task_id)
         if not task:
             raise ValueError("Task not found.")
@@ -115,14 +430,10 @@ class TaskService:
 
         await self.task_repository.assign_task(task, user_id)
 
-    async def unassign_task(self, task_id: str, email: str) -> None:
+    async def unassign_task(self, task_id: int, user: User) -> None:
         """
         Unassign a task from its assigned user.
         """
-        user = await self.user_repository.get_user_by_email(email)
-        if not user:
-            raise ValueError("User not found.")
-
         task = await self.task_repository.get_by_id(task_id)
         if not task:
             raise ValueError("Task not found.")
@@ -1,7 +1,7 @@
 from typing import Optional
 
-from app.domain.entities.user import User
 from app.domain.repositories.user_repository import IUserRepository
+from app.utils.pagination import decode_cursor, encode_cursor
 
 
 class UserService:
@@ -12,24 +12,30 @@ class UserService:
     def __init__(self, user_repository: IUserRepository):
         self.user_repository = user_repository
 
-    async def user(self, email: str) -> Optional[User]:
-        """
-        Retrieve a user data by their email address.
-        """
-        user = await self.user_repository.get_user_by_email(email)
-
-        if not user:
-            raise ValueError("User not found.")
-
-        if not user.is_active:
-            raise ValueError("User is inactive.")
-
-        return user
-
-    async def get_all(self, offset: int = 0, limit: int = 100) -> dict:
+    async def get_all(
+        self,
+        offset: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> dict:
         """
         Retrieve all users with pagination.
+        Pages by offset, or by keyset when a cursor from a previous page is given.
         """
-        users = await self.user_repository.get_all(offset=offset, limit=limit)
-        total = await self.user_repository.count()
-        return {"items": users, "total": total, "offset": offset, "limit": limit}
+        after = decode_cursor(cursor) if cursor else None
+        users, total = await self.user_repository.get_all(
+            offset=offset, limit=limit, after=after, include_total=include_total
+        )
+        next_cursor = (
+            encode_cursor(users[-1].created_at, users[-1].id)
+            if users and len(users) == limit
+            else None
+        )
+        return {
+            "items": users,
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+            "next_cursor": next_cursor,
+        }
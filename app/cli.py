@@ -0,0 +1,63 @@
+"""
+Maintenance commands.
+
+Usage:
+    python -m app.cli migrate [REVISION]
+    python -m app.cli repair-board-counters [--board-id ID ...]
+"""
+
+import argparse
+import asyncio
+import logging
+
+from app.core.database import async_session, migrate_db
+from app.infrastructure.repositories.board_repository import BoardRepository
+
+logger = logging.getLogger(__name__)
+
+
+async def migrate(args: argparse.Namespace) -> None:
+    await migrate_db(args.revision)
+    logger.info("Database migrated to %s.", args.revision)
+
+
+async def repair_board_counters(args: argparse.Namespace) -> None:
+    async with async_session() as session:
+        updated = await BoardRepository(session).repair_task_counters(args.board_id)
+    logger.info("Recomputed task counters for %d board(s).", updated)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = commands.add_parser(
+        "migrate", help="Apply schema migrations to the database."
+    )
+    migrate_parser.add_argument(
+        "revision", nargs="?", default="head", help="Target revision (default: head)."
+    )
+    migrate_parser.set_defaults(handler=migrate)
+
+    repair = commands.add_parser(
+        "repair-board-counters",
+        help="Recompute the denormalized task counters stored on boards.",
+    )
+    repair.add_argument(
+        "--board-id",
+        type=int,
+        action="append",
+        help="Only repair this board (repeatable). Defaults to every board.",
+    )
+    repair.set_defaults(handler=repair_board_counters)
+    return parser
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    args = build_parser().parse_args()
+    asyncio.run(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,10 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
+from app.core.settings import settings
+from app.infrastructure.dependencies import get_current_user
 from app.infrastructure.routers.auth_router import app as auth_router
 from app.infrastructure.routers.board_router import app as board_router
+from app.infrastructure.routers.internal_router import app as internal_router
 from app.infrastructure.routers.task_router import app as task_router
 from app.infrastructure.routers.user_router import app as user_router
 
@@ -11,3 +14,12 @@ api_router.include_router(board_router, prefix="/boards", tags=["Boards"])
 api_router.include_router(task_router, prefix="/tasks", tags=["Tasks"])
 api_router.include_router(auth_router, prefix="/auth", tags=["Auth"])
 api_router.include_router(user_router, prefix="/users", tags=["Users"])
+# Operational detail about this process, not an API for clients.
+if settings.internal_endpoints_enabled:
+    api_router.include_router(
+        internal_router,
+        prefix="/internal",
+        tags=["Internal"],
+        include_in_schema=False,
+        dependencies=[Depends(get_current_user)],
+    )
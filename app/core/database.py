@@ -1,31 +1,102 @@
-from sqlmodel import Session, SQLModel, create_engine
+from pathlib import Path
+from typing import AsyncGenerator
 
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import Connection, inspect
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.pool import InstrumentedAsyncQueuePool, pool_metrics
+from app.core.query_stats import instrument_queries
 from app.core.settings import settings
 
-DATABASE_URL = settings.database_url
-engine = create_engine(
+ALEMBIC_CONFIG = Path(__file__).resolve().parents[2] / "alembic.ini"
+# Revision matching the schema that create_all produced before migrations.
+BASELINE_REVISION = "0001"
+
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+}
+
+
+def get_async_database_url(database_url: str) -> str:
+    """
+    Translate a plain database URL into its async driver equivalent.
+    URLs that already name a driver (e.g. ``postgresql+asyncpg://``) are kept.
+    """
+    scheme, separator, rest = database_url.partition("://")
+    if not separator or "+" in scheme:
+        return database_url
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}://{rest}"
+
+
+def get_pool_options(database_url: str) -> dict:
+    """
+    Pool arguments from settings. In-memory SQLite keeps its single
+    shared connection, which a queue pool would break.
+    """
+    if database_url.startswith("sqlite") and ":memory:" in database_url:
+        return {}
+    return {
+        "poolclass": InstrumentedAsyncQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+DATABASE_URL = get_async_database_url(settings.database_url)
+engine = create_async_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
-    echo=True,  # Set to True for SQL query logging
+    echo=settings.db_echo,  # Logs every statement; for local debugging only
+    **get_pool_options(DATABASE_URL),
+)
+pool_metrics.warn_after_seconds = settings.db_pool_wait_warning_seconds
+instrument_queries(
+    engine.sync_engine,
+    slow_threshold_seconds=settings.slow_query_threshold_seconds,
+    slow_sample_rate=settings.slow_query_sample_rate,
 )
+async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
-def get_db():
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
-    Dependency to get the database engine.
+    Dependency to get an async database session.
     This can be used in FastAPI routes to access the database.
     """
-    with Session(engine) as session:
+    async with async_session() as session:
         yield session
 
 
-def init_db():
+def _upgrade(connection: Connection, revision: str) -> None:
+    config = Config(str(ALEMBIC_CONFIG))
+    config.attributes["connection"] = connection
+    inspector = inspect(connection)
+    if not inspector.has_table("alembic_version") and inspector.has_table("board"):
+        # Tables created by create_all before migrations existed.
+        command.stamp(config, BASELINE_REVISION)
+    command.upgrade(config, revision)
+
+
+async def migrate_db(revision: str = "head") -> None:
     """
-    Initialize the database by creating all tables.
-    This should be called at application startup.
+    Apply schema migrations up to `revision` on the application engine.
     """
-    # Import all models to ensure they are registered with SQLModel
-    from app.domain.entities.board import Board  # noqa: F401
-    from app.domain.entities.task import Task  # noqa: F401
+    async with engine.begin() as connection:
+        await connection.run_sync(_upgrade, revision)
+
 
-    SQLModel.metadata.create_all(engine)
+async def init_db():
+    """
+    Initialize the database by applying pending migrations.
+    This should be called at application startup.
+    """
+    if settings.migrate_on_startup:
+        await migrate_db()
@@ -0,0 +1,247 @@
+import bisect
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Upper bounds, in seconds, of the request duration histogram buckets.
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Label for requests that matched no route, so raw paths never become labels.
+UNMATCHED_ROUTE = "unmatched"
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram; counts are kept per bucket and made
+    cumulative only when rendered.
+    """
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> Iterable[Tuple[str, int]]:
+        total = 0
+        for bound, count in zip((*self.buckets, float("inf")), self.counts):
+            total += count
+            yield ("+Inf" if bound == float("inf") else repr(bound)), total
+
+
+def _labels(**labels: object) -> str:
+    escaped = (
+        str(value).replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+        for value in labels.values()
+    )
+    return ",".join(f'{name}="{value}"' for name, value in zip(labels, escaped))
+
+
+class MetricsRegistry:
+    """
+    HTTP request metrics. Only updated from the event loop thread,
+    so plain dicts and ints are enough.
+    """
+
+    def __init__(self) -> None:
+        self.requests: Dict[Tuple[str, str, int], int] = defaultdict(int)
+        self.errors: Dict[Tuple[str, str], int] = defaultdict(int)
+        self.in_progress: Dict[str, int] = defaultdict(int)
+        self.durations: Dict[Tuple[str, str], Histogram] = {}
+
+    def observe(self, method: str, route: str, status_code: int, seconds: float):
+        self.requests[method, route, status_code] += 1
+        if status_code >= 500:
+            self.errors[method, route] += 1
+        histogram = self.durations.get((method, route))
+        if histogram is None:
+            histogram = self.durations[method, route] = Histogram(DURATION_BUCKETS)
+        histogram.observe(seconds)
+
+    def render(self) -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+        """
+        lines: List[str] = [
+            "# HELP http_requests_total Requests by method, route and status.",
+            "# TYPE http_requests_total counter",
+        ]
+        for (method, route, status_code), value in self.requests.items():
+            labels = _labels(method=method, route=route, status=status_code)
+            lines.append(f"http_requests_total{{{labels}}} {value}")
+
+        lines += [
+            "# HELP http_request_errors_total Requests that ended in a 5xx.",
+            "# TYPE http_request_errors_total counter",
+        ]
+        for (method, route), value in self.errors.items():
+            labels = _labels(method=method, route=route)
+            lines.append(f"http_request_errors_total{{{labels}}} {value}")
+
+        lines += [
+            "# HELP http_requests_in_progress Requests being handled.",
+            "# TYPE http_requests_in_progress gauge",
+        ]
+        for method, value in self.in_progress.items():
+            lines.append(
+                f"http_requests_in_progress{{{_labels(method=method)}}} {value}"
+            )
+
+        lines += [
+            "# HELP http_request_duration_seconds Request latency by route.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (method, route), histogram in self.durations.items():
+            labels = _labels(method=method, route=route)
+            for bound, count in histogram.cumulative():
+                lines.append(
+                    f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}}'
+                    f" {count}"
+                )
+            lines.append(
+                f"http_request_duration_seconds_sum{{{labels}}} {histogram.sum}"
+            )
+            lines.append(
+                f"http_request_duration_seconds_count{{{labels}}} {histogram.count}"
+            )
+        return "\n".join(lines) + "\n"
+
+
+def render_pool_metrics(stats: dict) -> str:
+    """
+    Render the connection pool statistics (see InstrumentedAsyncQueuePool).
+    """
+    lines = []
+    for name, key, help_text in (
+        ("db_pool_size", "size", "Configured pool size."),
+        ("db_pool_checked_out", "checked_out", "Connections in use."),
+        ("db_pool_checked_in", "checked_in", "Idle connections in the pool."),
+        ("db_pool_overflow", "overflow", "Connections open beyond the pool size."),
+    ):
+        lines += [
+            f"# HELP {name} {help_text}",
+            f"# TYPE {name} gauge",
+            f"{name} {stats[key]}",
+        ]
+    lines += [
+        "# HELP db_pool_checkout_timeouts_total Checkouts that timed out.",
+        "# TYPE db_pool_checkout_timeouts_total counter",
+        f"db_pool_checkout_timeouts_total {stats['timeouts']}",
+        "# HELP db_pool_checkout_wait_seconds Time spent checking out a connection.",
+        "# TYPE db_pool_checkout_wait_seconds histogram",
+    ]
+    for bound, count in stats["wait_seconds_buckets"].items():
+        le = "+Inf" if bound == "inf" else bound
+        lines.append(f'db_pool_checkout_wait_seconds_bucket{{le="{le}"}} {count}')
+    lines += [
+        f"db_pool_checkout_wait_seconds_sum {stats['total_wait_seconds']}",
+        f"db_pool_checkout_wait_seconds_count {stats['checkouts']}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware that records each HTTP request under its route
+    template (e.g. /api/v1/boards/{board_id}) once the response is done.
+    """
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry = metrics_registry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress = self.registry.in_progress
+        in_progress[method] += 1
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        except Exception:
+            status_code = 500
+            raise
+        finally:
+            in_progress[method] -= 1
+            route = scope.get("route")
+            self.registry.observe(
+                method,
+                getattr(route, "path_format", UNMATCHED_ROUTE),
+                status_code,
+                time.perf_counter() - started,
+            )
+
+
+def render_password_hash_metrics(stats: dict) -> str:
+    """
+    Render the password hashing pool counters (see PasswordHashMetrics).
+    """
+    lines = [
+        "# HELP password_hash_pending Hashes queued or running.",
+        "# TYPE password_hash_pending gauge",
+        f"password_hash_pending {stats['pending']}",
+        "# HELP password_hash_rejected_total Hashes rejected by a full pool.",
+        "# TYPE password_hash_rejected_total counter",
+        f"password_hash_rejected_total {stats['rejected']}",
+        "# HELP password_hash_wait_seconds Time hashes spent queued.",
+        "# TYPE password_hash_wait_seconds summary",
+        f"password_hash_wait_seconds_sum {stats['total_wait_seconds']}",
+        f"password_hash_wait_seconds_count {stats['completed']}",
+        "# HELP password_hash_latency_seconds Time from submission to result.",
+        "# TYPE password_hash_latency_seconds summary",
+        f"password_hash_latency_seconds_sum {stats['total_latency_seconds']}",
+        f"password_hash_latency_seconds_count {stats['completed']}",
+        "# HELP password_hash_max_latency_seconds Slowest hash so far.",
+        "# TYPE password_hash_max_latency_seconds gauge",
+        f"password_hash_max_latency_seconds {stats['max_latency_seconds']}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def render_cache_metrics(caches: Dict[str, dict]) -> str:
+    """
+    Render the hit and miss counters of in-process caches, by cache name.
+    """
+    lines = [
+        "# HELP cache_hits_total Lookups answered from the cache.",
+        "# TYPE cache_hits_total counter",
+    ]
+    for name, stats in caches.items():
+        lines.append(f"cache_hits_total{{{_labels(cache=name)}}} {stats['hits']}")
+    lines += [
+        "# HELP cache_misses_total Lookups that fell through to the source.",
+        "# TYPE cache_misses_total counter",
+    ]
+    for name, stats in caches.items():
+        lines.append(f"cache_misses_total{{{_labels(cache=name)}}} {stats['misses']}")
+    lines += [
+        "# HELP cache_entries Entries held by the cache.",
+        "# TYPE cache_entries gauge",
+    ]
+    for name, stats in caches.items():
+        if "size" in stats:
+            lines.append(f"cache_entries{{{_labels(cache=name)}}} {stats['size']}")
+    return "\n".join(lines) + "\n"
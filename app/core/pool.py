@@ -0,0 +1,93 @@
+import bisect
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import List
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds, in seconds, of the checkout wait histogram buckets.
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+@dataclass
+class PoolMetrics:
+    """
+    Checkout counters and wait time histogram for the connection pool.
+    """
+
+    warn_after_seconds: float = 0.5
+    checkouts: int = 0
+    timeouts: int = 0
+    slow_checkouts: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    # One count per WAIT_BUCKETS bound, plus a final +Inf bucket.
+    wait_buckets: List[int] = field(
+        default_factory=lambda: [0] * (len(WAIT_BUCKETS) + 1)
+    )
+
+    def record(self, wait: float) -> None:
+        self.checkouts += 1
+        self.total_wait_seconds += wait
+        self.max_wait_seconds = max(self.max_wait_seconds, wait)
+        self.wait_buckets[bisect.bisect_left(WAIT_BUCKETS, wait)] += 1
+        if wait > self.warn_after_seconds:
+            self.slow_checkouts += 1
+            logger.warning("Waited %.3fs to check out a database connection.", wait)
+
+    def snapshot(self) -> dict:
+        """
+        Return the counters, average wait and cumulative histogram.
+        """
+        cumulative, buckets = 0, {}
+        for bound, count in zip((*WAIT_BUCKETS, float("inf")), self.wait_buckets):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "slow_checkouts": self.slow_checkouts,
+            "total_wait_seconds": self.total_wait_seconds,
+            "avg_wait_seconds": self.total_wait_seconds / (self.checkouts or 1),
+            "max_wait_seconds": self.max_wait_seconds,
+            "wait_seconds_buckets": buckets,
+        }
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that records how long each checkout waits,
+    including any pre-ping or new connection it needs.
+    """
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            pool_metrics.timeouts += 1
+            logger.error(
+                "Timed out waiting for a database connection (%s).", self.status()
+            )
+            raise
+        pool_metrics.record(time.perf_counter() - started)
+        return connection
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            # SQLAlchemy reports unopened pool slots as negative overflow.
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            "timeout_seconds": self.timeout(),
+            **pool_metrics.snapshot(),
+        }
@@ -0,0 +1,67 @@
+import logging
+import random
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import Engine, event
+
+logger = logging.getLogger(__name__)
+
+_STARTED_AT = "query_started_at"
+
+
+@dataclass
+class QueryStats:
+    """
+    Number of SQL statements and time spent running them in one request.
+    """
+
+    count: int = 0
+    seconds: float = 0.0
+
+
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+def start_query_stats() -> QueryStats:
+    """
+    Begin collecting statistics for the current request.
+    Async sessions run statements in the caller's context, so events
+    record into this object.
+    """
+    stats = QueryStats()
+    current_query_stats.set(stats)
+    return stats
+
+
+def instrument_queries(
+    engine: Engine, slow_threshold_seconds: float, slow_sample_rate: float
+) -> None:
+    """
+    Time every statement on `engine`, add it to the current request's
+    QueryStats and log a sample of statements slower than the threshold.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        conn.info.setdefault(_STARTED_AT, []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        elapsed = time.perf_counter() - conn.info[_STARTED_AT].pop()
+        stats = current_query_stats.get()
+        if stats is not None:
+            stats.count += 1
+            stats.seconds += elapsed
+        if elapsed >= slow_threshold_seconds and random.random() < slow_sample_rate:
+            logger.warning("Slow query (%.3fs): %s", elapsed, statement)
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get(_STARTED_AT):
+            connection.info[_STARTED_AT].pop()
@@ -1,4 +1,5 @@
 import logging
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -16,12 +17,52 @@ class Settings(BaseSettings):
 
     # Database settings
     database_url: str = "sqlite:///./test.db"
+    migrate_on_startup: bool = True
+
+    # Database connection pool settings
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = -1
+    db_pool_pre_ping: bool = False
+    db_pool_wait_warning_seconds: float = 0.5
+    # Serve GET /api/v1/internal/pool (to signed-in users only).
+    internal_endpoints_enabled: bool = False
+
+    # SQL logging settings
+    db_echo: bool = False
+    slow_query_threshold_seconds: float = 0.2
+    slow_query_sample_rate: float = 1.0
 
     # JWT settings
     secret_key: str
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
 
+    # Password hashing settings
+    password_hash_workers: int = 4
+    password_hash_max_pending: int = 64
+
+    # Current user identity cache settings
+    user_cache_enabled: bool = True
+    user_cache_ttl_seconds: float = 30.0
+    user_cache_max_size: int = 1024
+
+    # Decoded access token cache settings
+    token_cache_enabled: bool = True
+    token_cache_max_size: int = 4096
+
+    # Board detail response cache settings
+    board_cache_backend: Literal["memory", "redis", "none"] = "memory"
+    board_cache_ttl_seconds: float = 30.0
+    board_cache_max_size: int = 1024
+    board_cache_max_variants: int = 16
+    redis_url: str = "redis://localhost:6379/0"
+
+    # Board change feed settings: sync tokens stay this far behind the
+    # present, so writes committed late with an older timestamp are not missed.
+    sync_overlap_seconds: float = 5.0
+
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", extra="ignore"
     )
@@ -1,12 +1,31 @@
 from datetime import datetime
 from typing import List, Optional
 
-from sqlmodel import Field, Relationship, SQLModel
-
-from app.domain.entities.task import Task, TaskForBoardResponse, TaskStatus
+from sqlmodel import Field, Index, Relationship, SQLModel
+
+from app.domain.entities.task import (
+    Task,
+    TaskForBoardResponse,
+    TaskResponse,
+    TaskStatus,
+)
 from app.domain.entities.user import User, UserBoardLink, UserResponse
 from app.utils.datetime import get_current_utc_time
 
+# Board counter column maintained for each task status.
+STATUS_COUNTERS = {
+    TaskStatus.TODO: "todo_count",
+    TaskStatus.IN_PROGRESS: "in_progress_count",
+    TaskStatus.DONE: "done_count",
+}
+
+
+def calculate_complete_percentage(done_tasks: int, total_tasks: int) -> float:
+    """
+    Percentage of done tasks out of the total, 0.0 for an empty board.
+    """
+    return (done_tasks / total_tasks) * 100 if total_tasks else 0.0
+
 
 class BoardBase(SQLModel):
     """
@@ -21,10 +40,15 @@ class Board(BoardBase, table=True):
     Represents a board in the system.
     """
 
+    __table_args__ = (
+        # Keyset pagination of an admin's boards by (created_at, id).
+        Index("ix_board_admin_id_created_at_id", "admin_id", "created_at", "id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=get_current_utc_time)
     updated_at: Optional[datetime] = Field(
-        sa_column_kwargs={"on_update": get_current_utc_time},
+        sa_column_kwargs={"onupdate": get_current_utc_time},
         default=None,
     )
     tasks: List["Task"] = Relationship(
@@ -36,16 +60,20 @@ class Board(BoardBase, table=True):
         back_populates="boards_collaborator",
         link_model=UserBoardLink,
     )
+    # Task counters maintained by TaskRepository in the same transaction.
+    task_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    todo_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    in_progress_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    done_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    # Bumped by every write that changes the board or its tasks; backs its ETag.
+    version: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
 
     @property
     def complete_percentage(self) -> float:
         """
         Calculate the percentage of completed tasks on the board.
         """
-        if not self.tasks:
-            return 0.0
-        completed_tasks = sum(task.status == TaskStatus.DONE for task in self.tasks)
-        return (completed_tasks / len(self.tasks)) * 100 if self.tasks else 0.0
+        return calculate_complete_percentage(self.done_count, self.task_count)
 
 
 class BoardResponse(BoardBase):
@@ -57,6 +85,10 @@ class BoardResponse(BoardBase):
     created_at: datetime
     updated_at: Optional[datetime]
     complete_percentage: float
+    task_count: int = Field(default=0)
+    todo_count: int = Field(default=0)
+    in_progress_count: int = Field(default=0)
+    done_count: int = Field(default=0)
     collaborators: List[UserResponse] = Field(default_factory=list)
 
 
@@ -68,7 +100,8 @@ class BoardPaginatedResponse(SQLModel):
     items: List[BoardResponse]
     offset: int = Field(default=0)
     limit: int = Field(default=100)
-    total: int = Field(default=0)
+    total: Optional[int] = Field(default=0)
+    next_cursor: Optional[str] = Field(default=None)
 
 
 class BoardCreate(BoardBase):
@@ -91,3 +124,16 @@ class BoardWithTasks(BoardResponse):
     """
 
     tasks: List["TaskForBoardResponse"] = Field(default_factory=list)
+
+
+class BoardChangesResponse(SQLModel):
+    """
+    Data model for the task changes of a board since a sync token.
+    Apply deleted before updated: SQLite may reuse the ID of a deleted
+    task for a new one.
+    """
+
+    updated: List[TaskResponse] = Field(default_factory=list)
+    deleted: List[int] = Field(default_factory=list)
+    next_token: str
+    has_more: bool = False
@@ -1,8 +1,10 @@
 import enum
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from sqlmodel import Column, Enum, Field, Relationship, SQLModel
+from sqlalchemy import case, func, literal_column
+from sqlalchemy.sql.expression import Grouping
+from sqlmodel import Column, Enum, Field, Index, Relationship, SQLModel
 
 from app.utils.datetime import get_current_utc_time
 
@@ -33,6 +35,54 @@ class TaskPriority(enum.Enum):
     HIGH = "HIGH"
 
 
+class TaskFileFormat(str, enum.Enum):
+    """
+    Enum for the file formats a board's tasks are exported to and imported from.
+    """
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class TaskSortField(str, enum.Enum):
+    """
+    Enum for the keys a board's task listing can be sorted by.
+    """
+
+    CREATED_AT = "created_at"
+    PRIORITY = "priority"
+    STATUS = "status"
+
+
+class SortOrder(str, enum.Enum):
+    """
+    Enum for sort directions.
+    """
+
+    ASC = "asc"
+    DESC = "desc"
+
+
+# Semantic order of the enum columns. They are stored by member name, so
+# sorting the raw columns would be alphabetical.
+STATUS_ORDER = (TaskStatus.TODO, TaskStatus.IN_PROGRESS, TaskStatus.DONE)
+PRIORITY_ORDER = (TaskPriority.LOW, TaskPriority.MEDIUM, TaskPriority.HIGH)
+
+
+def rank_expression(column: Any, members: tuple) -> Any:
+    """
+    SQL expression mapping an enum column to the position of its value in
+    `members`. Values are rendered inline, not bound, so queries match the
+    expression indexes built from the same expression.
+    """
+    return case(
+        *[
+            (column == literal_column(f"'{member.name}'"), literal_column(str(rank)))
+            for rank, member in enumerate(members)
+        ]
+    )
+
+
 class TaskBase(SQLModel):
     """
     Base model for a task.
@@ -52,18 +102,79 @@ class TaskBase(SQLModel):
 
 
 class Task(TaskBase, table=True):
+    # Full-text search lives outside the model: an FTS5 table kept in sync by
+    # triggers on SQLite, a generated search_vector column on Postgres.
+    __table_args__ = (
+        # Board detail filters tasks by status and priority.
+        Index("ix_task_board_id_status_priority", "board_id", "status", "priority"),
+        # Keyset pagination of a board's tasks by (created_at, id).
+        Index("ix_task_board_id_created_at_id", "board_id", "created_at", "id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str = Field(max_length=100)
     description: Optional[str] = Field(default=None, max_length=500)
     board: Optional["Board"] = Relationship(back_populates="tasks")
     board_id: Optional[int] = Field(default=None, foreign_key="board.id")
-    asigned_user_id: Optional[int] = Field(default=None, foreign_key="user.id")
+    asigned_user_id: Optional[int] = Field(
+        default=None, foreign_key="user.id", index=True
+    )
     asigned_to: Optional["User"] = Relationship(back_populates="tasks_assigned")
     created_at: datetime = Field(default_factory=get_current_utc_time)
     updated_at: Optional[datetime] = Field(
-        sa_column_kwargs={"on_update": get_current_utc_time}, default=None
+        sa_column_kwargs={"onupdate": get_current_utc_time}, default=None
+    )
+
+
+TASK_STATUS_RANK = rank_expression(Task.status, STATUS_ORDER)
+TASK_PRIORITY_RANK = rank_expression(Task.priority, PRIORITY_ORDER)
+# Keyset pagination of a board's tasks by (status rank, id) and
+# (priority rank, id).
+Index(
+    "ix_task_board_id_status_rank_id",
+    Task.board_id,
+    Grouping(TASK_STATUS_RANK),
+    Task.id,
+)
+Index(
+    "ix_task_board_id_priority_rank_id",
+    Task.board_id,
+    Grouping(TASK_PRIORITY_RANK),
+    Task.id,
+)
+
+# When a task last changed: new tasks have no updated_at yet.
+TASK_CHANGED_AT = func.coalesce(Task.updated_at, Task.created_at)
+# Delta sync of a board's tasks by (changed at, id).
+Index(
+    "ix_task_board_id_changed_at_id",
+    Task.board_id,
+    Grouping(TASK_CHANGED_AT),
+    Task.id,
+)
+
+
+class TaskTombstone(SQLModel, table=True):
+    """
+    Record of a deleted task, so clients syncing a board's changes
+    learn about deletes.
+    """
+
+    __table_args__ = (
+        # Delta sync of a board's deletes by (deleted_at, task_id).
+        Index(
+            "ix_tasktombstone_board_id_deleted_at_task_id",
+            "board_id",
+            "deleted_at",
+            "task_id",
+        ),
     )
 
+    id: Optional[int] = Field(default=None, primary_key=True)
+    task_id: int
+    board_id: int = Field(foreign_key="board.id")
+    deleted_at: datetime = Field(default_factory=get_current_utc_time)
+
 
 class TaskResponse(TaskBase):
     id: int
@@ -92,6 +203,112 @@ class TaskUpdate(SQLModel):
     priority: Optional[TaskPriority] = Field(default=None)
 
 
+class TaskPaginatedResponse(SQLModel):
+    """
+    Data model for a page of a board's tasks.
+    Pages are keyset based; pass next_cursor back to get the next page.
+    """
+
+    items: List[TaskResponse]
+    limit: int = Field(default=100)
+    next_cursor: Optional[str] = Field(default=None)
+
+
+class TaskSearchResult(TaskResponse):
+    """
+    Data model for a task matching a search, with its relevance score.
+    Higher scores rank first.
+    """
+
+    score: float
+
+
+class TaskSearchResponse(SQLModel):
+    """
+    Data model for a page of task search results, best matches first.
+    """
+
+    items: List[TaskSearchResult]
+    offset: int = Field(default=0)
+    limit: int = Field(default=20)
+    next_offset: Optional[int] = Field(default=None)
+
+
+class TaskBulkCreate(SQLModel):
+    """
+    Data model for creating many tasks in a board at once.
+    Items are validated one by one so errors can be reported per item.
+    """
+
+    tasks: List[Dict[str, Any]]
+
+
+class TaskBulkError(SQLModel):
+    """
+    Validation errors for one item of a bulk request, by its position.
+    """
+
+    index: int
+    errors: List[Dict[str, Any]]
+
+
+class TaskBulkCreateResponse(SQLModel):
+    """
+    Data model for the result of a bulk task creation.
+    """
+
+    created_ids: List[int] = Field(default_factory=list)
+    errors: List[TaskBulkError] = Field(default_factory=list)
+
+
+class TaskImportResponse(SQLModel):
+    """
+    Data model for the result of a task import.
+    Errors are reported by record number, up to a limit.
+    """
+
+    imported: int = 0
+    rejected: int = 0
+    batches: int = 0
+    errors: List[TaskBulkError] = Field(default_factory=list)
+
+
+class TaskBulkUpdateStatus(enum.Enum):
+    """
+    Enum for the outcome of one task in a bulk update.
+    """
+
+    UPDATED = "UPDATED"
+    NOT_FOUND = "NOT_FOUND"
+    FORBIDDEN = "FORBIDDEN"
+
+
+class TaskBulkUpdate(SQLModel):
+    """
+    Data model for applying the same changes to many tasks at once.
+    """
+
+    task_ids: List[int]
+    changes: TaskUpdate
+
+
+class TaskBulkUpdateResult(SQLModel):
+    """
+    Outcome of a bulk update for a single task ID.
+    """
+
+    id: int
+    result: TaskBulkUpdateStatus
+
+
+class TaskBulkUpdateResponse(SQLModel):
+    """
+    Data model for the per-task results of a bulk update.
+    """
+
+    results: List[TaskBulkUpdateResult] = Field(default_factory=list)
+
+
 class TaskForBoardResponse(TaskBase):
     """
     Data model for returning tasks associated with a board.
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, List, Optional, Union
 
 from pydantic import EmailStr
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Index, Relationship, SQLModel
 
 from app.domain.entities.task import Task
 from app.utils.datetime import get_current_utc_time
@@ -21,7 +21,7 @@ class UserBoardLink(SQLModel, table=True):
         default=None, foreign_key="user.id", primary_key=True
     )
     board_id: Optional[int] = Field(
-        default=None, foreign_key="board.id", primary_key=True
+        default=None, foreign_key="board.id", primary_key=True, index=True
     )
 
 
@@ -42,12 +42,18 @@ class User(UserBase, table=True):
     Inherits from UserBase and adds an ID field.
     """
 
+    __table_args__ = (
+        # Keyset pagination of users by (created_at, id).
+        Index("ix_user_created_at_id", "created_at", "id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
+    email: EmailStr = Field(max_length=100, nullable=False, unique=True, index=True)
     password: str = Field(max_length=128, nullable=False)
     is_active: bool = Field(default=True, nullable=False)
     created_at: datetime = Field(default_factory=get_current_utc_time)
     updated_at: Optional[datetime] = Field(
-        sa_column_kwargs={"on_update": get_current_utc_time},
+        sa_column_kwargs={"onupdate": get_current_utc_time},
         default=None,
     )
     boards_admin: List["Board"] = Relationship(
@@ -102,6 +108,7 @@ class UserPaginatedResponse(SQLModel):
     """
 
     items: List[UserResponse]
-    total: int = Field(default=0)
+    total: Optional[int] = Field(default=0)
     offset: int = Field(default=0)
     limit: int = Field(default=100)
+    next_cursor: Optional[str] = Field(default=None)
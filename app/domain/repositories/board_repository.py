@@ -1,24 +1,52 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 
 from app.domain.entities.board import Board, BoardCreate, BoardUpdate
+from app.utils.fields import FieldSelection
 
 
 class IBoardRepository(ABC):
 
     @abstractmethod
-    async def get_all(self, admin_id: Optional[int]) -> List["Board"]:
-        """Retrieve all boards."""
+    async def get_all(
+        self,
+        admin_id: Optional[int],
+        offset: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None,
+        include_total: bool = True,
+        fields: Optional[FieldSelection] = None,
+    ) -> Tuple[List["Board"], Optional[int]]:
+        """
+        Retrieve a page of boards, optionally after a (created_at, id) keyset,
+        and the admin's total board count (None when not requested).
+        """
 
     @abstractmethod
     async def get_by_id(
         self,
-        board_id: str,
+        board_id: int,
         admin_id: Optional[int],
         status: Optional[str] = None,
         priority: Optional[str] = None,
+        fields: Optional[FieldSelection] = None,
+        task_limit: Optional[int] = None,
     ) -> Optional["Board"]:
-        """Retrieve a board by its ID."""
+        """
+        Retrieve a board by its ID, loading only `fields` when given
+        and at most `task_limit` tasks.
+        """
+
+    @abstractmethod
+    async def get_version(
+        self, board_id: int, admin_id: Optional[int]
+    ) -> Optional[Tuple[int, datetime]]:
+        """Return the board's version and last modification time."""
+
+    @abstractmethod
+    async def is_admin(self, board_id: int, user_id: int) -> bool:
+        """Check whether a user administers a board, without loading it."""
 
     @abstractmethod
     async def create(self, board_data: BoardCreate, admin_id: Optional[int]) -> Board:
@@ -26,26 +54,26 @@ class IBoardRepository(ABC):
 
     @abstractmethod
     async def update(
-        self, board_id: str, board_data: BoardUpdate, admin_id: Optional[int]
+        self, board_id: int, board_data: BoardUpdate, admin_id: Optional[int]
     ) -> Optional[Board]:
         """Update an existing board."""
 
     @abstractmethod
-    async def delete(self, board_id: str, admin_id: Optional[int]) -> None:
+    async def delete(self, board_id: int, admin_id: Optional[int]) -> None:
         """Delete a board by its ID."""
 
     @abstractmethod
-    async def count(self) -> int:
-        """Count the total number of boards."""
-
-    @abstractmethod
-    async def add_collaborator(self, board_id: str, user_id: str) -> None:
+    async def add_collaborator(self, board_id: int, user_id: int) -> None:
         """Add a collaborator to a board."""
 
     @abstractmethod
-    async def remove_collaborator(self, board_id: str, user_id: str) -> None:
+    async def remove_collaborator(self, board_id: int, user_id: int) -> None:
         """Remove a collaborator from a board."""
 
     @abstractmethod
-    async def count_collaborators(self, board_id: str) -> int:
+    async def count_collaborators(self, board_id: int) -> int:
         """Count the number of collaborators on a board."""
+
+    @abstractmethod
+    async def repair_task_counters(self, board_ids: Optional[List[int]] = None) -> int:
+        """Recompute the denormalized task counters of boards."""
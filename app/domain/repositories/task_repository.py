@@ -1,7 +1,19 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
-from app.domain.entities.task import Task, TaskCreate, TaskUpdate
+from app.domain.entities.task import (
+    SortOrder,
+    Task,
+    TaskBulkUpdateStatus,
+    TaskCreate,
+    TaskPriority,
+    TaskSortField,
+    TaskStatus,
+    TaskTombstone,
+    TaskUpdate,
+)
+from app.utils.fields import FieldSelection
 
 
 class ITaskRepository(ABC):
@@ -11,21 +23,88 @@ class ITaskRepository(ABC):
     """
 
     @abstractmethod
-    async def create(self, board_id: str, task_data: TaskCreate) -> "Task":
+    async def create(self, board_id: int, task_data: TaskCreate) -> "Task":
         """
         Create a new task with the provided data.
         """
 
     @abstractmethod
-    async def get_by_id(self, task_id: str) -> Optional["Task"]:
+    async def create_many(self, board_id: int, tasks: List[TaskCreate]) -> List[int]:
         """
-        Retrieve a task by its ID.
+        Create many tasks in one multi-row insert and transaction.
+        Returns the IDs of the created tasks in input order.
+        """
+
+    @abstractmethod
+    async def import_batch(self, board_id: int, tasks: List[TaskCreate]) -> None:
+        """
+        Insert a batch of tasks into a board and commit it,
+        using the fastest bulk path the database offers.
+        """
+
+    @abstractmethod
+    async def get_by_id(
+        self, task_id: int, fields: Optional[FieldSelection] = None
+    ) -> Optional["Task"]:
+        """
+        Retrieve a task by its ID, loading only `fields` when given.
         Returns None if the task does not exist.
         """
 
+    @abstractmethod
+    async def list_by_board(
+        self,
+        board_id: int,
+        limit: int,
+        sort: TaskSortField = TaskSortField.CREATED_AT,
+        order: SortOrder = SortOrder.ASC,
+        after: Optional[Tuple[Any, int]] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        fields: Optional[FieldSelection] = None,
+    ) -> List["Task"]:
+        """
+        Retrieve a page of a board's tasks ordered by (sort key, id),
+        starting after the `after` keyset position when given.
+        """
+
+    @abstractmethod
+    async def list_changes(
+        self,
+        board_id: int,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> Tuple[List["Task"], List[TaskTombstone]]:
+        """
+        Retrieve up to `limit` of a board's tasks created or updated, and up
+        to `limit` tombstones of its deleted tasks, after the `after`
+        position, each ordered by (time of the change, task ID).
+        Tombstones are only read when `after` is given.
+        """
+
+    @abstractmethod
+    async def search(
+        self, user_id: int, terms: List[str], limit: int, offset: int = 0
+    ) -> List[Tuple["Task", float]]:
+        """
+        Full-text search the titles and descriptions of tasks on boards the
+        user administers or collaborates on. Every term must match; the last
+        one also matches as a prefix. Returns tasks with their relevance
+        score, best first.
+        """
+
+    @abstractmethod
+    def stream_by_board(
+        self, board_id: int, batch_size: int
+    ) -> AsyncIterator[List[Task]]:
+        """
+        Stream a board's tasks in ID order, `batch_size` rows at a time,
+        without loading the whole board into memory.
+        """
+
     @abstractmethod
     async def update(
-        self, task_id: str, task_data: TaskUpdate, admin_id: Optional[int]
+        self, task_id: int, task_data: TaskUpdate, admin_id: Optional[int]
     ) -> Optional["Task"]:
         """
         Update an existing task with the provided data.
@@ -33,14 +112,23 @@ class ITaskRepository(ABC):
         """
 
     @abstractmethod
-    async def delete(self, task_id: str, admin_id: Optional[int]) -> None:
+    async def update_many(
+        self, task_ids: List[int], task_data: TaskUpdate, admin_id: Optional[int]
+    ) -> Dict[int, TaskBulkUpdateStatus]:
+        """
+        Apply the same changes to every task the admin may update,
+        with a single set-based UPDATE. Returns the outcome per task ID.
+        """
+
+    @abstractmethod
+    async def delete(self, task_id: int, admin_id: Optional[int]) -> None:
         """
         Delete a task by its ID.
         Raises an exception if the task does not exist.
         """
 
     @abstractmethod
-    async def assign_task(self, task: Task, user_id: str) -> None:
+    async def assign_task(self, task: Task, user_id: int) -> None:
         """
         Assign a task to a user.
         Raises an exception if the task does not exist or if the user does not have permission.
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime
+from typing import Optional, Tuple
 
 from app.domain.entities.user import User
 
@@ -15,19 +16,22 @@ class IUserRepository(ABC):
         """
 
     @abstractmethod
-    async def get_by_id(self, user_id: str) -> Optional["User"]:
+    async def get_by_id(self, user_id: int) -> Optional["User"]:
         """
         Retrieve a user by their ID.
         Returns None if the user does not exist.
         """
 
     @abstractmethod
-    async def get_all(self) -> list["User"]:
+    async def get_all(
+        self,
+        offset: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None,
+        include_total: bool = True,
+    ) -> Tuple[list["User"], Optional[int]]:
         """
-        Retrieve all users.
-        Returns an empty list if no users exist.
+        Retrieve a page of users ordered by (created_at, id).
+        When `after` is given, only users past that keyset are returned.
+        Also returns the total user count, or None when not requested.
         """
-
-    @abstractmethod
-    async def count(self) -> int:
-        """Count the total number of boards."""
@@ -1,33 +1,49 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.application.services.auth_service import AuthService
 from app.application.services.board_service import BoardService
 from app.application.services.task_service import TaskService
 from app.application.services.user_service import UserService
 from app.core.database import get_db
+from app.core.settings import settings
+from app.domain.entities.user import User
 from app.infrastructure.repositories.auth_repository import AuthRepository
-from app.infrastructure.repositories.board_repository import BoardRepository
+from app.infrastructure.repositories.board_repository import (
+    BoardRepository,
+    board_cache,
+)
 from app.infrastructure.repositories.task_repository import TaskRepository
-from app.infrastructure.repositories.user_repository import UserRepository
+from app.infrastructure.repositories.user_repository import (
+    UserRepository,
+    user_cache,
+)
 from app.utils.auth import verify_access_token
+from app.utils.response_cache import ResponseCache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
 async def get_board_service(
-    db_session: Annotated[Session, Depends(get_db)],
+    db_session: Annotated[AsyncSession, Depends(get_db)],
 ) -> BoardService:
     order_repository = BoardRepository(db_session)
     user_repository = UserRepository(db_session)
     return BoardService(order_repository, user_repository)
 
 
+def get_board_cache() -> Optional[ResponseCache]:
+    """
+    The board detail response cache, or None when it is disabled.
+    """
+    return board_cache
+
+
 async def get_task_service(
-    db_session: Annotated[Session, Depends(get_db)],
+    db_session: Annotated[AsyncSession, Depends(get_db)],
 ) -> "TaskService":
     task_repository = TaskRepository(db_session)
     board_repository = BoardRepository(db_session)
@@ -36,7 +52,7 @@ async def get_task_service(
 
 
 async def get_auth_service(
-    db_session: Annotated[Session, Depends(get_db)],
+    db_session: Annotated[AsyncSession, Depends(get_db)],
 ) -> "AuthService":
 
     auth_repository = AuthRepository(db_session)
@@ -58,8 +74,32 @@ async def get_current_user_email(
     return email
 
 
+async def get_current_user(
+    email: Annotated[str, Depends(get_current_user_email)],
+    db_session: Annotated[AsyncSession, Depends(get_db)],
+) -> User:
+    """
+    Resolve the authenticated user once per request.
+    Active users are served from the identity cache when it is enabled.
+    """
+    user = user_cache.get(email) if settings.user_cache_enabled else None
+    if user is None:
+        user = await UserRepository(db_session).get_user_by_email(email)
+        if not user or not user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Could not validate credentials",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        if settings.user_cache_enabled:
+            # Detach it so the cached instance outlives this request's session.
+            db_session.expunge(user)
+            user_cache.set(email, user)
+    return user
+
+
 async def get_user_service(
-    db_session: Annotated[Session, Depends(get_db)],
+    db_session: Annotated[AsyncSession, Depends(get_db)],
 ) -> "UserService":
     user_repository = UserRepository(db_session)
     return UserService(user_repository)
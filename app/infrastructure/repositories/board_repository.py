@@ -1,72 +1,250 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 
-from sqlalchemy.orm import selectinload
-from sqlmodel import Session, func, select
+from sqlalchemy.orm import load_only, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel import delete, func, select, tuple_, update
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.domain.entities.board import Board, BoardCreate, BoardUpdate, UserBoardLink
-from app.domain.entities.task import TaskPriority, TaskStatus
+from app.core.settings import settings
+from app.domain.entities.board import (
+    STATUS_COUNTERS,
+    Board,
+    BoardCreate,
+    BoardUpdate,
+    UserBoardLink,
+)
+from app.domain.entities.task import Task, TaskPriority, TaskStatus, TaskTombstone
+from app.domain.entities.user import User
 from app.domain.repositories.board_repository import IBoardRepository
+from app.utils.fields import (
+    FieldSelection,
+    load_columns,
+    nested_selection,
+    selected_names,
+)
+from app.utils.response_cache import create_response_cache
+
+# Serialized board detail responses, dropped after every committed board write.
+board_cache = create_response_cache(
+    settings.board_cache_backend,
+    max_size=settings.board_cache_max_size,
+    ttl_seconds=settings.board_cache_ttl_seconds,
+    max_variants=settings.board_cache_max_variants,
+    redis_url=settings.redis_url,
+)
+
+
+# Board columns loaded whatever fields are requested: identity,
+# authorization, pagination keys and cache validators.
+BOARD_KEY_COLUMNS = ("id", "admin_id", "version", "created_at", "updated_at")
+# Response fields computed from other columns.
+BOARD_DERIVED_COLUMNS = {"complete_percentage": ("done_count", "task_count")}
+
+
+def _board_columns(fields: FieldSelection) -> List:
+    names = []
+    for name in selected_names(fields):
+        names.extend(BOARD_DERIVED_COLUMNS.get(name, (name,)))
+    return load_columns(Board, names, always=BOARD_KEY_COLUMNS)
+
+
+def _narrowed_columns(entity, selection: FieldSelection) -> List:
+    return load_columns(entity, selected_names(selection), always=("id",))
+
+
+def _relation_loader(name: str, relationship, entity, fields: Optional[FieldSelection]):
+    """
+    Eager loader for a board relationship narrowed to the selected fields,
+    or None when the relationship is not selected at all.
+    """
+    selection = nested_selection(fields, name)
+    if selection is False:
+        return None
+    loader = selectinload(relationship)
+    if selection is not None:
+        loader = loader.load_only(*_narrowed_columns(entity, selection))
+    return loader
+
+
+def _board_options(fields: Optional[FieldSelection], tasks=None) -> List:
+    """
+    Loader options for board responses with the given sparse fieldset.
+    `tasks` is the (possibly filtered) relationship to load tasks through,
+    or None for responses without tasks.
+    """
+    options = [] if fields is None else [load_only(*_board_columns(fields))]
+    loaders = [_relation_loader("collaborators", Board.collaborators, User, fields)]
+    if tasks is not None:
+        loaders.append(_relation_loader("tasks", tasks, Task, fields))
+    return options + [loader for loader in loaders if loader is not None]
+
+
+def board_cache_group(board_id: int) -> str:
+    return f"board:{board_id}"
+
+
+async def invalidate_cached_boards(*board_ids: int) -> None:
+    """
+    Drop the cached detail responses of the given boards.
+    Call after the write has committed, so a reload sees the new data.
+    """
+    if board_cache is None:
+        return
+    for board_id in board_ids:
+        await board_cache.invalidate(board_cache_group(board_id))
 
 
 class BoardRepository(IBoardRepository):
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: AsyncSession):
         self.db_session = db_session
 
-    async def get_all(
-        self, admin_id: Optional[int], offset: int = 0, limit: int = 100
-    ) -> List["Board"]:
+    async def _get_with_relations(self, board_id: int) -> "Board":
         """
-        Retrieve all boards.
+        Reload a board with the relationships its responses read.
+        Async sessions cannot lazy load, so they are fetched eagerly;
+        BoardResponse has no tasks, so they are not loaded at all.
         """
         statement = (
-            select(Board).where(Board.admin_id == admin_id).offset(offset).limit(limit)
+            select(Board)
+            .options(selectinload(Board.collaborators))
+            .where(Board.id == board_id)
+            .execution_options(populate_existing=True)
         )
-        boards = self.db_session.exec(statement).all()
-        return boards
+        return (await self.db_session.exec(statement)).one()
 
-    async def count(self) -> int:
+    async def _bump_version(self, board_id: int) -> None:
         """
-        Count the total number of boards.
+        Mark the board as changed so cached representations are revalidated.
         """
-        statement = select(func.count(Board.id))
-        return self.db_session.scalar(statement)
+        await self.db_session.exec(
+            update(Board).where(Board.id == board_id).values(version=Board.version + 1)
+        )
+
+    async def get_all(
+        self,
+        admin_id: Optional[int],
+        offset: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None,
+        include_total: bool = True,
+        fields: Optional[FieldSelection] = None,
+    ) -> Tuple[List["Board"], Optional[int]]:
+        """
+        Retrieve a page of the admin's boards ordered by (created_at, id),
+        together with the admin's total board count in the same statement.
+        When `after` is given, keyset pagination is used and offset is ignored.
+        Tasks are not loaded; progress comes from the board's task counters.
+        `fields` limits the columns loaded to a sparse fieldset.
+        """
+        count_statement = select(func.count(Board.id)).where(Board.admin_id == admin_id)
+        columns = [Board]
+        if include_total:
+            columns.append(count_statement.scalar_subquery().label("total"))
+        statement = (
+            select(*columns)
+            .options(*_board_options(fields))
+            .where(Board.admin_id == admin_id)
+            .order_by(Board.created_at, Board.id)
+            .limit(limit)
+        )
+        if after:
+            statement = statement.where(tuple_(Board.created_at, Board.id) > after)
+        else:
+            statement = statement.offset(offset)
+        rows = (await self.db_session.exec(statement)).all()
+
+        if not include_total:
+            return rows, None
+        if rows:
+            return [board for board, _ in rows], rows[0][1]
+        # An empty page past the end carries no total column to read.
+        total = await self.db_session.scalar(count_statement) if offset or after else 0
+        return [], total
 
     async def get_by_id(
         self,
-        board_id: str,
+        board_id: int,
         admin_id: Optional[int],
         status: Optional[str] = None,
         priority: Optional[str] = None,
+        fields: Optional[FieldSelection] = None,
+        task_limit: Optional[int] = None,
     ) -> Optional["Board"]:
         """
         Retrieve a board by its ID.
+        Task filters are applied by the database while loading `tasks`,
+        and `fields` limits the columns loaded to a sparse fieldset.
+        `task_limit` caps `tasks` to the oldest tasks matching the filters.
         """
-        statement = (
-            select(Board)
-            .options(selectinload(Board.tasks))
-            .where(Board.id == board_id, Board.admin_id == admin_id)
-        )
-
-        board = self.db_session.exec(statement).first()
-        if not board:
-            raise ValueError(f"Board with ID {board_id} not found.")
-
+        task_filters = []
         if status:
             try:
-                status_enum = TaskStatus(status)  # Asegúrate de convertir al Enum
+                task_filters.append(Task.status == TaskStatus(status))
             except ValueError:
                 raise ValueError(f"Invalid status: {status}")
-            board.tasks = [t for t in board.tasks if t.status == status_enum]
         if priority:
             try:
-                priority_enum = TaskPriority(priority)  # Asegúrate de convertir al Enum
+                task_filters.append(Task.priority == TaskPriority(priority))
             except ValueError:
                 raise ValueError(f"Invalid priority: {priority}")
-            board.tasks = [t for t in board.tasks if t.priority == priority_enum]
+
+        tasks = Board.tasks.and_(*task_filters) if task_filters else Board.tasks
+        tasks_fields = nested_selection(fields, "tasks")
+        capped = task_limit is not None and tasks_fields is not False
+        statement = (
+            select(Board)
+            .options(*_board_options(fields, tasks=None if capped else tasks))
+            .where(Board.id == board_id, Board.admin_id == admin_id)
+            # A board already in the session must not keep a differently
+            # filtered task list.
+            .execution_options(populate_existing=True)
+        )
+
+        board = (await self.db_session.exec(statement)).first()
+        if not board:
+            raise ValueError(f"Board with ID {board_id} not found.")
+
+        if capped:
+            # selectinload cannot limit per parent, so a capped list is
+            # loaded on its own, in the order of the task listing.
+            task_statement = (
+                select(Task)
+                .where(Task.board_id == board.id, *task_filters)
+                .order_by(Task.created_at, Task.id)
+                .limit(task_limit)
+            )
+            if tasks_fields is not None:
+                task_statement = task_statement.options(
+                    load_only(*_narrowed_columns(Task, tasks_fields))
+                )
+            tasks = (await self.db_session.exec(task_statement)).all()
+            set_committed_value(board, "tasks", list(tasks))
 
         return board
 
+    async def get_version(
+        self, board_id: int, admin_id: Optional[int]
+    ) -> Optional[Tuple[int, datetime]]:
+        """
+        Return the board's version and last modification time,
+        reading only the board row.
+        """
+        statement = select(
+            Board.version, func.coalesce(Board.updated_at, Board.created_at)
+        ).where(Board.id == board_id, Board.admin_id == admin_id)
+        return (await self.db_session.exec(statement)).first()
+
+    async def is_admin(self, board_id: int, user_id: int) -> bool:
+        """
+        Check whether a user administers a board, without loading it.
+        """
+        statement = select(Board.id).where(
+            Board.id == board_id, Board.admin_id == user_id
+        )
+        return (await self.db_session.exec(statement)).first() is not None
+
     async def create(self, board_data: BoardCreate, admin_id: Optional[int]) -> "Board":
         """
         Create a new board.
@@ -75,12 +253,11 @@ class BoardRepository(IBoardRepository):
         board_dict["admin_id"] = admin_id
         board = Board(**board_dict)
         self.db_session.add(board)
-        self.db_session.commit()
-        self.db_session.refresh(board)
-        return board
+        await self.db_session.commit()
+        return await self._get_with_relations(board.id)
 
     async def update(
-        self, board_id: str, board_data: BoardUpdate, admin_id: Optional[int]
+        self, board_id: int, board_data: BoardUpdate, admin_id: Optional[int]
     ) -> Optional["Board"]:
         """
         Update an existing board.
@@ -88,57 +265,99 @@ class BoardRepository(IBoardRepository):
         statement = select(Board).where(
             Board.id == board_id, Board.admin_id == admin_id
         )
-        existing_board = self.db_session.exec(statement).first()
+        existing_board = (await self.db_session.exec(statement)).first()
 
         if not existing_board:
             raise ValueError(f"Board with ID {board_id} not found.")
 
         board = board_data.model_dump(exclude_unset=True)
         existing_board.sqlmodel_update(board)
+        existing_board.version = Board.version + 1
         self.db_session.add(existing_board)
-        self.db_session.commit()
-        self.db_session.refresh(existing_board)
-        return existing_board
+        await self.db_session.commit()
+        await invalidate_cached_boards(board_id)
+        return await self._get_with_relations(existing_board.id)
 
-    async def delete(self, board_id: str, admin_id: Optional[int]) -> None:
+    async def delete(self, board_id: int, admin_id: Optional[int]) -> None:
         """
         Delete a board by its ID.
         """
-        statement = select(Board).where(
-            Board.id == board_id, Board.admin_id == admin_id
+        statement = (
+            select(Board)
+            .options(selectinload(Board.tasks), selectinload(Board.collaborators))
+            .where(Board.id == board_id, Board.admin_id == admin_id)
         )
-        existing_board = self.db_session.exec(statement).first()
+        existing_board = (await self.db_session.exec(statement)).first()
 
         if not existing_board:
             raise ValueError(f"Board with ID {board_id} not found.")
 
-        self.db_session.delete(existing_board)
-        self.db_session.commit()
+        # Nobody can sync a deleted board, so its tombstones go with it.
+        await self.db_session.exec(
+            delete(TaskTombstone).where(TaskTombstone.board_id == board_id)
+        )
+        await self.db_session.delete(existing_board)
+        await self.db_session.commit()
+        await invalidate_cached_boards(board_id)
 
-    async def add_collaborator(self, board_id: str, user_id: str) -> None:
+    async def add_collaborator(self, board_id: int, user_id: int) -> None:
         """
         Add a collaborator to a board.
         """
         link = UserBoardLink(board_id=board_id, user_id=user_id)
         self.db_session.add(link)
-        self.db_session.commit()
+        await self._bump_version(board_id)
+        await self.db_session.commit()
+        await invalidate_cached_boards(board_id)
 
-    async def remove_collaborator(self, board_id: str, user_id: str) -> None:
+    async def remove_collaborator(self, board_id: int, user_id: int) -> None:
         """
         Remove a collaborator from a board.
         """
         statement = select(UserBoardLink).where(
             UserBoardLink.board_id == board_id, UserBoardLink.user_id == user_id
         )
-        link = self.db_session.exec(statement).first()
+        link = (await self.db_session.exec(statement)).first()
 
         if link:
-            self.db_session.delete(link)
-            self.db_session.commit()
+            await self.db_session.delete(link)
+            await self._bump_version(board_id)
+            await self.db_session.commit()
+            await invalidate_cached_boards(board_id)
 
-    async def count_collaborators(self, board_id: str) -> int:
+    async def count_collaborators(self, board_id: int) -> int:
         """
         Count the number of collaborators on a board.
         """
-        board = self.db_session.get(Board, board_id)
-        return len(board.collaborators) if board else 0
+        statement = select(func.count()).where(UserBoardLink.board_id == board_id)
+        return await self.db_session.scalar(statement)
+
+    async def repair_task_counters(self, board_ids: Optional[List[int]] = None) -> int:
+        """
+        Recompute the denormalized task counters from the task table.
+        Repairs every board unless `board_ids` is given; returns rows updated.
+        """
+
+        def count_tasks(*criteria):
+            return (
+                select(func.count(Task.id))
+                .where(Task.board_id == Board.id, *criteria)
+                .scalar_subquery()
+            )
+
+        values = {"task_count": count_tasks(), "version": Board.version + 1}
+        for task_status, column in STATUS_COUNTERS.items():
+            values[column] = count_tasks(Task.status == task_status)
+
+        statement = update(Board).values(**values)
+        if board_ids is not None:
+            statement = statement.where(Board.id.in_(board_ids))
+        result = await self.db_session.exec(
+            statement.execution_options(synchronize_session=False)
+        )
+        await self.db_session.commit()
+        if board_ids is not None:
+            await invalidate_cached_boards(*board_ids)
+        elif board_cache is not None:
+            await board_cache.clear()
+        return result.rowcount
@@ -1,32 +1,324 @@
-from typing import Optional
+import enum
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
 
-from sqlmodel import Session
+from sqlalchemy import literal_column, table, union
+from sqlalchemy.orm import load_only, selectinload
+from sqlmodel import func, insert, or_, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.domain.entities.task import Task, TaskCreate, TaskUpdate
+from app.domain.entities.board import STATUS_COUNTERS, Board, UserBoardLink
+from app.domain.entities.task import (
+    TASK_CHANGED_AT,
+    TASK_PRIORITY_RANK,
+    TASK_STATUS_RANK,
+    SortOrder,
+    Task,
+    TaskBulkUpdateStatus,
+    TaskCreate,
+    TaskPriority,
+    TaskSortField,
+    TaskStatus,
+    TaskTombstone,
+    TaskUpdate,
+)
 from app.domain.repositories.task_repository import ITaskRepository
+from app.infrastructure.repositories.board_repository import invalidate_cached_boards
+from app.utils.datetime import get_current_utc_time
+from app.utils.fields import FieldSelection, load_columns, selected_names
+
+# Task columns loaded whatever fields are requested: identity, the board
+# used for authorization and cache validators.
+TASK_KEY_COLUMNS = ("id", "board_id", "created_at", "updated_at")
+
+# Sort keys of the board task listing; each has a (board_id, key, id) index.
+TASK_SORT_KEYS = {
+    TaskSortField.CREATED_AT: Task.created_at,
+    TaskSortField.STATUS: TASK_STATUS_RANK,
+    TaskSortField.PRIORITY: TASK_PRIORITY_RANK,
+}
+
+# Text search configuration of the search_vector column on Postgres: no
+# stemming or stop words, like the unicode61 tokenizer of task_fts on SQLite.
+TASK_SEARCH_CONFIG = "simple"
+
+# bm25 weights of the task_fts columns, in column order. They mirror the
+# Postgres ranking, where titles weigh 1.0 and descriptions 0.4.
+TASK_SEARCH_WEIGHTS = {"title": 2.5, "description": 1.0}
+
+
+def _fts5_query(terms: List[str]) -> str:
+    # Quoting keeps every term a literal string rather than FTS5 syntax.
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def _tsquery(terms: List[str]) -> str:
+    return " & ".join(terms) + ":*"
+
+
+def _copy_value(value: Any) -> Any:
+    # COPY bypasses SQLAlchemy's Enum type, which stores member names.
+    return value.name if isinstance(value, enum.Enum) else value
+
+
+def _insert_rows(board_id: int, tasks: List[TaskCreate]) -> List[Dict[str, Any]]:
+    # Plain dicts: building a Task instance per row costs more than the INSERT.
+    # Column defaults are filled in here, as the ORM does for single creates,
+    # because render_nulls would send a null status or priority as NULL.
+    created_at = get_current_utc_time()
+    return [
+        {
+            **task_data.model_dump(),
+            "status": task_data.status or TaskStatus.TODO,
+            "priority": task_data.priority or TaskPriority.MEDIUM,
+            "board_id": board_id,
+            "asigned_user_id": None,
+            "created_at": created_at,
+            "updated_at": None,
+        }
+        for task_data in tasks
+    ]
 
 
 class TaskRepository(ITaskRepository):
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: AsyncSession):
         self.db_session = db_session
+        self._touched_boards: Set[int] = set()
+
+    async def _commit(self) -> None:
+        """
+        Commit, then drop the cached responses of every board touched.
+        """
+        await self.db_session.commit()
+        touched, self._touched_boards = self._touched_boards, set()
+        await invalidate_cached_boards(*touched)
+
+    async def _touch_board(
+        self, board_id: int, deltas: Optional[Dict[TaskStatus, int]] = None
+    ) -> None:
+        """
+        Record a change to the board's tasks: bump its version and shift
+        its task counters by per-status deltas.
+        Runs in the caller's transaction, before commit.
+        """
+        self._touched_boards.add(board_id)
+        values = {"version": Board.version + 1}
+        deltas = deltas or {}
+        total_delta = sum(deltas.values())
+        if total_delta:
+            values["task_count"] = Board.task_count + total_delta
+        for task_status, delta in deltas.items():
+            if delta:
+                column = STATUS_COUNTERS[task_status]
+                values[column] = getattr(Board, column) + delta
+        await self.db_session.exec(
+            update(Board).where(Board.id == board_id).values(**values)
+        )
 
-    async def create(self, board_id: str, task_data: TaskCreate) -> Task:
+    async def create(self, board_id: int, task_data: TaskCreate) -> Task:
         task_dict = task_data.model_dump()
         task_dict["board_id"] = board_id
         task = Task(**task_dict)
         self.db_session.add(task)
-        self.db_session.commit()
-        self.db_session.refresh(task)
+        await self.db_session.flush()
+        await self._touch_board(board_id, {task.status: 1})
+        await self._commit()
+        await self.db_session.refresh(task)
         return task
 
-    async def get_by_id(self, task_id: str) -> Optional[Task]:
-        task = self.db_session.get(Task, task_id)
+    async def create_many(self, board_id: int, tasks: List[TaskCreate]) -> List[int]:
+        if not tasks:
+            return []
+        rows = _insert_rows(board_id, tasks)
+        # render_nulls keeps rows with and without optional values in one batch.
+        statement = insert(Task).returning(Task.id).execution_options(render_nulls=True)
+        result = await self.db_session.exec(statement, params=rows)
+        # The database assigns IDs in VALUES order, so sorting restores input order.
+        created_ids = sorted(result.scalars().all())
+        await self._touch_board(board_id, Counter(row["status"] for row in rows))
+        await self._commit()
+        return created_ids
+
+    async def import_batch(self, board_id: int, tasks: List[TaskCreate]) -> None:
+        if not tasks:
+            return
+        rows = _insert_rows(board_id, tasks)
+        connection = await self.db_session.connection()
+        if connection.dialect.driver == "asyncpg":
+            raw_connection = await connection.get_raw_connection()
+            columns = list(rows[0])
+            await raw_connection.driver_connection.copy_records_to_table(
+                Task.__tablename__,
+                records=[
+                    tuple(_copy_value(row[column]) for column in columns)
+                    for row in rows
+                ],
+                columns=columns,
+            )
+        else:
+            await self.db_session.exec(
+                insert(Task).execution_options(render_nulls=True), params=rows
+            )
+        await self._touch_board(board_id, Counter(row["status"] for row in rows))
+        await self._commit()
+
+    async def get_by_id(
+        self, task_id: int, fields: Optional[FieldSelection] = None
+    ) -> Optional[Task]:
+        if fields is None:
+            options = [selectinload(Task.board).selectinload(Board.collaborators)]
+        else:
+            # A sparse read only needs the board's admin for authorization.
+            options = [
+                load_only(
+                    *load_columns(Task, selected_names(fields), always=TASK_KEY_COLUMNS)
+                ),
+                selectinload(Task.board).load_only(Board.id, Board.admin_id),
+            ]
+        task = await self.db_session.get(Task, task_id, options=options)
         return task
 
+    async def list_by_board(
+        self,
+        board_id: int,
+        limit: int,
+        sort: TaskSortField = TaskSortField.CREATED_AT,
+        order: SortOrder = SortOrder.ASC,
+        after: Optional[Tuple[Any, int]] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        fields: Optional[FieldSelection] = None,
+    ) -> List[Task]:
+        key = TASK_SORT_KEYS[sort]
+        descending = order is SortOrder.DESC
+        statement = select(Task).where(Task.board_id == board_id)
+        if status:
+            statement = statement.where(Task.status == status)
+        if priority:
+            statement = statement.where(Task.priority == priority)
+        if after:
+            # The redundant bound on the key alone gives the planner an
+            # index range to seek to; the OR settles ties on id.
+            key_value, task_id = after
+            if descending:
+                statement = statement.where(
+                    key <= key_value, or_(key < key_value, Task.id < task_id)
+                )
+            else:
+                statement = statement.where(
+                    key >= key_value, or_(key > key_value, Task.id > task_id)
+                )
+        if fields is not None:
+            statement = statement.options(
+                load_only(
+                    *load_columns(
+                        Task, selected_names(fields), always=("id", sort.value)
+                    )
+                )
+            )
+        ordering = (key.desc(), Task.id.desc()) if descending else (key, Task.id)
+        statement = statement.order_by(*ordering).limit(limit)
+        return list((await self.db_session.exec(statement)).all())
+
+    async def search(
+        self, user_id: int, terms: List[str], limit: int, offset: int = 0
+    ) -> List[Tuple[Task, float]]:
+        accessible_boards = union(
+            select(Board.id).where(Board.admin_id == user_id),
+            select(UserBoardLink.board_id).where(UserBoardLink.user_id == user_id),
+        )
+        connection = await self.db_session.connection()
+        if connection.dialect.name == "sqlite":
+            # bm25 is lower for better matches; negated so higher ranks first.
+            score = -func.bm25(
+                literal_column("task_fts"), *TASK_SEARCH_WEIGHTS.values()
+            )
+            statement = (
+                select(Task, score.label("score"))
+                .select_from(table("task_fts"))
+                .join(Task, Task.id == literal_column("task_fts.rowid"))
+                .where(literal_column("task_fts").match(_fts5_query(terms)))
+            )
+        else:
+            query = func.to_tsquery(TASK_SEARCH_CONFIG, _tsquery(terms))
+            search_vector = literal_column("task.search_vector")
+            score = func.ts_rank(search_vector, query)
+            statement = select(Task, score.label("score")).where(
+                search_vector.op("@@")(query)
+            )
+        statement = (
+            statement.where(Task.board_id.in_(accessible_boards))
+            .order_by(score.desc(), Task.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        rows = (await self.db_session.exec(statement)).all()
+        return [(task, float(task_score)) for task, task_score in rows]
+
+    async def list_changes(
+        self,
+        board_id: int,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> Tuple[List[Task], List[TaskTombstone]]:
+        task_statement = select(Task).where(Task.board_id == board_id)
+        if after:
+            # Same redundant bound as list_by_board, for an index range seek.
+            changed_at, task_id = after
+            task_statement = task_statement.where(
+                TASK_CHANGED_AT >= changed_at,
+                or_(TASK_CHANGED_AT > changed_at, Task.id > task_id),
+            )
+        task_statement = task_statement.order_by(TASK_CHANGED_AT, Task.id).limit(limit)
+        tasks = list((await self.db_session.exec(task_statement)).all())
+
+        # Without a position the client has no tasks, so deletes are moot.
+        if not after:
+            return tasks, []
+        changed_at, task_id = after
+        tombstone_statement = (
+            select(TaskTombstone)
+            .where(
+                TaskTombstone.board_id == board_id,
+                TaskTombstone.deleted_at >= changed_at,
+                or_(
+                    TaskTombstone.deleted_at > changed_at,
+                    TaskTombstone.task_id > task_id,
+                ),
+            )
+            .order_by(TaskTombstone.deleted_at, TaskTombstone.task_id)
+            .limit(limit)
+        )
+        tombstones = list((await self.db_session.exec(tombstone_statement)).all())
+        return tasks, tombstones
+
+    async def stream_by_board(
+        self, board_id: int, batch_size: int
+    ) -> AsyncIterator[List[Task]]:
+        statement = (
+            select(Task)
+            .where(Task.board_id == board_id)
+            .order_by(Task.id)
+            .execution_options(yield_per=batch_size)
+        )
+        try:
+            result = await self.db_session.stream_scalars(statement)
+            async for tasks in result.partitions():
+                yield tasks
+        finally:
+            # Streaming responses outlive the request's session scope, so the
+            # connection is released here rather than by get_db.
+            await self.db_session.close()
+
     async def update(
-        self, task_id: str, task_data: TaskUpdate, admin_id: Optional[int]
+        self, task_id: int, task_data: TaskUpdate, admin_id: Optional[int]
     ) -> Optional[Task]:
-        existing_task = self.db_session.get(Task, task_id)
+        existing_task = await self.db_session.get(
+            Task, task_id, options=[selectinload(Task.board)]
+        )
 
         if not existing_task:
             raise ValueError(f"Task with ID {task_id} not found.")
@@ -34,30 +326,87 @@ class TaskRepository(ITaskRepository):
         if existing_task.board.admin_id != admin_id:
             raise ValueError("User does not have permission to update this task.")
 
+        previous_status = existing_task.status
         task = task_data.model_dump(exclude_unset=True)
         existing_task.sqlmodel_update(task)
         self.db_session.add(existing_task)
-        self.db_session.commit()
-        self.db_session.refresh(existing_task)
+        deltas = (
+            {existing_task.status: 1, previous_status: -1}
+            if existing_task.status != previous_status
+            else None
+        )
+        await self._touch_board(existing_task.board_id, deltas)
+        await self._commit()
+        await self.db_session.refresh(existing_task)
         return existing_task
 
-    async def delete(self, task_id: str, admin_id: Optional[int]) -> None:
-        task = self.db_session.get(Task, task_id)
+    async def update_many(
+        self, task_ids: List[int], task_data: TaskUpdate, admin_id: Optional[int]
+    ) -> Dict[int, TaskBulkUpdateStatus]:
+        # Authorize every task with one joined query.
+        statement = (
+            select(Task.id, Task.board_id, Task.status, Board.admin_id)
+            .join(Board, Task.board_id == Board.id, isouter=True)
+            .where(Task.id.in_(task_ids))
+        )
+        rows = (await self.db_session.exec(statement)).all()
+
+        results = {task_id: TaskBulkUpdateStatus.NOT_FOUND for task_id in task_ids}
+        allowed = []
+        for task_id, board_id, task_status, board_admin_id in rows:
+            if board_admin_id is None or board_admin_id != admin_id:
+                results[task_id] = TaskBulkUpdateStatus.FORBIDDEN
+            else:
+                results[task_id] = TaskBulkUpdateStatus.UPDATED
+                allowed.append((task_id, board_id, task_status))
+        if not allowed:
+            return results
+
+        changes = task_data.model_dump(exclude_unset=True)
+        await self.db_session.exec(
+            update(Task)
+            .where(Task.id.in_([task_id for task_id, _, _ in allowed]))
+            .values(**changes)
+            .execution_options(synchronize_session=False)
+        )
+
+        new_status = changes.get("status")
+        deltas_by_board: Dict[int, Counter] = defaultdict(Counter)
+        for _, board_id, task_status in allowed:
+            deltas = deltas_by_board[board_id]
+            if new_status is not None:
+                deltas[new_status] += 1
+                deltas[task_status] -= 1
+        for board_id, deltas in deltas_by_board.items():
+            await self._touch_board(board_id, deltas)
+
+        await self._commit()
+        return results
+
+    async def delete(self, task_id: int, admin_id: Optional[int]) -> None:
+        task = await self.db_session.get(
+            Task, task_id, options=[selectinload(Task.board)]
+        )
         if not task:
             raise ValueError(f"Task with ID {task_id} not found.")
         if task.board.admin_id != admin_id:
             raise ValueError("User does not have permission to delete this task.")
-        self.db_session.delete(task)
-        self.db_session.commit()
+        await self.db_session.delete(task)
+        # Tells clients syncing the board's changes that the task is gone.
+        self.db_session.add(TaskTombstone(task_id=task.id, board_id=task.board_id))
+        await self._touch_board(task.board_id, {task.status: -1})
+        await self._commit()
 
-    async def assign_task(self, task: Task, user_id: str) -> None:
-        task.asigned_user_id = int(user_id)
+    async def assign_task(self, task: Task, user_id: int) -> None:
+        task.asigned_user_id = user_id
         self.db_session.add(task)
-        self.db_session.commit()
-        self.db_session.refresh(task)
+        await self._touch_board(task.board_id)
+        await self._commit()
+        await self.db_session.refresh(task)
 
     async def unassign_task(self, task: Task) -> None:
         task.asigned_user_id = None
         self.db_session.add(task)
-        self.db_session.commit()
-        self.db_session.refresh(task)
+        await self._touch_board(task.board_id)
+        await self._commit()
+        await self.db_session.refresh(task)
@@ -1,32 +1,93 @@
-from typing import Optional
+from datetime import datetime
+from typing import Optional, Tuple
 
-from sqlmodel import Session, func, select
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+from sqlmodel import func, select, tuple_
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.settings import settings
 from app.domain.entities.user import User
 from app.domain.repositories.user_repository import IUserRepository
+from app.utils.cache import TTLCache
+
+# Authenticated users keyed by email, shared by requests in this process.
+user_cache = TTLCache(
+    max_size=settings.user_cache_max_size,
+    ttl_seconds=settings.user_cache_ttl_seconds,
+)
+
+
+# Session.info key of the emails to evict again once the session commits.
+PENDING_EVICTIONS = "user_cache_evictions"
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def invalidate_cached_user(mapper, connection, target: User) -> None:
+    """
+    Drop a user from the identity cache whenever its row changes,
+    so deactivations and email changes take effect immediately.
+    """
+    emails = {target.email, *inspect(target).attrs.email.history.deleted}
+    for email in emails:
+        user_cache.invalidate(email)
+    # Until the commit, other requests still read the old row and may cache
+    # it again, so the commit evicts the same emails once more.
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(PENDING_EVICTIONS, set()).update(emails)
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_committed_users(session: Session) -> None:
+    for email in session.info.pop(PENDING_EVICTIONS, ()):
+        user_cache.invalidate(email)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_pending_evictions(session: Session) -> None:
+    session.info.pop(PENDING_EVICTIONS, None)
 
 
 class UserRepository(IUserRepository):
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: AsyncSession):
         self.db_session = db_session
 
     async def get_user_by_email(self, email: str) -> Optional["User"]:
         statement = select(User).where(User.email == email)
-        user = self.db_session.exec(statement).first()
+        user = (await self.db_session.exec(statement)).first()
         return user
 
-    async def get_by_id(self, user_id: str) -> Optional["User"]:
+    async def get_by_id(self, user_id: int) -> Optional["User"]:
         statement = select(User).where(User.id == user_id)
-        user = self.db_session.exec(statement).first()
+        user = (await self.db_session.exec(statement)).first()
         if not user:
             raise ValueError(f"User with ID {user_id} not found.")
         return user
 
-    async def get_all(self, offset: int = 0, limit: int = 100) -> list["User"]:
-        statement = select(User).offset(offset).limit(limit)
-        users = self.db_session.exec(statement).all()
-        return users
+    async def get_all(
+        self,
+        offset: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None,
+        include_total: bool = True,
+    ) -> Tuple[list["User"], Optional[int]]:
+        count_statement = select(func.count(User.id))
+        columns = [User]
+        if include_total:
+            columns.append(count_statement.scalar_subquery().label("total"))
+        statement = select(*columns).order_by(User.created_at, User.id).limit(limit)
+        if after:
+            statement = statement.where(tuple_(User.created_at, User.id) > after)
+        else:
+            statement = statement.offset(offset)
+        rows = (await self.db_session.exec(statement)).all()
 
-    async def count(self) -> int:
-        statement = select(func.count(User.id))
-        return self.db_session.scalar(statement)
+        if not include_total:
+            return rows, None
+        if rows:
+            return [user for user, _ in rows], rows[0][1]
+        # An empty page past the end carries no total column to read.
+        total = await self.db_session.scalar(count_statement) if offset or after else 0
+        return [], total
@@ -9,6 +9,7 @@ from app.core.constants import ACCESS_TOKEN_EXPIRE_MINUTES
 from app.domain.entities.user import Token, UserCreate, UserResponse
 from app.infrastructure.dependencies import get_auth_service
 from app.utils.auth import create_access_token
+from app.utils.password import PasswordHasherBusyError
 
 app = APIRouter()
 
@@ -26,7 +27,14 @@ async def login(
     Authenticate a user by their email and password.
     Returns a token if authentication is successful.
     """
-    user = await auth_service.authenticate_user(form_data)
+    try:
+        user = await auth_service.authenticate_user(form_data)
+    except PasswordHasherBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        )
 
     if not user:
         raise HTTPException(
@@ -60,5 +68,11 @@ async def register(
     try:
         user = await auth_service.register_user(user_data)
         return UserResponse.model_validate(user)
+    except PasswordHasherBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
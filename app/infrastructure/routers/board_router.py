@@ -1,22 +1,56 @@
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 
 from app.application.services.board_service import BoardService
 from app.application.services.task_service import TaskService
 from app.domain.entities.board import (
+    BoardChangesResponse,
     BoardCreate,
     BoardPaginatedResponse,
     BoardResponse,
     BoardUpdate,
     BoardWithTasks,
 )
-from app.domain.entities.task import TaskCreate, TaskResponse
+from app.domain.entities.task import (
+    SortOrder,
+    TaskBulkCreate,
+    TaskBulkCreateResponse,
+    TaskCreate,
+    TaskFileFormat,
+    TaskImportResponse,
+    TaskPaginatedResponse,
+    TaskResponse,
+    TaskSortField,
+)
+from app.domain.entities.user import User
 from app.infrastructure.dependencies import (
+    get_board_cache,
     get_board_service,
-    get_current_user_email,
+    get_current_user,
     get_task_service,
 )
+from app.infrastructure.repositories.board_repository import board_cache_group
+from app.utils.conditional import (
+    has_validators,
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+    validator_headers,
+)
+from app.utils.export import MEDIA_TYPES
+from app.utils.fields import format_fields, narrow_model, parse_fields, with_nested
+from app.utils.rendering import model_response, render_model
+from app.utils.response_cache import CachedResponse, ResponseCache
 
 app = APIRouter()
 
@@ -29,15 +63,39 @@ app = APIRouter()
 )
 async def get_all(
     board_service: Annotated[BoardService, Depends(get_board_service)],
-    email: Annotated[str, Depends(get_current_user_email)],
+    current_user: Annotated[User, Depends(get_current_user)],
     offset: int = 0,
-    limit: int = Query(default=100, le=100),
+    limit: int = Query(default=100, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        None, description="Opaque next_cursor from a previous page"
+    ),
+    include_total: bool = Query(
+        True, description="Set to false to skip counting the total"
+    ),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated board fields to return, e.g. id,name"
+    ),
 ) -> BoardPaginatedResponse:
     """
     Retrieve all boards.
     """
-    boards = await board_service.get_all(offset=offset, limit=limit, email=email)
-    return BoardPaginatedResponse(**boards)
+    try:
+        selection = parse_fields(fields, BoardResponse)
+        boards = await board_service.get_all(
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total,
+            fields=selection,
+            user=current_user,
+        )
+        page_model = narrow_model(
+            BoardPaginatedResponse,
+            with_nested(BoardPaginatedResponse, "items", selection),
+        )
+        return model_response(page_model, boards)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @app.get(
@@ -47,22 +105,85 @@ async def get_all(
     status_code=status.HTTP_200_OK,
 )
 async def get_by_id(
-    board_id: str,
+    board_id: int,
+    request: Request,
     board_service: Annotated[BoardService, Depends(get_board_service)],
-    email: Annotated[str, Depends(get_current_user_email)],
+    board_cache: Annotated[Optional[ResponseCache], Depends(get_board_cache)],
+    current_user: Annotated[User, Depends(get_current_user)],
     status_task: Optional[str] = Query(None, description="Filter tasks by status"),
     priority_task: Optional[str] = Query(None, description="Filter tasks by priority"),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated fields to return, e.g. name,tasks.title",
+    ),
+    task_limit: Optional[int] = Query(
+        None,
+        ge=0,
+        description="Embed at most this many tasks, oldest first; "
+        "page through the rest with GET /boards/{board_id}/tasks",
+    ),
 ) -> BoardWithTasks:
     """
     Retrieve a board by its ID.
+    Responses are cached per board, filters and fields until the board is
+    written, and answered with 304 when the client's copy is current.
     """
     try:
-        board = await board_service.get_by_id(
-            board_id, email=email, status=status_task, priority=priority_task
-        )
-        return BoardWithTasks.model_validate(board)
+        selection = parse_fields(fields, BoardWithTasks)
     except ValueError as e:
-        raise HTTPException(status=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    group = board_cache_group(board_id)
+    variant = ":".join(
+        [
+            status_task or "",
+            priority_task or "",
+            format_fields(selection),
+            "" if task_limit is None else str(task_limit),
+        ]
+    )
+    cached = await board_cache.get(group, variant) if board_cache else None
+
+    if cached is None or cached.owner_id != current_user.id:
+        # Taken before loading: a write committed meanwhile makes set a no-op.
+        generation = await board_cache.generation(group) if board_cache else None
+        try:
+            if has_validators(request):
+                # Answer revalidations from the board row alone.
+                version, last_modified = await board_service.get_version(
+                    board_id, user=current_user
+                )
+                etag = make_etag("board", board_id, version)
+                if is_not_modified(request, etag, last_modified):
+                    return not_modified_response(etag, last_modified)
+
+            board = await board_service.get_by_id(
+                board_id,
+                user=current_user,
+                status=status_task,
+                priority=priority_task,
+                fields=selection,
+                task_limit=task_limit,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        cached = CachedResponse(
+            owner_id=board.admin_id,
+            # The version loaded with the board always matches its body.
+            etag=make_etag("board", board.id, board.version),
+            last_modified=board.updated_at or board.created_at,
+            body=render_model(narrow_model(BoardWithTasks, selection), board),
+        )
+        if board_cache:
+            await board_cache.set(group, variant, cached, generation)
+
+    if is_not_modified(request, cached.etag, cached.last_modified):
+        return not_modified_response(cached.etag, cached.last_modified)
+    return Response(
+        content=cached.body,
+        media_type="application/json",
+        headers=validator_headers(cached.etag, cached.last_modified),
+    )
 
 
 @app.post(
@@ -74,13 +195,13 @@ async def get_by_id(
 async def create(
     board_data: BoardCreate,
     board_service: Annotated[BoardService, Depends(get_board_service)],
-    email: Annotated[str, Depends(get_current_user_email)],
+    current_user: Annotated[User, Depends(get_current_user)],
 ) -> BoardResponse:
     """
     Create a new board.
     """
     try:
-        board = await board_service.create(board_data, email)
+        board = await board_service.create(board_data, current_user)
         return BoardResponse.model_validate(board)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -93,16 +214,16 @@ async def create(
     status_code=status.HTTP_200_OK,
 )
 async def update(
-    board_id: str,
+    board_id: int,
     board_data: BoardUpdate,
     board_service: Annotated[BoardService, Depends(get_board_service)],
-    email: Annotated[str, Depends(get_current_user_email)],
+    current_user: Annotated[User, Depends(get_current_user)],
 ) -> BoardResponse:
     """
     Update an existing board.
     """
     try:
-        board = await board_service.update(board_id, board_data, email=email)
+        board = await board_service.update(board_id, board_data, user=current_user)
         return BoardResponse.model_validate(board)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -112,15 +233,15 @@ async def update(
     "/{board_id}", summary="Delete a board", status_code=status.HTTP_204_NO_CONTENT
 )
 async def delete(
-    board_id: str,
+    board_id: int,
     board_service: Annotated[BoardService, Depends(get_board_service)],
-    email: Annotated[str, Depends(get_current_user_email)],
+    current_user: Annotated[User, Depends(get_current_user)],
 ) -> None:
     """
     Delete a board by its ID.
     """
     try:
-        await board_service.delete(board_id, email=email)
+        await board_service.delete(board_id, user=current_user)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -129,14 +250,14 @@ async def delete(
     "/{board_id}/collaborator/{user_id}",
 )
 async def add_collaborator(
-    board_id: str,
-    user_id: str,
+    board_id: int,
+    user_id: int,
     board_service: Annotated[BoardService, Depends(get_board_service)],
-    email: Annotated[str, Depends(get_current_user_email)],
+    current_user: Annotated[User, Depends(get_current_user)],
 ) -> dict:
     """Add a collaborator to a board by user ID."""
     try:
-        await board_service.add_collaborator(board_id, user_id, email=email)
+        await board_service.add_collaborator(board_id, user_id, user=current_user)
         return {"detail": "Collaborator added successfully"}
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -146,19 +267,97 @@ async def add_collaborator(
     "/{board_id}/collaborator/{user_id}",
 )
 async def remove_collaborator(
-    board_id: str,
-    user_id: str,
+    board_id: int,
+    user_id: int,
     board_service: Annotated[BoardService, Depends(get_board_service)],
-    email: Annotated[str, Depends(get_current_user_email)],
+    current_user: Annotated[User, Depends(get_current_user)],
 ) -> dict:
     """Remove a collaborator from a board by user ID."""
     try:
-        await board_service.remove_collaborator(board_id, user_id, email=email)
+        await board_service.remove_collaborator(board_id, user_id, user=current_user)
         return {"detail": "Collaborator removed successfully"}
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@app.get(
+    "/{board_id}/tasks",
+    response_model=TaskPaginatedResponse,
+    summary="List a board's tasks",
+    status_code=status.HTTP_200_OK,
+)
+async def list_tasks(
+    board_id: int,
+    task_service: Annotated[TaskService, Depends(get_task_service)],
+    current_user: Annotated[User, Depends(get_current_user)],
+    limit: int = Query(default=100, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        None, description="Opaque next_cursor from a previous page"
+    ),
+    sort: TaskSortField = Query(
+        TaskSortField.CREATED_AT, description="Sort by created_at, priority or status"
+    ),
+    order: SortOrder = Query(SortOrder.ASC, description="Sort direction"),
+    status_task: Optional[str] = Query(None, description="Filter tasks by status"),
+    priority_task: Optional[str] = Query(None, description="Filter tasks by priority"),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated task fields to return, e.g. id,title"
+    ),
+) -> TaskPaginatedResponse:
+    """
+    Retrieve a page of a board's tasks.
+    Priorities sort LOW to HIGH and statuses TODO to DONE, ties by ID.
+    """
+    try:
+        selection = parse_fields(fields, TaskResponse)
+        page = await task_service.list_by_board(
+            board_id,
+            user=current_user,
+            limit=limit,
+            cursor=cursor,
+            sort=sort,
+            order=order,
+            status=status_task,
+            priority=priority_task,
+            fields=selection,
+        )
+        page_model = narrow_model(
+            TaskPaginatedResponse,
+            with_nested(TaskPaginatedResponse, "items", selection),
+        )
+        return model_response(page_model, page)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@app.get(
+    "/{board_id}/changes",
+    response_model=BoardChangesResponse,
+    summary="Sync a board's task changes",
+    status_code=status.HTTP_200_OK,
+)
+async def list_changes(
+    board_id: int,
+    task_service: Annotated[TaskService, Depends(get_task_service)],
+    current_user: Annotated[User, Depends(get_current_user)],
+    since: Optional[str] = Query(
+        None, description="next_token of the previous sync; omit to get every task"
+    ),
+    limit: int = Query(default=100, ge=1, le=1000),
+) -> BoardChangesResponse:
+    """
+    Retrieve the tasks created, updated or deleted since the last sync.
+    Changes close to the present may be sent again on the next sync.
+    """
+    try:
+        changes = await task_service.list_changes(
+            board_id, user=current_user, since=since, limit=limit
+        )
+        return model_response(BoardChangesResponse, changes)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 @app.post(
     "/{board_id}/tasks",
     response_model=TaskResponse,
@@ -166,16 +365,107 @@ async def remove_collaborator(
     status_code=status.HTTP_201_CREATED,
 )
 async def add_task_to_board(
-    board_id: str,
+    board_id: int,
     task_data: TaskCreate,
     task_service: Annotated[TaskService, Depends(get_task_service)],
-    email: Annotated[str, Depends(get_current_user_email)],
+    current_user: Annotated[User, Depends(get_current_user)],
 ) -> TaskResponse:
     """
     Add a task to a specific board.
     """
     try:
-        task = await task_service.create(board_id, task_data, email=email)
+        task = await task_service.create(board_id, task_data, user=current_user)
         return TaskResponse.model_validate(task)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@app.post(
+    "/{board_id}/tasks:bulk",
+    response_model=TaskBulkCreateResponse,
+    summary="Add many tasks to a board",
+    status_code=status.HTTP_201_CREATED,
+)
+async def add_tasks_to_board(
+    board_id: int,
+    data: TaskBulkCreate,
+    task_service: Annotated[TaskService, Depends(get_task_service)],
+    current_user: Annotated[User, Depends(get_current_user)],
+    allow_partial: bool = Query(
+        False, description="Create the valid tasks even if some items are invalid"
+    ),
+) -> TaskBulkCreateResponse:
+    """
+    Add many tasks to a specific board in a single transaction.
+    """
+    try:
+        result = await task_service.create_many(
+            board_id, data.tasks, user=current_user, allow_partial=allow_partial
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    response = TaskBulkCreateResponse(**result)
+    if response.errors and not allow_partial:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=response.model_dump()["errors"],
+        )
+    return response
+
+
+@app.get(
+    "/{board_id}/tasks/export",
+    response_class=StreamingResponse,
+    summary="Export a board's tasks",
+    status_code=status.HTTP_200_OK,
+)
+async def export_tasks(
+    board_id: int,
+    task_service: Annotated[TaskService, Depends(get_task_service)],
+    current_user: Annotated[User, Depends(get_current_user)],
+    format: TaskFileFormat = Query(
+        TaskFileFormat.NDJSON, description="Export format: ndjson or csv"
+    ),
+) -> StreamingResponse:
+    """
+    Stream every task of a board as NDJSON or CSV.
+    """
+    try:
+        content = await task_service.export(board_id, format, user=current_user)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    filename = f"board-{board_id}-tasks.{format.value}"
+    return StreamingResponse(
+        content,
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@app.post(
+    "/{board_id}/tasks/import",
+    response_model=TaskImportResponse,
+    summary="Import tasks into a board",
+    status_code=status.HTTP_200_OK,
+)
+async def import_tasks(
+    board_id: int,
+    request: Request,
+    task_service: Annotated[TaskService, Depends(get_task_service)],
+    current_user: Annotated[User, Depends(get_current_user)],
+    format: TaskFileFormat = Query(
+        TaskFileFormat.NDJSON, description="Format of the request body: ndjson or csv"
+    ),
+) -> TaskImportResponse:
+    """
+    Import tasks from a CSV or NDJSON request body, read as it streams in.
+    """
+    try:
+        result = await task_service.import_tasks(
+            board_id, request.stream(), format, user=current_user
+        )
+        return TaskImportResponse(**result)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -0,0 +1,16 @@
+from fastapi import APIRouter, status
+
+from app.core.database import engine
+
+app = APIRouter()
+
+
+@app.get("/pool", summary="Database pool statistics", status_code=status.HTTP_200_OK)
+async def pool_stats() -> dict:
+    """
+    Report connection pool usage and checkout wait times.
+    """
+    pool = engine.pool
+    if hasattr(pool, "stats"):
+        return pool.stats()
+    return {"status": pool.status()}
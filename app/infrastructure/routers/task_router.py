@@ -1,33 +1,127 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    status,
+)
 
 from app.application.services.task_service import TaskService
-from app.domain.entities.task import TaskResponse, TaskUpdate
-from app.infrastructure.dependencies import get_current_user_email, get_task_service
+from app.domain.entities.task import (
+    TaskBulkUpdate,
+    TaskBulkUpdateResponse,
+    TaskBulkUpdateResult,
+    TaskResponse,
+    TaskSearchResponse,
+    TaskUpdate,
+)
+from app.domain.entities.user import User
+from app.infrastructure.dependencies import get_current_user, get_task_service
+from app.utils.conditional import (
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+    validator_headers,
+)
+from app.utils.fields import narrow_model, parse_fields
+from app.utils.rendering import model_response
 
 app = APIRouter()
 
 
+@app.patch(
+    ":bulk",
+    response_model=TaskBulkUpdateResponse,
+    summary="Update many tasks",
+    status_code=status.HTTP_200_OK,
+)
+async def update_many(
+    data: TaskBulkUpdate,
+    task_service: Annotated["TaskService", Depends(get_task_service)],
+    current_user: Annotated[User, Depends(get_current_user)],
+) -> TaskBulkUpdateResponse:
+    """
+    Apply the same changes to many tasks, reporting the outcome per task.
+    """
+    try:
+        results = await task_service.update_many(
+            data.task_ids, data.changes, user=current_user
+        )
+        return TaskBulkUpdateResponse(
+            results=[
+                TaskBulkUpdateResult(id=task_id, result=result)
+                for task_id, result in results.items()
+            ]
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@app.get(
+    "/search",
+    response_model=TaskSearchResponse,
+    summary="Search tasks",
+    status_code=status.HTTP_200_OK,
+)
+async def search(
+    task_service: Annotated["TaskService", Depends(get_task_service)],
+    current_user: Annotated[User, Depends(get_current_user)],
+    q: str = Query(..., max_length=200, description="Words to search for"),
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+) -> TaskSearchResponse:
+    """
+    Search the titles and descriptions of tasks on the boards the current
+    user administers or collaborates on. Every word must match, the last
+    one as a prefix.
+    """
+    try:
+        page = await task_service.search(
+            q, user=current_user, limit=limit, offset=offset
+        )
+        return model_response(TaskSearchResponse, page)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 @app.get(
     "/{task_id}",
     summary="Get a task by ID",
     status_code=status.HTTP_200_OK,
 )
 async def get_by_id(
-    task_id: str,
+    task_id: int,
+    request: Request,
     task_service: Annotated["TaskService", Depends(get_task_service)],
-    email: Annotated[str, Depends(get_current_user_email)],
+    current_user: Annotated[User, Depends(get_current_user)],
+    fields: Optional[str] = Query(
+        None, description="Comma-separated fields to return, e.g. id,title,status"
+    ),
 ) -> "TaskResponse":
     """
     Retrieve a task by its ID.
     """
     try:
-        task = await task_service.get_by_id(task_id, email=email)
-        return TaskResponse.model_validate(task)
+        selection = parse_fields(fields, TaskResponse)
+        task = await task_service.get_by_id(
+            task_id, user=current_user, fields=selection
+        )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
+    last_modified = task.updated_at or task.created_at
+    etag = make_etag("task", task.id, last_modified.isoformat())
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+    return model_response(
+        narrow_model(TaskResponse, selection),
+        task,
+        headers=validator_headers(etag, last_modified),
+    )
+
 
 @app.patch(
     "/{task_id}",
@@ -35,16 +129,16 @@ async def get_by_id(
     status_code=status.HTTP_200_OK,
 )
 async def update(
-    task_id: str,
+    task_id: int,
     task_data: "TaskUpdate",
     task_service: Annotated["TaskService", Depends(get_task_service)],
-    email: Annotated[str, Depends(get_current_user_email)],
+    current_user: Annotated[User, Depends(get_current_user)],
 ) -> "TaskResponse":
     """
     Update an existing task with the provided data.
     """
     try:
-        task = await task_service.update(task_id, task_data, email=email)
+        task = await task_service.update(task_id, task_data, user=current_user)
         return TaskResponse.model_validate(task)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -56,15 +150,15 @@ async def update(
     status_code=status.HTTP_204_NO_CONTENT,
 )
 async def delete(
-    task_id: str,
+    task_id: int,
     task_service: Annotated["TaskService", Depends(get_task_service)],
-    email: Annotated[str, Depends(get_current_user_email)],
+    current_user: Annotated[User, Depends(get_current_user)],
 ) -> None:
     """
     Delete a task by its ID.
     """
     try:
-        await task_service.delete(task_id, email=email)
+        await task_service.delete(task_id, user=current_user)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -73,16 +167,16 @@ async def delete(
     "/{task_id}/assign/{user_id}",
 )
 async def assign_task(
-    task_id: str,
-    user_id: str,
+    task_id: int,
+    user_id: int,
     task_service: Annotated["TaskService", Depends(get_task_service)],
-    email: Annotated[str, Depends(get_current_user_email)],
+    current_user: Annotated[User, Depends(get_current_user)],
 ) -> dict:
     """
     Assign a task to a user.
     """
     try:
-        await task_service.assign_task(task_id, user_id, email=email)
+        await task_service.assign_task(task_id, user_id, user=current_user)
         return {"detail": "Task assigned successfully"}
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -92,15 +186,15 @@ async def assign_task(
     "/{task_id}/unassign",
 )
 async def unassign_task(
-    task_id: str,
+    task_id: int,
     task_service: Annotated["TaskService", Depends(get_task_service)],
-    email: Annotated[str, Depends(get_current_user_email)],
+    current_user: Annotated[User, Depends(get_current_user)],
 ) -> dict:
     """
     Unassign a task from the current user.
     """
     try:
-        await task_service.unassign_task(task_id, email=email)
+        await task_service.unassign_task(task_id, user=current_user)
         return {"detail": "Task unassigned successfully"}
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
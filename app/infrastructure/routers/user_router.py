@@ -1,32 +1,33 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
 from app.application.services.user_service import UserService
-from app.domain.entities.user import UserPaginatedResponse, UserResponse
-from app.infrastructure.dependencies import get_current_user_email, get_user_service
+from app.domain.entities.user import User, UserPaginatedResponse, UserResponse
+from app.infrastructure.dependencies import get_current_user, get_user_service
+from app.utils.conditional import (
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+    validator_headers,
+)
 
 app = APIRouter()
 
 
 @app.get("/me", summary="Get current user", status_code=status.HTTP_200_OK)
 async def me(
-    user_service: Annotated[UserService, Depends(get_user_service)],
-    email: Annotated[str, Depends(get_current_user_email)],
+    request: Request,
+    response: Response,
+    current_user: Annotated[User, Depends(get_current_user)],
 ) -> UserResponse:
     """Retrieve the currently authenticated user."""
-    try:
-        if not email:
-            raise ValueError("Email not found in token")
-
-        user = await user_service.user(email)
-        return UserResponse.model_validate(user)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    last_modified = current_user.updated_at or current_user.created_at
+    etag = make_etag("user", current_user.id, last_modified.isoformat())
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+    response.headers.update(validator_headers(etag, last_modified))
+    return UserResponse.model_validate(current_user)
 
 
 @app.get(
@@ -37,11 +38,19 @@ async def me(
 async def get_users(
     user_service: Annotated[UserService, Depends(get_user_service)],
     offset: int = 0,
-    limit: int = Query(default=100, le=100),
+    limit: int = Query(default=100, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        None, description="Opaque next_cursor from a previous page"
+    ),
+    include_total: bool = Query(
+        True, description="Set to false to skip counting the total"
+    ),
 ) -> UserPaginatedResponse:
     """Retrieve all users."""
     try:
-        users = await user_service.get_all(offset=offset, limit=limit)
+        users = await user_service.get_all(
+            offset=offset, limit=limit, cursor=cursor, include_total=include_total
+        )
         return UserPaginatedResponse(**users)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -3,7 +3,7 @@ import time
 
 from fastapi import FastAPI, Request
 from fastapi.concurrency import asynccontextmanager
-from fastapi.responses import RedirectResponse
+from fastapi.responses import ORJSONResponse, PlainTextResponse, RedirectResponse
 
 from app.core.api import api_router
 from app.core.constants import (
@@ -15,7 +15,18 @@ from app.core.constants import (
     SWAGGER_UI_PARAMETERS,
     TITLE,
 )
-from app.core.database import init_db
+from app.core.database import engine, init_db
+from app.core.metrics import (
+    MetricsMiddleware,
+    metrics_registry,
+    render_cache_metrics,
+    render_password_hash_metrics,
+    render_pool_metrics,
+)
+from app.core.query_stats import start_query_stats
+from app.infrastructure.repositories.board_repository import board_cache
+from app.utils.auth import token_cache
+from app.utils.password import password_hasher
 
 logger = logging.getLogger(__name__)
 
@@ -24,10 +35,13 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     logger.info("Starting Database Initialization...")
     try:
-        init_db()
+        await init_db()
         logger.info("Database Initialization Complete.")
         yield
     finally:
+        password_hasher.shutdown()
+        if board_cache is not None:
+            await board_cache.close()
         logger.info("Application shutdown...")
 
 
@@ -40,18 +54,24 @@ app = FastAPI(
     swagger_ui_parameters=SWAGGER_UI_PARAMETERS,
     swagger_favicon_url=SWAGGER_FAVICON_URL,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
 @app.middleware("http")
 async def add_process_time_header(request: Request, call_next):
     start_time = time.time()
+    query_stats = start_query_stats()
     response = await call_next(request)
     process_time = time.time() - start_time
     response.headers["X-Process-Time"] = str(process_time)
+    response.headers["X-DB-Queries"] = str(query_stats.count)
+    response.headers["X-DB-Time"] = str(query_stats.seconds)
     return response
 
 
+app.add_middleware(MetricsMiddleware)
+
 app.include_router(api_router)
 
 
@@ -59,3 +79,20 @@ app.include_router(api_router)
 async def redirect_to_swagger():
     logger.info("Redirect to swagger...")
     return RedirectResponse(url="/docs")
+
+
+@app.get("/metrics", include_in_schema=False, response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """
+    Expose request, connection pool, password hashing and cache metrics
+    for Prometheus to scrape.
+    """
+    content = metrics_registry.render()
+    if hasattr(engine.pool, "stats"):
+        content += render_pool_metrics(engine.pool.stats())
+    content += render_password_hash_metrics(password_hasher.metrics.snapshot())
+    caches = {"token": token_cache.stats()}
+    if board_cache is not None:
+        caches["board"] = board_cache.stats()
+    content += render_cache_metrics(caches)
+    return PlainTextResponse(content, media_type="text/plain; version=0.0.4")
@@ -1,10 +1,20 @@
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 import jwt
 from jwt import ExpiredSignatureError, InvalidTokenError
 
-from app.core.constants import ALGORITHM, SECRET_KEY
+from app.core.constants import ACCESS_TOKEN_EXPIRE_MINUTES, ALGORITHM, SECRET_KEY
+from app.core.settings import settings
+from app.utils.cache import TTLCache
+
+# Verified token payloads keyed by token digest; each entry expires at `exp`.
+token_cache = TTLCache(
+    max_size=settings.token_cache_max_size,
+    ttl_seconds=ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
@@ -19,6 +29,22 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
 
 
 def verify_access_token(token: str) -> Optional[dict]:
+    if not settings.token_cache_enabled:
+        return _decode_access_token(token)
+
+    key = hashlib.sha256(token.encode()).digest()
+    payload = token_cache.get(key)
+    if payload is None:
+        payload = _decode_access_token(token)
+        exp = payload.get("exp")
+        if exp is not None:
+            # Translate the wall-clock `exp` into the cache's monotonic clock.
+            expires_at = time.monotonic() + (exp - time.time())
+            token_cache.set(key, payload, expires_at=expires_at)
+    return dict(payload)
+
+
+def _decode_access_token(token: str) -> dict:
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         return payload
@@ -4,5 +4,7 @@ from datetime import datetime, timezone
 def get_current_utc_time() -> datetime:
     """
     Returns the current UTC time.
+    The value is naive because columns are TIMESTAMP WITHOUT TIME ZONE,
+    which asyncpg refuses to bind timezone-aware datetimes to.
     """
-    return datetime.now(timezone.utc)
+    return datetime.now(timezone.utc).replace(tzinfo=None)
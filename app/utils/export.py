@@ -0,0 +1,48 @@
+import csv
+import io
+import json
+from typing import AsyncIterator, List
+
+from app.domain.entities.task import Task, TaskFileFormat, TaskResponse
+
+EXPORT_FIELDS = list(TaskResponse.model_fields)
+
+MEDIA_TYPES = {
+    TaskFileFormat.NDJSON: "application/x-ndjson",
+    TaskFileFormat.CSV: "text/csv",
+}
+
+
+def _rows(tasks: List[Task]) -> List[dict]:
+    return [TaskResponse.model_validate(task).model_dump(mode="json") for task in tasks]
+
+
+async def encode_ndjson(batches: AsyncIterator[List[Task]]) -> AsyncIterator[str]:
+    """
+    Encode batches of tasks as newline-delimited JSON, one chunk per batch.
+    """
+    async for tasks in batches:
+        yield "".join(json.dumps(row) + "\n" for row in _rows(tasks))
+
+
+async def encode_csv(batches: AsyncIterator[List[Task]]) -> AsyncIterator[str]:
+    """
+    Encode batches of tasks as CSV with a header row, one chunk per batch.
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+    writer.writeheader()
+    yield buffer.getvalue()
+    async for tasks in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(_rows(tasks))
+        yield buffer.getvalue()
+
+
+def encode_tasks(
+    batches: AsyncIterator[List[Task]], export_format: TaskFileFormat
+) -> AsyncIterator[str]:
+    if export_format == TaskFileFormat.CSV:
+        return encode_csv(batches)
+    return encode_ndjson(batches)
@@ -0,0 +1,185 @@
+from functools import lru_cache
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, ConfigDict, Field, create_model
+
+# Selected field names in model order, each with the selection of its nested
+# model, or None for the whole field. Tuples keep it hashable for caching.
+FieldSelection = Tuple[Tuple[str, Optional["FieldSelection"]], ...]
+
+# Narrowed models kept per process. Selections come from clients, so the
+# caches of anything built per narrowed model must be bounded the same way.
+MODEL_CACHE_SIZE = 256
+
+
+def _nested_model(annotation: Any) -> Optional[Type[BaseModel]]:
+    """
+    The model inside a field annotation such as `List[Model]` or
+    `Optional[Model]`, or None for scalar fields.
+    """
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in get_args(annotation):
+        model = _nested_model(arg)
+        if model is not None:
+            return model
+    return None
+
+
+def _build_selection(
+    model_type: Type[BaseModel], paths: List[List[str]]
+) -> FieldSelection:
+    fields = model_type.model_fields
+    requested = {}
+    for path in paths:
+        name = path[0]
+        if name not in fields:
+            raise ValueError(f"Unknown field: {name}")
+        if len(path) > 1:
+            if _nested_model(fields[name].annotation) is None:
+                raise ValueError(f"Field {name} has no nested fields.")
+            if requested.get(name, []) is not None:
+                requested.setdefault(name, []).append(path[1:])
+        else:
+            # Naming the field itself selects all of it.
+            requested[name] = None
+    # The id is always returned so clients can match partial objects.
+    if "id" in fields:
+        requested.setdefault("id", None)
+
+    selection = []
+    for name in fields:
+        if name not in requested:
+            continue
+        nested_paths = requested[name]
+        nested = (
+            _build_selection(_nested_model(fields[name].annotation), nested_paths)
+            if nested_paths is not None
+            else None
+        )
+        selection.append((name, nested))
+    return tuple(selection)
+
+
+def parse_fields(
+    fields: Optional[str], model_type: Type[BaseModel]
+) -> Optional[FieldSelection]:
+    """
+    Parse a comma-separated `fields` parameter such as
+    "name,tasks.id,tasks.title" against `model_type`.
+    Returns None when no fields are requested.
+    Raises ValueError for fields the model does not have.
+    """
+    if not fields:
+        return None
+    paths = [item.strip().split(".") for item in fields.split(",") if item.strip()]
+    if not paths:
+        return None
+    if any(not part for path in paths for part in path):
+        raise ValueError(f"Invalid fields: {fields}")
+    return _build_selection(model_type, paths)
+
+
+def format_fields(selection: Optional[FieldSelection], prefix: str = "") -> str:
+    """
+    Canonical string form of a selection, e.g. for cache keys.
+    """
+    if selection is None:
+        return ""
+    parts = []
+    for name, nested in selection:
+        if nested is None:
+            parts.append(prefix + name)
+        else:
+            parts.append(format_fields(nested, f"{prefix}{name}."))
+    return ",".join(parts)
+
+
+def selected_names(selection: Optional[FieldSelection]) -> Optional[List[str]]:
+    """
+    Top-level field names of a selection, or None when every field is wanted.
+    """
+    return None if selection is None else [name for name, _ in selection]
+
+
+def nested_selection(
+    selection: Optional[FieldSelection], name: str
+) -> Union[FieldSelection, None, bool]:
+    """
+    Selection of the nested field `name`: None for all of it,
+    False when it is not selected at all.
+    """
+    if selection is None:
+        return None
+    return next((nested for field, nested in selection if field == name), False)
+
+
+def _field_default(field: Any) -> Any:
+    if field.default_factory is not None:
+        return Field(default_factory=field.default_factory)
+    return Field(default=field.default)
+
+
+@lru_cache(maxsize=MODEL_CACHE_SIZE)
+def narrow_model(
+    model_type: Type[BaseModel], selection: Optional[FieldSelection]
+) -> Type[BaseModel]:
+    """
+    Response model with only the selected fields of `model_type`.
+    Validating an ORM object against it reads only those attributes,
+    so columns left unloaded are never touched.
+    """
+    if selection is None:
+        return model_type
+    definitions = {}
+    for name, nested in selection:
+        field = model_type.model_fields[name]
+        annotation = field.annotation
+        if nested is not None:
+            narrowed = narrow_model(_nested_model(annotation), nested)
+            annotation = (
+                List[narrowed] if get_origin(annotation) in (list, List) else narrowed
+            )
+        definitions[name] = (annotation, _field_default(field))
+    return create_model(
+        f"{model_type.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        **definitions,
+    )
+
+
+def load_columns(
+    entity: Type[Any], names: Iterable[str], always: Iterable[str] = ()
+) -> List[Any]:
+    """
+    Mapped column attributes of `entity` needed for the given field names,
+    plus the `always` columns. Names that are not columns are skipped.
+    """
+    columns = entity.__table__.columns
+    wanted = dict.fromkeys([*always, *names])
+    return [getattr(entity, name) for name in wanted if name in columns]
+
+
+def with_nested(
+    model_type: Type[BaseModel], name: str, selection: Optional[FieldSelection]
+) -> Optional[FieldSelection]:
+    """
+    Select every field of `model_type`, narrowing only its nested field
+    `name` to `selection`; e.g. the items of a paginated response.
+    """
+    if selection is None:
+        return None
+    return tuple(
+        (field, selection if field == name else None)
+        for field in model_type.model_fields
+    )
@@ -0,0 +1,47 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, List, Tuple
+
+
+def encode_keyset(*values: Any) -> str:
+    """
+    Encode JSON-serializable keyset values as an opaque cursor.
+    """
+    raw = json.dumps(list(values), separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_keyset(cursor: str, length: int) -> List[Any]:
+    """
+    Decode a cursor produced by `encode_keyset` holding `length` values.
+    Raises ValueError if the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, ValueError, TypeError):
+        raise ValueError("Invalid cursor.")
+    if not isinstance(values, list) or len(values) != length:
+        raise ValueError("Invalid cursor.")
+    return values
+
+
+def encode_cursor(created_at: datetime, id: int) -> str:
+    """
+    Encode the `(created_at, id)` keyset position of a row as an opaque cursor.
+    """
+    return encode_keyset(created_at.isoformat(), id)
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+    Raises ValueError if the cursor is malformed.
+    """
+    created_at, id = decode_keyset(cursor, 2)
+    try:
+        return datetime.fromisoformat(created_at), int(id)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor.")
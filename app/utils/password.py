@@ -1,11 +1,111 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Tuple
+
 from passlib.context import CryptContext
 
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+class PasswordHasherBusyError(Exception):
+    """
+    Raised when the password hashing pool has no room for more work.
+    """
+
+
+@dataclass
+class PasswordHashMetrics:
+    """
+    Queue depth and latency counters for the password hashing pool.
+    """
+
+    pending: int = 0
+    completed: int = 0
+    rejected: int = 0
+    total_wait_seconds: float = 0.0
+    total_latency_seconds: float = 0.0
+    max_latency_seconds: float = 0.0
+
+    def record(self, wait: float, latency: float) -> None:
+        self.completed += 1
+        self.total_wait_seconds += wait
+        self.total_latency_seconds += latency
+        self.max_latency_seconds = max(self.max_latency_seconds, latency)
+
+    def snapshot(self) -> dict:
+        """
+        Return the current counters plus average wait and latency.
+        """
+        data = asdict(self)
+        completed = self.completed or 1
+        data["avg_wait_seconds"] = self.total_wait_seconds / completed
+        data["avg_latency_seconds"] = self.total_latency_seconds / completed
+        return data
+
+
+def _timed(func: Callable[..., Any], *args: Any) -> Tuple[float, Any]:
+    started = time.perf_counter()
+    return started, func(*args)
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt work on a bounded thread pool so it never blocks the event loop.
+    Submissions beyond `max_pending` are rejected instead of queued.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_pending = max_pending
+        self.metrics = PasswordHashMetrics()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hash"
+        )
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        # Counters are only touched from the event loop thread, so no lock.
+        if self.metrics.pending >= self.max_pending:
+            self.metrics.rejected += 1
+            logger.warning(
+                "Password hashing pool saturated (%d pending).", self.metrics.pending
+            )
+            raise PasswordHasherBusyError("Password hashing capacity exceeded.")
+
+        self.metrics.pending += 1
+        submitted = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            started, result = await loop.run_in_executor(
+                self._executor, _timed, func, *args
+            )
+        finally:
+            self.metrics.pending -= 1
+        self.metrics.record(
+            wait=started - submitted, latency=time.perf_counter() - submitted
+        )
+        return result
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.password_hash_workers,
+    max_pending=settings.password_hash_max_pending,
+)
+
+
+async def hash_password(password: str) -> str:
+    return await password_hasher.run(pwd_context.hash, password)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await password_hasher.run(
+        pwd_context.verify, plain_password, hashed_password
+    )
@@ -0,0 +1,35 @@
+from typing import Any, Dict, Optional, Type
+
+from fastapi import Response, status
+from pydantic import BaseModel
+
+
+def render_model(model_type: Type[BaseModel], value: Any) -> bytes:
+    """
+    Validate `value` (an ORM object, dict or model) against `model_type`
+    once and encode it straight to JSON bytes.
+    """
+    return (
+        model_type.model_validate(value, from_attributes=True)
+        .model_dump_json()
+        .encode()
+    )
+
+
+def model_response(
+    model_type: Type[BaseModel],
+    value: Any,
+    status_code: int = status.HTTP_200_OK,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """
+    JSON response for `value` as `model_type`. Returning a Response skips
+    FastAPI's response_model validation and encoding, which would repeat
+    the work; response_model still documents the route.
+    """
+    return Response(
+        content=render_model(model_type, value),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
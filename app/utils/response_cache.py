@@ -0,0 +1,285 @@
+import json
+import logging
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# How long a group's generation outlives its last invalidation. Far longer
+# than any request, so a read that started before the invalidation cannot
+# find the record gone and store what it loaded.
+GENERATION_TTL_SECONDS = 3600
+
+
+@dataclass
+class CachedResponse:
+    """
+    A serialized response body with the validators and owner it was built for.
+    """
+
+    owner_id: int
+    etag: str
+    last_modified: Optional[datetime]
+    body: bytes
+
+    def dumps(self) -> bytes:
+        header = {
+            "owner_id": self.owner_id,
+            "etag": self.etag,
+            "last_modified": (
+                self.last_modified.isoformat() if self.last_modified else None
+            ),
+        }
+        return json.dumps(header).encode() + b"\n" + self.body
+
+    @classmethod
+    def loads(cls, data: bytes) -> "CachedResponse":
+        header, body = data.split(b"\n", 1)
+        fields = json.loads(header)
+        last_modified = fields["last_modified"]
+        return cls(
+            owner_id=fields["owner_id"],
+            etag=fields["etag"],
+            last_modified=(
+                datetime.fromisoformat(last_modified) if last_modified else None
+            ),
+            body=body,
+        )
+
+
+class ResponseCache(ABC):
+    """
+    Cache of serialized responses. Entries are grouped (e.g. per board) so
+    every variant of a resource can be invalidated at once. A group keeps at
+    most `max_variants` variants, as variant keys come from clients.
+
+    To fill the cache, take the group's generation before loading the data
+    and pass it to set(): if the group was invalidated in between, the data
+    may predate the write and nothing is stored.
+    """
+
+    def __init__(self, max_variants: int) -> None:
+        self.max_variants = max_variants
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, group: str, key: str) -> Optional[CachedResponse]:
+        response = await self._get(group, key)
+        if response is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return response
+
+    @abstractmethod
+    async def _get(self, group: str, key: str) -> Optional[CachedResponse]:
+        """Return the cached response, or None."""
+
+    @abstractmethod
+    async def generation(self, group: str) -> Any:
+        """Return an opaque token that changes whenever `group` is invalidated."""
+
+    @abstractmethod
+    async def set(
+        self, group: str, key: str, response: CachedResponse, generation: Any
+    ) -> None:
+        """Store a response under `key` if `group` is still at `generation`."""
+
+    @abstractmethod
+    async def invalidate(self, group: str) -> None:
+        """Drop every response stored in `group`."""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Drop every response."""
+
+    async def close(self) -> None:
+        """Release any connections held by the backend."""
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+        }
+
+
+class MemoryResponseCache(ResponseCache):
+    """
+    In-process backend: an LRU of groups, each holding its variants, oldest
+    dropped first. The variants dict of a group is its generation, replaced
+    on invalidation. Invalidations only reach the process that performs the
+    write.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float, max_variants: int):
+        super().__init__(max_variants)
+        self._groups = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+
+    async def _get(self, group: str, key: str) -> Optional[CachedResponse]:
+        variants = self._groups.get(group)
+        return variants.get(key) if variants else None
+
+    async def generation(self, group: str) -> Any:
+        variants: Optional[Dict[str, CachedResponse]] = self._groups.get(group)
+        if variants is None:
+            variants = {}
+            self._groups.set(group, variants)
+        return variants
+
+    async def set(
+        self, group: str, key: str, response: CachedResponse, generation: Any
+    ) -> None:
+        variants = self._groups.get(group)
+        if variants is None or variants is not generation:
+            return
+        if key not in variants and len(variants) >= self.max_variants:
+            del variants[next(iter(variants))]
+        variants[key] = response
+
+    async def invalidate(self, group: str) -> None:
+        self._groups.invalidate(group)
+
+    async def clear(self) -> None:
+        self._groups.clear()
+
+    def stats(self) -> dict:
+        return {**super().stats(), "size": len(self._groups)}
+
+
+class RedisResponseCache(ResponseCache):
+    """
+    Backend for any server speaking the Redis protocol, shared by all
+    processes. Each group is a hash of variants that expires as a whole;
+    once full, new variants are not stored until it is invalidated.
+    Generations are random tokens kept per group, plus one for the whole
+    cache that clear() replaces, and checked in the same script that stores
+    the variant. Errors are logged and treated as misses so the database
+    stays the source of truth.
+    """
+
+    # KEYS: group hash, group generation, cache generation.
+    # ARGV: variant key, response, expected generation, max variants, TTL.
+    SET_SCRIPT = """
+    local group = redis.call('GET', KEYS[2]) or ''
+    local cache = redis.call('GET', KEYS[3]) or ''
+    if group .. ':' .. cache ~= ARGV[3] then
+        return 0
+    end
+    if redis.call('HLEN', KEYS[1]) >= tonumber(ARGV[4])
+        and redis.call('HEXISTS', KEYS[1], ARGV[1]) == 0 then
+        return 0
+    end
+    redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+    redis.call('EXPIRE', KEYS[1], ARGV[5])
+    return 1
+    """
+
+    def __init__(
+        self,
+        url: str,
+        ttl_seconds: float,
+        max_variants: int,
+        prefix: str = "response:",
+    ):
+        super().__init__(max_variants)
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+        self._client = aioredis.from_url(url)
+        self._set_script = self._client.register_script(self.SET_SCRIPT)
+
+    def _generation_keys(self, group: str) -> list:
+        return [self.prefix + "generation:" + group, self.prefix + "generation"]
+
+    async def _get(self, group: str, key: str) -> Optional[CachedResponse]:
+        try:
+            data = await self._client.hget(self.prefix + group, key)
+        except RedisError as e:
+            logger.warning("Response cache read failed: %s", e)
+            return None
+        return CachedResponse.loads(data) if data else None
+
+    async def generation(self, group: str) -> Any:
+        try:
+            tokens = await self._client.mget(self._generation_keys(group))
+        except RedisError as e:
+            logger.warning("Response cache read failed: %s", e)
+            return None
+        return ":".join(token.decode() if token else "" for token in tokens)
+
+    async def set(
+        self, group: str, key: str, response: CachedResponse, generation: Any
+    ) -> None:
+        if generation is None:
+            return
+        try:
+            await self._set_script(
+                keys=[self.prefix + group, *self._generation_keys(group)],
+                args=[
+                    key,
+                    response.dumps(),
+                    generation,
+                    self.max_variants,
+                    max(1, int(self.ttl_seconds)),
+                ],
+            )
+        except RedisError as e:
+            logger.warning("Response cache write failed: %s", e)
+
+    async def invalidate(self, group: str) -> None:
+        generation_key = self._generation_keys(group)[0]
+        try:
+            async with self._client.pipeline(transaction=True) as pipe:
+                pipe.set(generation_key, uuid.uuid4().hex, ex=GENERATION_TTL_SECONDS)
+                pipe.delete(self.prefix + group)
+                await pipe.execute()
+        except RedisError as e:
+            logger.error("Response cache invalidation of %s failed: %s", group, e)
+
+    async def clear(self) -> None:
+        try:
+            # Replace the cache generation first: groups whose generation is
+            # deleted below must not match tokens taken before the clear.
+            await self._client.set(self.prefix + "generation", uuid.uuid4().hex)
+            keys = [
+                key
+                async for key in self._client.scan_iter(self.prefix + "*")
+                if key != (self.prefix + "generation").encode()
+            ]
+            if keys:
+                await self._client.delete(*keys)
+        except RedisError as e:
+            logger.error("Response cache clear failed: %s", e)
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+def create_response_cache(
+    backend: str,
+    max_size: int,
+    ttl_seconds: float,
+    max_variants: int,
+    redis_url: str,
+) -> Optional[ResponseCache]:
+    """
+    Build the configured backend: "memory", "redis", or "none" for no cache.
+    """
+    if backend == "memory":
+        return MemoryResponseCache(
+            max_size=max_size, ttl_seconds=ttl_seconds, max_variants=max_variants
+        )
+    if backend == "redis":
+        return RedisResponseCache(
+            redis_url, ttl_seconds=ttl_seconds, max_variants=max_variants
+        )
+    return None
@@ -0,0 +1,169 @@
+import codecs
+import csv
+import json
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
+
+from app.domain.entities.task import TaskFileFormat
+
+# A parsed record, or the message explaining why it could not be parsed.
+ParsedRecord = Tuple[int, Union[Dict[str, Optional[str]], str]]
+
+# Longest line or CSV record read, in characters; the csv module's own limit
+# for a single field. A CSV record still open after this many characters has
+# a quote that is never closed.
+MAX_RECORD_SIZE = csv.field_size_limit()
+OVERLONG_LINE = f"Line is longer than {MAX_RECORD_SIZE} characters."
+
+
+async def iter_lines(
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[List[Optional[str]]]:
+    """
+    Decode a UTF-8 byte stream and regroup it into complete lines,
+    yielding the lines found in each chunk. A leading BOM is dropped.
+    A line longer than MAX_RECORD_SIZE is discarded as it arrives rather
+    than buffered, and yielded as None once it ends.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    overlong = False
+    async for chunk in chunks:
+        *lines, pending = (pending + decoder.decode(chunk)).split("\n")
+        complete: List[Optional[str]] = [line + "\n" for line in lines]
+        if overlong and complete:
+            complete[0] = None
+            overlong = False
+        if len(pending) > MAX_RECORD_SIZE:
+            pending = ""
+            overlong = True
+        if complete:
+            yield complete
+    pending += decoder.decode(b"", final=True)
+    if overlong:
+        yield [None]
+    elif pending:
+        yield [pending]
+
+
+async def parse_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[ParsedRecord]:
+    """
+    Parse newline-delimited JSON objects, numbering records from 1.
+    Blank lines are skipped.
+    """
+    number = 0
+    async for lines in iter_lines(chunks):
+        for line in lines:
+            if line is None:
+                number += 1
+                yield number, OVERLONG_LINE
+                continue
+            if not line.strip():
+                continue
+            number += 1
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield number, f"Invalid JSON: {e}"
+                continue
+            if not isinstance(record, dict):
+                yield number, "Expected a JSON object."
+                continue
+            yield number, record
+
+
+def _ends_in_quoted_field(line: str, in_quotes: bool) -> bool:
+    """
+    Whether `line` ends inside a quoted field, given whether it started in
+    one. Follows the csv module: a quote opens a quoted field only at the
+    start of a cell, and is a literal character anywhere else.
+    """
+    if not in_quotes and '"' not in line:
+        return False
+    position = 0
+    while True:
+        if in_quotes:
+            quote = line.find('"', position)
+            if quote == -1:
+                return True
+            if line.startswith('"', quote + 1):
+                # A doubled quote is an escaped quote inside the field.
+                position = quote + 2
+                continue
+            in_quotes = False
+            position = quote + 1
+        elif line.startswith('"', position):
+            in_quotes = True
+            position += 1
+            continue
+        # The rest of the cell is unquoted; move on to the next one.
+        comma = line.find(",", position)
+        if comma == -1:
+            return False
+        position = comma + 1
+
+
+async def _iter_csv_records(
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[Union[List[str], str]]:
+    """
+    Regroup lines into complete CSV records, since a quoted field may span
+    lines, yielding the lines of the records each chunk completes. Ends with
+    an error message instead when the rest of the file cannot be read.
+    """
+    record_lines: List[str] = []
+    record_size = 0
+    in_quotes = False
+    async for lines in iter_lines(chunks):
+        complete: List[str] = []
+        for line in lines:
+            if line is None:
+                # Whatever the line held, quotes included, is gone.
+                yield complete
+                yield OVERLONG_LINE
+                return
+            record_lines.append(line)
+            record_size += len(line)
+            in_quotes = _ends_in_quoted_field(line, in_quotes)
+            if not in_quotes:
+                complete.extend(record_lines)
+                record_lines = []
+                record_size = 0
+        yield complete
+        if record_size > MAX_RECORD_SIZE:
+            # The rest of the file cannot be told apart from the open field.
+            yield "Unterminated quoted field."
+            return
+    if record_lines:
+        yield "Unterminated quoted field."
+
+
+async def parse_csv(chunks: AsyncIterator[bytes]) -> AsyncIterator[ParsedRecord]:
+    """
+    Parse CSV with a header row, numbering data records from 1.
+    Empty cells are read as null, like null values in NDJSON.
+    """
+    header: List[str] = []
+    number = 0
+    async for records in _iter_csv_records(chunks):
+        if isinstance(records, str):
+            yield number + 1, records
+            return
+        for row in csv.reader(records):
+            if not row:
+                continue
+            if not header:
+                header = [name.strip() for name in row]
+                continue
+            number += 1
+            if len(row) > len(header):
+                yield number, "Row has more cells than the header."
+                continue
+            yield number, {name: value or None for name, value in zip(header, row)}
+
+
+def parse_records(
+    chunks: AsyncIterator[bytes], file_format: TaskFileFormat
+) -> AsyncIterator[ParsedRecord]:
+    if file_format == TaskFileFormat.CSV:
+        return parse_csv(chunks)
+    return parse_ndjson(chunks)
@@ -0,0 +1,144 @@
+"""
+Auth dependency microbenchmark: resolves bearer tokens through
+get_current_user_email in a tight loop, as a busy worker would, with the
+decoded token cache disabled and enabled, and reports calls per second and
+the cache hit ratio as JSON.
+
+Usage:
+    python -m benchmarks.auth [--tokens 1000] [--calls 100000] [--output FILE]
+
+With --tokens above TOKEN_CACHE_MAX_SIZE (default 4096) the cache evicts
+and the hit ratio drops accordingly.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List
+
+from benchmarks.load_test import git_revision
+
+logger = logging.getLogger("benchmarks.auth")
+
+
+@dataclass
+class AuthResult:
+    calls: int
+    rounds: int
+    median_seconds: float
+    calls_per_second: float
+    microseconds_per_call: float
+    hit_ratio: float
+
+
+async def resolve(tokens: List[str]) -> float:
+    from app.infrastructure.dependencies import get_current_user_email
+
+    started = time.perf_counter()
+    for token in tokens:
+        await get_current_user_email(token)
+    return time.perf_counter() - started
+
+
+def measure(tokens: List[str], rounds: int, cached: bool) -> AuthResult:
+    from app.core.settings import settings
+    from app.utils.auth import token_cache
+
+    settings.token_cache_enabled = cached
+    timings = []
+    for _ in range(rounds):
+        # Every round starts cold, so first uses of a token count as misses.
+        token_cache.clear()
+        token_cache.hits = token_cache.misses = 0
+        timings.append(asyncio.run(resolve(tokens)))
+    median = statistics.median(timings)
+    return AuthResult(
+        calls=len(tokens),
+        rounds=rounds,
+        median_seconds=round(median, 4),
+        calls_per_second=round(len(tokens) / median, 1),
+        microseconds_per_call=round(median / len(tokens) * 1_000_000, 2),
+        hit_ratio=round(token_cache.stats()["hit_ratio"], 4),
+    )
+
+
+def run(args: argparse.Namespace) -> dict:
+    from app.core.settings import settings
+    from app.utils.auth import create_access_token
+
+    rng = random.Random(args.seed)
+    pool = [
+        create_access_token({"sub": f"bench-user-{index}@example.com"})
+        for index in range(args.tokens)
+    ]
+    # A few clients send most requests: token r is used in proportion to 1 / r.
+    weights = [1 / rank for rank in range(1, len(pool) + 1)]
+    tokens = rng.choices(pool, weights=weights, k=args.calls)
+
+    results = {}
+    for name, cached in (("uncached", False), ("cached", True)):
+        result = measure(tokens, args.rounds, cached)
+        logger.info(
+            "%-9s %10.1f calls/s  %7.2fus/call  hit ratio %.3f",
+            name,
+            result.calls_per_second,
+            result.microseconds_per_call,
+            result.hit_ratio,
+        )
+        results[name] = asdict(result)
+    speedup = (
+        results["uncached"]["median_seconds"] / results["cached"]["median_seconds"]
+    )
+    logger.info("Cache speedup: %.2fx", speedup)
+
+    return {
+        **git_revision(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "tokens": args.tokens,
+        "token_cache_max_size": settings.token_cache_max_size,
+        "seed": args.seed,
+        "results": results,
+        "speedup": round(speedup, 2),
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.auth")
+    parser.add_argument(
+        "--tokens", type=int, default=1000, help="Distinct tokens in use."
+    )
+    parser.add_argument(
+        "--calls", type=int, default=100_000, help="Tokens resolved per round."
+    )
+    parser.add_argument("--rounds", type=int, default=5, help="Timed rounds per mode.")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed.")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here.")
+    return parser
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    logger.setLevel(logging.INFO)
+    args = build_parser().parse_args()
+    # Importing the app reads settings; nothing here touches the database.
+    os.environ.setdefault("SECRET_KEY", "auth-benchmark-secret-key-not-for-production")
+
+    output = json.dumps(run(args), indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+"""
+Board response cache benchmark: drives a read-heavy mix of board detail
+requests and task updates, with hot boards read far more than the rest,
+once without a cache and once per cache backend. Reports the hit ratio and
+the board detail latency of each run, and the latency delta against the
+uncached run, as JSON.
+
+Usage:
+    python -m benchmarks.board_cache [--write-ratio 0.05] [--output FILE]
+    python -m benchmarks.board_cache --redis-url redis://localhost:6379/15
+
+Task updates invalidate their board, so --write-ratio sets how often hot
+entries are dropped. The Redis backend is only measured with --redis-url;
+the database it names is shared with anything else using it.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Dict, Optional
+
+import httpx
+
+from benchmarks.load_test import (
+    Recorder,
+    ScenarioResult,
+    Workload,
+    git_revision,
+    prepare_database,
+)
+from benchmarks.seed import DatasetSpec
+
+DEFAULT_DATABASE_URL = (
+    f"sqlite:///{Path(tempfile.gettempdir()) / 'crehana-cache-bench.db'}"
+)
+# Filter combinations clients ask for, each cached as its own variant.
+VARIANTS = [
+    {},
+    {"status_task": "TODO"},
+    {"status_task": "DONE"},
+    {"priority_task": "HIGH"},
+]
+
+logger = logging.getLogger("benchmarks.board_cache")
+
+
+class CacheWorkload(Workload):
+    """
+    Board detail reads where the board of rank r is read in proportion to
+    1 / r, mixed with task updates at `write_ratio`.
+    """
+
+    def __init__(self, dataset, tokens, rng: random.Random, write_ratio: float):
+        super().__init__(dataset, tokens, rng)
+        self.write_ratio = write_ratio
+        self.board_weights = [1 / rank for rank in range(1, len(dataset.boards) + 1)]
+
+    def next_request(self, client: httpx.AsyncClient) -> tuple:
+        if self.rng.random() < self.write_ratio:
+            return "task_update", self.task_update(client)
+        return "board_detail", self.board_detail(client)
+
+    def board_detail(self, client: httpx.AsyncClient) -> Awaitable[httpx.Response]:
+        board = self.rng.choices(self.dataset.boards, weights=self.board_weights)[0]
+        return client.get(
+            f"/api/v1/boards/{board.id}",
+            params=self.rng.choice(VARIANTS),
+            headers=self._headers(board.admin_id),
+        )
+
+
+def use_cache(cache) -> None:
+    """
+    Serve and invalidate board responses through `cache`, or no cache.
+    """
+    from app.infrastructure import dependencies
+    from app.infrastructure.repositories import board_repository
+
+    board_repository.board_cache = cache
+    dependencies.board_cache = cache
+
+
+async def run_mix(
+    client: httpx.AsyncClient,
+    workload: CacheWorkload,
+    requests: int,
+    concurrency: int,
+) -> Dict[str, ScenarioResult]:
+    recorders = {"board_detail": Recorder(), "task_update": Recorder()}
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            name, request = workload.next_request(client)
+            started = time.perf_counter()
+            response = await request
+            recorders[name].record(response, time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall_seconds = time.perf_counter() - started
+    return {
+        name: recorder.summarize(wall_seconds)
+        for name, recorder in recorders.items()
+        if recorder.latencies
+    }
+
+
+async def run_backend(
+    client: httpx.AsyncClient,
+    workload: CacheWorkload,
+    cache,
+    args: argparse.Namespace,
+) -> dict:
+    use_cache(cache)
+    if cache is not None:
+        await cache.clear()
+    await run_mix(client, workload, args.warmup, args.concurrency)
+    if cache is not None:
+        cache.hits = cache.misses = 0
+    results = await run_mix(client, workload, args.requests, args.concurrency)
+    return {
+        "hit_ratio": round(cache.stats()["hit_ratio"], 4) if cache else 0.0,
+        **{name: asdict(result) for name, result in results.items()},
+    }
+
+
+async def run(args: argparse.Namespace) -> dict:
+    from app.core.settings import settings
+    from app.infrastructure.repositories.board_repository import board_cache
+    from app.main import app
+    from app.utils.auth import create_access_token
+    from app.utils.response_cache import RedisResponseCache
+
+    rng = random.Random(args.seed)
+    spec = DatasetSpec(
+        users=args.users,
+        boards_per_user=args.boards_per_user,
+        tasks_per_board=args.tasks_per_board,
+        collaborators_per_board=args.collaborators_per_board,
+    )
+    dataset = await prepare_database(spec, rng)
+    tokens = {
+        user_id: create_access_token({"sub": email})
+        for user_id, email in dataset.users.items()
+    }
+
+    backends: Dict[str, Optional[object]] = {"none": None, "memory": board_cache}
+    if args.redis_url:
+        backends["redis"] = RedisResponseCache(
+            args.redis_url,
+            ttl_seconds=settings.board_cache_ttl_seconds,
+            max_variants=settings.board_cache_max_variants,
+        )
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://benchmark"
+        ) as client:
+            for name, cache in backends.items():
+                # The same request sequence for every backend.
+                workload = CacheWorkload(
+                    dataset, tokens, random.Random(args.seed), args.write_ratio
+                )
+                result = await run_backend(client, workload, cache, args)
+                detail = result["board_detail"]
+                logger.info(
+                    "%-7s hit ratio %.3f  p50 %8.2fms  p95 %8.2fms  %8.1f req/s",
+                    name,
+                    result["hit_ratio"],
+                    detail["p50_ms"],
+                    detail["p95_ms"],
+                    detail["requests_per_second"],
+                )
+                results[name] = result
+    use_cache(board_cache)
+    if "redis" in backends:
+        await backends["redis"].close()
+
+    uncached = results["none"]["board_detail"]
+    for name, result in results.items():
+        detail = result["board_detail"]
+        result["p50_delta_ms"] = round(detail["p50_ms"] - uncached["p50_ms"], 3)
+        result["p95_delta_ms"] = round(detail["p95_ms"] - uncached["p95_ms"], 3)
+
+    return {
+        **git_revision(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "database": settings.database_url.partition(":")[0],
+        "dataset": asdict(spec),
+        "seed": args.seed,
+        "concurrency": args.concurrency,
+        "requests": args.requests,
+        "write_ratio": args.write_ratio,
+        "backends": results,
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.board_cache")
+    parser.add_argument(
+        "--database-url",
+        default=DEFAULT_DATABASE_URL,
+        help="Database to reset and seed. Never point this at real data.",
+    )
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--boards-per-user", type=int, default=2)
+    parser.add_argument("--tasks-per-board", type=int, default=200)
+    parser.add_argument("--collaborators-per-board", type=int, default=2)
+    parser.add_argument(
+        "--write-ratio",
+        type=float,
+        default=0.05,
+        help="Share of requests that update a task.",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=10, help="Concurrent clients."
+    )
+    parser.add_argument(
+        "--requests", type=int, default=2000, help="Measured requests per backend."
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=200, help="Unmeasured requests per backend."
+    )
+    parser.add_argument("--redis-url", help="Also measure the Redis backend here.")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed.")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here.")
+    return parser
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    logger.setLevel(logging.INFO)
+    logging.getLogger("app").setLevel(logging.ERROR)
+    args = build_parser().parse_args()
+
+    # Settings are read when the app is imported, so configure it first.
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ["BOARD_CACHE_BACKEND"] = "memory"
+    os.environ.setdefault("SECRET_KEY", "cache-benchmark-secret-key-not-for-production")
+
+    # The app prints to stdout in places; keep stdout for the report.
+    with contextlib.redirect_stdout(sys.stderr):
+        report = asyncio.run(run(args))
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
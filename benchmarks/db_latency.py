@@ -0,0 +1,287 @@
+"""
+Database latency benchmark: adds a fixed delay to every statement inside
+the SQLite driver, standing in for a database round trip, then sends
+GET /api/v1/users/me from concurrent clients and reports requests per
+second at each level as JSON.
+
+Usage:
+    python -m benchmarks.db_latency [--latency-ms 20] [--output FILE]
+    python -m benchmarks.db_latency --app-root ../old-checkout --output before.json
+    python -m benchmarks.db_latency --baseline before.json
+
+The delay blocks whichever thread runs the statement. A synchronous Session
+runs it on the event loop, so every in-flight request waits; aiosqlite runs
+it on its own thread, so requests overlap. This script imports nothing else
+from the repository, and --app-root points it at any checkout, including
+ones from before the async engine. Caches that would skip the user lookup
+are disabled where the checkout has them.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+PASSWORD = "benchmark-password"
+
+logger = logging.getLogger("benchmarks.db_latency")
+
+# Seconds added to each statement; zero while the users are being set up.
+statement_latency = 0.0
+
+
+class SlowCursor(sqlite3.Cursor):
+    def execute(self, *args):
+        time.sleep(statement_latency)
+        return super().execute(*args)
+
+    def executemany(self, *args):
+        time.sleep(statement_latency)
+        return super().executemany(*args)
+
+
+class SlowConnection(sqlite3.Connection):
+    def cursor(self, factory=SlowCursor):
+        return super().cursor(factory)
+
+    def execute(self, *args):
+        return self.cursor().execute(*args)
+
+    def executemany(self, *args):
+        return self.cursor().executemany(*args)
+
+
+def install_latency() -> None:
+    """
+    Open every SQLite connection, sync or aiosqlite, as a SlowConnection.
+    """
+    connect = sqlite3.connect
+
+    def slow_connect(*args, **kwargs):
+        kwargs.setdefault("factory", SlowConnection)
+        return connect(*args, **kwargs)
+
+    sqlite3.connect = sqlite3.dbapi2.connect = slow_connect
+
+
+@dataclass
+class LevelResult:
+    concurrency: int
+    requests: int
+    errors: int
+    seconds: float
+    requests_per_second: float
+    p50_ms: float
+    p95_ms: float
+
+
+async def measure(
+    client: httpx.AsyncClient,
+    headers: List[Dict[str, str]],
+    requests: int,
+    concurrency: int,
+) -> LevelResult:
+    latencies: List[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker(index: int) -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                response = await client.get(
+                    "/api/v1/users/me", headers=headers[index % len(headers)]
+                )
+                response.raise_for_status()
+            except Exception:
+                # A pool checkout that times out surfaces here.
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(index) for index in range(concurrency)))
+    seconds = time.perf_counter() - started
+    latencies.sort()
+    return LevelResult(
+        concurrency=concurrency,
+        requests=requests,
+        errors=errors,
+        seconds=round(seconds, 3),
+        requests_per_second=round(len(latencies) / seconds, 1),
+        p50_ms=round(statistics.median(latencies) * 1000, 2) if latencies else 0.0,
+        p95_ms=(
+            round(latencies[int(0.95 * (len(latencies) - 1))] * 1000, 2)
+            if latencies
+            else 0.0
+        ),
+    )
+
+
+async def sign_in(client: httpx.AsyncClient, users: int) -> List[Dict[str, str]]:
+    headers = []
+    for index in range(users):
+        email = f"latency-{index}@example.com"
+        response = await client.post(
+            "/api/v1/auth/register", json={"email": email, "password": PASSWORD}
+        )
+        response.raise_for_status()
+        response = await client.post(
+            "/api/v1/auth/login", data={"username": email, "password": PASSWORD}
+        )
+        response.raise_for_status()
+        headers.append({"Authorization": f"Bearer {response.json()['access_token']}"})
+    return headers
+
+
+def tree_revision(root: Path) -> Dict[str, Optional[object]]:
+    def git(*args: str) -> Optional[str]:
+        try:
+            return subprocess.run(
+                ["git", *args], cwd=root, capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    status = git("status", "--porcelain", "--untracked-files=no")
+    return {
+        "commit": git("rev-parse", "HEAD"),
+        "dirty": bool(status) if status is not None else None,
+    }
+
+
+async def run(args: argparse.Namespace) -> dict:
+    global statement_latency
+    from app.main import app
+
+    levels = {}
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://benchmark", timeout=None
+        ) as client:
+            headers = await sign_in(client, args.users)
+            statement_latency = args.latency_ms / 1000
+            for concurrency in args.concurrency:
+                result = await measure(client, headers, args.requests, concurrency)
+                logger.info(
+                    "%4d clients  %8.1f req/s  p50 %8.2fms  p95 %8.2fms  %d errors",
+                    concurrency,
+                    result.requests_per_second,
+                    result.p50_ms,
+                    result.p95_ms,
+                    result.errors,
+                )
+                levels[str(concurrency)] = asdict(result)
+            statement_latency = 0.0
+
+    return {
+        **tree_revision(args.app_root),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "latency_ms": args.latency_ms,
+        "users": args.users,
+        "levels": levels,
+    }
+
+
+def compare(report: dict, baseline: dict) -> None:
+    """
+    Log the throughput of each level as a multiple of a previous report's.
+    """
+    logger.info("Against %s:", (baseline.get("commit") or "baseline")[:12])
+    for concurrency, result in report["levels"].items():
+        previous = baseline.get("levels", {}).get(concurrency)
+        if not previous or not previous["requests_per_second"]:
+            continue
+        logger.info(
+            "%4s clients  %6.2fx req/s",
+            concurrency,
+            result["requests_per_second"] / previous["requests_per_second"],
+        )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.db_latency")
+    parser.add_argument(
+        "--app-root",
+        type=Path,
+        default=REPO_ROOT,
+        help="Checkout whose app is measured. Defaults to this one.",
+    )
+    parser.add_argument(
+        "--database-url",
+        default=f"sqlite:///{Path(tempfile.mkdtemp()) / 'db-latency-bench.db'}",
+        help="SQLite database to create. Defaults to a new temporary file.",
+    )
+    parser.add_argument(
+        "--latency-ms", type=float, default=20.0, help="Delay added per statement."
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[1, 10],
+        help="Numbers of concurrent clients.",
+    )
+    parser.add_argument("--requests", type=int, default=200, help="Requests per level.")
+    parser.add_argument("--users", type=int, default=10, help="Users signed in.")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here.")
+    parser.add_argument(
+        "--baseline", type=Path, help="Previous JSON report to compare against."
+    )
+    return parser
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    logger.setLevel(logging.INFO)
+    logging.getLogger("app").setLevel(logging.ERROR)
+    args = build_parser().parse_args()
+    args.app_root = args.app_root.resolve()
+
+    # The measured checkout's app must win over this one's.
+    sys.path.insert(0, str(args.app_root))
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault(
+        "SECRET_KEY", "latency-benchmark-secret-key-not-for-production"
+    )
+    os.environ["USER_CACHE_ENABLED"] = "false"
+    os.environ["TOKEN_CACHE_ENABLED"] = "false"
+    install_latency()
+
+    # Older checkouts echo SQL to stdout; keep stdout for the report.
+    with contextlib.redirect_stdout(sys.stderr):
+        logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+        logging.getLogger("sqlalchemy.engine.Engine").disabled = True
+        report = asyncio.run(run(args))
+
+    if args.baseline:
+        compare(report, json.loads(args.baseline.read_text()))
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
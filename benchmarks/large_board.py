@@ -0,0 +1,202 @@
+"""
+Large board benchmark: seeds a board with tens of thousands of tasks, then
+times GET /api/v1/boards/{board_id} with and without task filters, and
+reports latency, tasks returned and peak Python memory per request as JSON.
+
+Usage:
+    python -m benchmarks.large_board [--tasks 30000] [--rounds 20] [--output FILE]
+
+The board response cache is disabled so every request loads the board.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict
+
+import httpx
+
+from benchmarks.load_test import git_revision, prepare_database
+from benchmarks.seed import DatasetSpec
+
+DEFAULT_DATABASE_URL = (
+    f"sqlite:///{Path(tempfile.gettempdir()) / 'crehana-large-board-bench.db'}"
+)
+# Query string of each case, from the broadest to the most selective.
+CASES: Dict[str, Dict[str, str]] = {
+    "all_tasks": {},
+    "status": {"status_task": "DONE"},
+    "status_priority": {"status_task": "DONE", "priority_task": "HIGH"},
+    "status_priority_limit_20": {
+        "status_task": "DONE",
+        "priority_task": "HIGH",
+        "task_limit": "20",
+    },
+    "status_priority_titles": {
+        "status_task": "DONE",
+        "priority_task": "HIGH",
+        "fields": "name,tasks.id,tasks.title",
+    },
+}
+
+logger = logging.getLogger("benchmarks.large_board")
+
+
+@dataclass
+class CaseResult:
+    rounds: int
+    tasks: int
+    bytes: int
+    db_queries: int
+    p50_ms: float
+    p95_ms: float
+    peak_memory_mib: float
+
+
+async def run_case(
+    client: httpx.AsyncClient,
+    url: str,
+    params: Dict[str, str],
+    headers: Dict[str, str],
+    rounds: int,
+) -> CaseResult:
+    latencies = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        response = await client.get(url, params=params, headers=headers)
+        latencies.append(time.perf_counter() - started)
+        response.raise_for_status()
+
+    # Measured apart from the timed rounds, which tracing would slow down.
+    tracemalloc.start()
+    await client.get(url, params=params, headers=headers)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies.sort()
+    return CaseResult(
+        rounds=rounds,
+        tasks=len(response.json().get("tasks", [])),
+        bytes=len(response.content),
+        db_queries=int(response.headers.get("X-DB-Queries", 0)),
+        p50_ms=round(statistics.median(latencies) * 1000, 2),
+        p95_ms=round(latencies[int(0.95 * (rounds - 1))] * 1000, 2),
+        peak_memory_mib=round(peak / 2**20, 2),
+    )
+
+
+async def run(args: argparse.Namespace) -> dict:
+    from app.core.settings import settings
+    from app.main import app
+    from app.utils.auth import create_access_token
+
+    rng = random.Random(args.seed)
+    # Two users are the fewest that allow a collaborator; each gets a board.
+    spec = DatasetSpec(
+        users=2,
+        boards_per_user=1,
+        tasks_per_board=args.tasks,
+        collaborators_per_board=1,
+    )
+    seed_started = time.perf_counter()
+    dataset = await prepare_database(spec, rng)
+    logger.info(
+        "Seeded %d tasks in %.2fs.",
+        len(dataset.tasks),
+        time.perf_counter() - seed_started,
+    )
+    board = dataset.boards[0]
+    email = dataset.users[board.admin_id]
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': email})}"}
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://benchmark"
+        ) as client:
+            url = f"/api/v1/boards/{board.id}"
+            for name, params in CASES.items():
+                await run_case(client, url, params, headers, args.warmup)
+                result = await run_case(client, url, params, headers, args.rounds)
+                logger.info(
+                    "%-25s p50 %8.2fms  p95 %8.2fms  %6d tasks  %8.2f MiB peak",
+                    name,
+                    result.p50_ms,
+                    result.p95_ms,
+                    result.tasks,
+                    result.peak_memory_mib,
+                )
+                results[name] = asdict(result)
+
+    return {
+        **git_revision(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "database": settings.database_url.partition(":")[0],
+        "tasks_per_board": args.tasks,
+        "seed": args.seed,
+        "cases": results,
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.large_board")
+    parser.add_argument(
+        "--database-url",
+        default=DEFAULT_DATABASE_URL,
+        help="Database to reset and seed. Never point this at real data.",
+    )
+    parser.add_argument(
+        "--tasks", type=int, default=30_000, help="Tasks on the measured board."
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=20, help="Measured requests per case."
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=2, help="Unmeasured requests per case."
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Random seed.")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here.")
+    return parser
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    logger.setLevel(logging.INFO)
+    logging.getLogger("app").setLevel(logging.ERROR)
+    args = build_parser().parse_args()
+
+    # Settings are read when the app is imported, so configure it first.
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ["BOARD_CACHE_BACKEND"] = "none"
+    os.environ.setdefault(
+        "SECRET_KEY", "large-board-benchmark-secret-key-not-for-production"
+    )
+
+    # The app prints to stdout in places; keep stdout for the report.
+    with contextlib.redirect_stdout(sys.stderr):
+        report = asyncio.run(run(args))
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,437 @@
+"""
+End-to-end load test: seeds a synthetic dataset, then drives the ASGI app
+in-process with concurrent clients and reports latency percentiles and
+throughput per scenario as JSON.
+
+Usage:
+    python -m benchmarks.load_test [--users N] [--concurrency N] [--output FILE]
+    python -m benchmarks.load_test --baseline previous.json
+
+The database is reset before seeding, so every run starts from the same data
+and runs with the same --seed are comparable across commits.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from benchmarks.seed import PASSWORD, DatasetSpec, seed_dataset
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_DATABASE_URL = f"sqlite:///{Path(tempfile.gettempdir()) / 'crehana-bench.db'}"
+
+logger = logging.getLogger("benchmarks.load_test")
+
+
+@dataclass
+class ScenarioResult:
+    requests: int
+    errors: int
+    status_codes: Dict[str, int]
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    max_ms: float
+    requests_per_second: float
+    db_queries_per_request: float
+
+
+@dataclass
+class Recorder:
+    latencies: List[float] = field(default_factory=list)
+    status_codes: Counter = field(default_factory=Counter)
+    db_queries: int = 0
+
+    def record(self, response: httpx.Response, elapsed: float) -> None:
+        self.latencies.append(elapsed)
+        self.status_codes[str(response.status_code)] += 1
+        self.db_queries += int(response.headers.get("X-DB-Queries", 0))
+
+    def summarize(self, wall_seconds: float) -> ScenarioResult:
+        latencies_ms = sorted(latency * 1000 for latency in self.latencies)
+        if len(latencies_ms) > 1:
+            cuts = statistics.quantiles(latencies_ms, n=100, method="inclusive")
+        else:
+            # Every percentile of a single request is its latency.
+            cuts = latencies_ms * 99
+        errors = sum(
+            count for code, count in self.status_codes.items() if int(code) >= 400
+        )
+        return ScenarioResult(
+            requests=len(latencies_ms),
+            errors=errors,
+            status_codes=dict(sorted(self.status_codes.items())),
+            p50_ms=round(cuts[49], 3),
+            p95_ms=round(cuts[94], 3),
+            p99_ms=round(cuts[98], 3),
+            mean_ms=round(statistics.fmean(latencies_ms), 3),
+            max_ms=round(latencies_ms[-1], 3),
+            requests_per_second=round(len(latencies_ms) / wall_seconds, 1),
+            db_queries_per_request=round(self.db_queries / len(latencies_ms), 2),
+        )
+
+
+class Workload:
+    """
+    Builds the requests of each scenario from the seeded dataset.
+    Every request acts as the board admin, so writes are authorized.
+    """
+
+    def __init__(self, dataset, tokens: Dict[int, str], rng: random.Random):
+        self.dataset = dataset
+        self.tokens = tokens
+        self.rng = rng
+        self.boards_by_id = {board.id: board for board in dataset.boards}
+        # Deletes consume tasks; the other scenarios may pick any task.
+        self.deletable_tasks = list(dataset.tasks)
+        rng.shuffle(self.deletable_tasks)
+
+    def _headers(self, user_id: int) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.tokens[user_id]}"}
+
+    def _task(self):
+        task_id, board_id = self.rng.choice(self.dataset.tasks)
+        return task_id, self.boards_by_id[board_id]
+
+    def login(self, client: httpx.AsyncClient) -> Awaitable[httpx.Response]:
+        email = self.rng.choice(list(self.dataset.users.values()))
+        return client.post(
+            "/api/v1/auth/login", data={"username": email, "password": PASSWORD}
+        )
+
+    def board_list(self, client: httpx.AsyncClient) -> Awaitable[httpx.Response]:
+        user_id = self.rng.choice(list(self.dataset.users))
+        return client.get("/api/v1/boards/", headers=self._headers(user_id))
+
+    def board_detail(self, client: httpx.AsyncClient) -> Awaitable[httpx.Response]:
+        board = self.rng.choice(self.dataset.boards)
+        return client.get(
+            f"/api/v1/boards/{board.id}", headers=self._headers(board.admin_id)
+        )
+
+    def task_detail(self, client: httpx.AsyncClient) -> Awaitable[httpx.Response]:
+        task_id, board = self._task()
+        return client.get(
+            f"/api/v1/tasks/{task_id}", headers=self._headers(board.admin_id)
+        )
+
+    def task_create(self, client: httpx.AsyncClient) -> Awaitable[httpx.Response]:
+        board = self.rng.choice(self.dataset.boards)
+        return client.post(
+            f"/api/v1/boards/{board.id}/tasks",
+            json={"title": "Load test task", "status": "TODO", "priority": "LOW"},
+            headers=self._headers(board.admin_id),
+        )
+
+    def task_update(self, client: httpx.AsyncClient) -> Awaitable[httpx.Response]:
+        task_id, board = self._task()
+        return client.patch(
+            f"/api/v1/tasks/{task_id}",
+            json={"status": self.rng.choice(["TODO", "IN_PROGRESS", "DONE"])},
+            headers=self._headers(board.admin_id),
+        )
+
+    def task_assign(self, client: httpx.AsyncClient) -> Awaitable[httpx.Response]:
+        task_id, board = self._task()
+        assignee = self.rng.choice(board.collaborator_ids + [board.admin_id])
+        return client.post(
+            f"/api/v1/tasks/{task_id}/assign/{assignee}",
+            headers=self._headers(board.admin_id),
+        )
+
+    def task_delete(self, client: httpx.AsyncClient) -> Awaitable[httpx.Response]:
+        task_id, board_id = self.deletable_tasks.pop()
+        return client.delete(
+            f"/api/v1/tasks/{task_id}",
+            headers=self._headers(self.boards_by_id[board_id].admin_id),
+        )
+
+
+# Run order; deletes go last so earlier scenarios see the full dataset.
+SCENARIOS = [
+    "login",
+    "board_list",
+    "board_detail",
+    "task_detail",
+    "task_create",
+    "task_update",
+    "task_assign",
+    "task_delete",
+]
+
+
+async def send_requests(
+    client: httpx.AsyncClient,
+    make_request: Callable[[httpx.AsyncClient], Awaitable[httpx.Response]],
+    requests: int,
+    concurrency: int,
+) -> Tuple[Recorder, float]:
+    """
+    Send `requests` requests from `concurrency` clients, returning what was
+    recorded and the wall time taken. Warmups stop here, unsummarized.
+    """
+    recorder = Recorder()
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            response = await make_request(client)
+            recorder.record(response, time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return recorder, time.perf_counter() - started
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    make_request: Callable[[httpx.AsyncClient], Awaitable[httpx.Response]],
+    requests: int,
+    concurrency: int,
+) -> ScenarioResult:
+    recorder, wall_seconds = await send_requests(
+        client, make_request, requests, concurrency
+    )
+    return recorder.summarize(wall_seconds)
+
+
+def git_revision() -> Dict[str, Optional[object]]:
+    def git(*args: str) -> Optional[str]:
+        try:
+            return subprocess.run(
+                ["git", *args],
+                cwd=REPO_ROOT,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    status = git("status", "--porcelain", "--untracked-files=no")
+    return {
+        "commit": git("rev-parse", "HEAD"),
+        "dirty": bool(status) if status is not None else None,
+    }
+
+
+async def prepare_database(spec, rng: random.Random):
+    from alembic import command
+    from alembic.config import Config
+
+    from app.core.database import ALEMBIC_CONFIG, engine, migrate_db
+
+    def downgrade(connection) -> None:
+        config = Config(str(ALEMBIC_CONFIG))
+        config.attributes["connection"] = connection
+        command.downgrade(config, "base")
+
+    async with engine.begin() as connection:
+        await connection.run_sync(downgrade)
+    await migrate_db()
+    async with engine.begin() as connection:
+        return await seed_dataset(connection, spec, rng)
+
+
+async def run(args: argparse.Namespace) -> dict:
+    from app.core.settings import settings
+    from app.main import app
+    from app.utils.auth import create_access_token
+
+    rng = random.Random(args.seed)
+    spec = DatasetSpec(
+        users=args.users,
+        boards_per_user=args.boards_per_user,
+        tasks_per_board=args.tasks_per_board,
+        collaborators_per_board=args.collaborators_per_board,
+    )
+    seed_started = time.perf_counter()
+    dataset = await prepare_database(spec, rng)
+    seed_seconds = time.perf_counter() - seed_started
+    logger.info(
+        "Seeded %d users, %d boards, %d tasks in %.2fs.",
+        len(dataset.users),
+        len(dataset.boards),
+        len(dataset.tasks),
+        seed_seconds,
+    )
+
+    # Tokens are minted directly; logging in is measured by its own scenario.
+    tokens = {
+        user_id: create_access_token({"sub": email})
+        for user_id, email in dataset.users.items()
+    }
+    workload = Workload(dataset, tokens, rng)
+    scenarios = args.scenario or SCENARIOS
+    if "task_delete" in scenarios:
+        needed = args.requests + args.warmup
+        if needed > len(dataset.tasks):
+            raise ValueError(
+                f"task_delete needs {needed} seeded tasks, only "
+                f"{len(dataset.tasks)} exist."
+            )
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://benchmark"
+        ) as client:
+            for name in SCENARIOS:
+                if name not in scenarios:
+                    continue
+                make_request = getattr(workload, name)
+                if args.warmup:
+                    await send_requests(
+                        client, make_request, args.warmup, args.concurrency
+                    )
+                result = await run_scenario(
+                    client, make_request, args.requests, args.concurrency
+                )
+                logger.info(
+                    "%-13s p50 %8.2fms  p95 %8.2fms  p99 %8.2fms  %8.1f req/s",
+                    name,
+                    result.p50_ms,
+                    result.p95_ms,
+                    result.p99_ms,
+                    result.requests_per_second,
+                )
+                results[name] = asdict(result)
+
+    return {
+        **git_revision(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "database": settings.database_url.partition(":")[0],
+        "board_cache_backend": settings.board_cache_backend,
+        "dataset": asdict(spec),
+        "seed": args.seed,
+        "concurrency": args.concurrency,
+        "requests_per_scenario": args.requests,
+        "warmup_requests": args.warmup,
+        "seed_seconds": round(seed_seconds, 3),
+        "scenarios": results,
+    }
+
+
+# Report entries that must match for two runs to be compared.
+COMPARABLE_KEYS = (
+    "database",
+    "board_cache_backend",
+    "dataset",
+    "seed",
+    "concurrency",
+    "requests_per_scenario",
+    "warmup_requests",
+)
+
+
+def compare(report: dict, baseline: dict) -> None:
+    """
+    Log the relative change of each scenario against a previous report.
+    """
+    logger.info("Against %s:", (baseline.get("commit") or "baseline")[:12])
+    for key in COMPARABLE_KEYS:
+        if report.get(key) != baseline.get(key):
+            logger.warning(
+                "%s differs (%s vs %s); results are not directly comparable.",
+                key,
+                report.get(key),
+                baseline.get(key),
+            )
+    for name, result in report["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if not previous:
+            continue
+        changes = [
+            f"{metric} {(result[metric] / previous[metric] - 1) * 100:+6.1f}%"
+            for metric in ("p50_ms", "p95_ms", "p99_ms", "requests_per_second")
+            if previous[metric]
+        ]
+        logger.info("%-13s %s", name, "  ".join(changes))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load_test")
+    parser.add_argument(
+        "--database-url",
+        default=DEFAULT_DATABASE_URL,
+        help="Database to reset and seed. Never point this at real data.",
+    )
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--boards-per-user", type=int, default=2)
+    parser.add_argument("--tasks-per-board", type=int, default=50)
+    parser.add_argument("--collaborators-per-board", type=int, default=2)
+    parser.add_argument(
+        "--concurrency", type=int, default=10, help="Concurrent clients."
+    )
+    parser.add_argument(
+        "--requests", type=int, default=200, help="Measured requests per scenario."
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=20, help="Unmeasured requests per scenario."
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=SCENARIOS,
+        help="Only run this scenario (repeatable). Defaults to all.",
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Random seed.")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here.")
+    parser.add_argument(
+        "--baseline", type=Path, help="Previous JSON report to compare against."
+    )
+    return parser
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    logger.setLevel(logging.INFO)
+    # Slow query warnings are expected under load and drown out the summary.
+    logging.getLogger("app").setLevel(logging.ERROR)
+    parser = build_parser()
+    args = parser.parse_args()
+    if args.requests < 1 or args.warmup < 0:
+        parser.error("--requests must be at least 1 and --warmup at least 0.")
+
+    # Settings are read when the app is imported, so configure it first.
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("SECRET_KEY", "load-test-secret-key-not-for-production")
+
+    # The app prints to stdout in places; keep stdout for the report.
+    with contextlib.redirect_stdout(sys.stderr):
+        report = asyncio.run(run(args))
+
+    if args.baseline:
+        compare(report, json.loads(args.baseline.read_text()))
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""
+Metrics middleware overhead benchmark: times MetricsRegistry.observe and
+render directly, then sends the same requests to a minimal FastAPI app with
+and without MetricsMiddleware, and reports the added cost per request as
+JSON.
+
+Usage:
+    python -m benchmarks.metrics_overhead [--requests 5000] [--output FILE]
+
+The app has a single trivial route, so the end-to-end delta is the whole
+cost the middleware adds to every request, not a share of real handler time.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import random
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Tuple
+
+import httpx
+
+from benchmarks.load_test import git_revision
+
+METHODS = ["GET", "POST", "PUT", "DELETE"]
+STATUS_CODES = [200, 200, 200, 201, 204, 400, 404, 500]
+
+logger = logging.getLogger("benchmarks.metrics_overhead")
+
+
+@dataclass
+class RequestResult:
+    requests: int
+    rounds: int
+    median_seconds: float
+    requests_per_second: float
+    microseconds_per_request: float
+
+
+def observations(routes: int, count: int, seed: int) -> List[Tuple]:
+    rng = random.Random(seed)
+    templates = [f"/api/v1/resource{index}/{{item_id}}" for index in range(routes)]
+    return [
+        (
+            rng.choice(METHODS),
+            rng.choice(templates),
+            rng.choice(STATUS_CODES),
+            rng.expovariate(1 / 0.02),
+        )
+        for _ in range(count)
+    ]
+
+
+def measure_registry(args: argparse.Namespace) -> dict:
+    from app.core.metrics import MetricsRegistry
+
+    samples = observations(args.routes, args.observations, args.seed)
+    observe_timings = []
+    render_timings = []
+    for _ in range(args.rounds):
+        registry = MetricsRegistry()
+        started = time.perf_counter()
+        for method, route, status_code, seconds in samples:
+            registry.observe(method, route, status_code, seconds)
+        observe_timings.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        content = registry.render()
+        render_timings.append(time.perf_counter() - started)
+
+    return {
+        "observations": len(samples),
+        "routes": args.routes,
+        "series": len(registry.requests) + len(registry.durations),
+        "observe_ns_per_call": round(
+            statistics.median(observe_timings) / len(samples) * 1e9, 1
+        ),
+        "render_ms": round(statistics.median(render_timings) * 1000, 3),
+        "render_bytes": len(content),
+    }
+
+
+def build_app(instrumented: bool):
+    from fastapi import FastAPI
+
+    from app.core.metrics import MetricsMiddleware, MetricsRegistry
+
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int) -> dict:
+        return {"id": item_id}
+
+    if instrumented:
+        app.add_middleware(MetricsMiddleware, registry=MetricsRegistry())
+    return app
+
+
+async def send_requests(app, requests: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://benchmark"
+    ) as client:
+        started = time.perf_counter()
+        for index in range(requests):
+            response = await client.get(f"/items/{index}")
+            response.raise_for_status()
+        return time.perf_counter() - started
+
+
+def measure_requests(args: argparse.Namespace) -> dict:
+    apps = {"without": build_app(False), "with": build_app(True)}
+    for app in apps.values():
+        asyncio.run(send_requests(app, args.warmup))
+
+    timings = {name: [] for name in apps}
+    for _ in range(args.rounds):
+        # Alternating keeps drift in machine load from favouring either app.
+        for name, app in apps.items():
+            timings[name].append(asyncio.run(send_requests(app, args.requests)))
+
+    results = {}
+    for name, rounds in timings.items():
+        median = statistics.median(rounds)
+        results[name] = RequestResult(
+            requests=args.requests,
+            rounds=args.rounds,
+            median_seconds=round(median, 4),
+            requests_per_second=round(args.requests / median, 1),
+            microseconds_per_request=round(median / args.requests * 1e6, 2),
+        )
+    return results
+
+
+def run(args: argparse.Namespace) -> dict:
+    registry = measure_registry(args)
+    logger.info(
+        "observe %7.1fns/call  render %7.3fms for %d series",
+        registry["observe_ns_per_call"],
+        registry["render_ms"],
+        registry["series"],
+    )
+
+    requests = measure_requests(args)
+    for name, result in requests.items():
+        logger.info(
+            "%-8s middleware %9.1f req/s  %7.2fus/request",
+            name,
+            result.requests_per_second,
+            result.microseconds_per_request,
+        )
+    overhead = (
+        requests["with"].microseconds_per_request
+        - requests["without"].microseconds_per_request
+    )
+    logger.info("Middleware overhead: %.2fus/request", overhead)
+
+    return {
+        **git_revision(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "seed": args.seed,
+        "registry": registry,
+        "requests": {name: asdict(result) for name, result in requests.items()},
+        "overhead_microseconds_per_request": round(overhead, 2),
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.metrics_overhead")
+    parser.add_argument(
+        "--observations",
+        type=int,
+        default=100_000,
+        help="Registry observations per round.",
+    )
+    parser.add_argument(
+        "--routes", type=int, default=30, help="Distinct route templates observed."
+    )
+    parser.add_argument(
+        "--requests", type=int, default=5000, help="Requests per app per round."
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=200, help="Unmeasured requests per app."
+    )
+    parser.add_argument("--rounds", type=int, default=5, help="Timed rounds per mode.")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed.")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here.")
+    return parser
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    logger.setLevel(logging.INFO)
+    args = build_parser().parse_args()
+
+    output = json.dumps(run(args), indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+"""
+Full-text search benchmark: seeds a synthetic corpus of tasks whose titles
+and descriptions draw Zipf-distributed words from a generated vocabulary,
+then times GET /api/v1/tasks/search through the ASGI app for several classes
+of query and reports latency percentiles and hit counts as JSON.
+
+Usage:
+    python -m benchmarks.search [--tasks 1000000] [--rounds 50] [--output FILE]
+    python -m benchmarks.search --reuse   # Search the corpus of a previous run.
+
+Seeding a million tasks takes minutes; --reuse skips it when the database
+already holds a corpus seeded with the same --seed and --vocabulary.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import itertools
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import httpx
+from sqlalchemy import bindparam, func, insert, select, update
+
+from benchmarks.load_test import git_revision, prepare_database
+from benchmarks.seed import DatasetSpec
+
+DEFAULT_DATABASE_URL = (
+    f"sqlite:///{Path(tempfile.gettempdir()) / 'crehana-search-bench.db'}"
+)
+SYLLABLES = [
+    consonant + vowel for consonant in "bcdfghjklmnprstvz" for vowel in "aeiou"
+]
+INSERT_BATCH_SIZE = 20_000
+
+logger = logging.getLogger("benchmarks.search")
+
+
+@dataclass
+class QueryResult:
+    rounds: int
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+    mean_hits: float
+
+
+def build_vocabulary(size: int, rng: random.Random) -> List[str]:
+    """
+    `size` distinct pseudo-words of two to four syllables, most frequent first.
+    """
+    words: Dict[str, None] = {}
+    while len(words) < size:
+        words["".join(rng.choices(SYLLABLES, k=rng.randint(2, 4)))] = None
+    return list(words)
+
+
+class Corpus:
+    """
+    Draws text from a vocabulary with Zipf's law: the word of rank r is
+    used in proportion to 1 / r, like words in natural language.
+    """
+
+    def __init__(self, vocabulary: List[str], rng: random.Random):
+        self.vocabulary = vocabulary
+        self.rng = rng
+        self.cum_weights = list(
+            itertools.accumulate(1 / rank for rank in range(1, len(vocabulary) + 1))
+        )
+
+    def text(self, min_words: int, max_words: int) -> str:
+        count = self.rng.randint(min_words, max_words)
+        return " ".join(
+            self.rng.choices(self.vocabulary, cum_weights=self.cum_weights, k=count)
+        )
+
+
+def query_classes(vocabulary: List[str]) -> Dict[str, Callable[[random.Random], str]]:
+    """
+    Query generators from the most to the least selective.
+    """
+    size = len(vocabulary)
+    return {
+        "rare_word": lambda rng: rng.choice(vocabulary[size // 2 :]),
+        "medium_word": lambda rng: rng.choice(vocabulary[100:1000]),
+        "common_word": lambda rng: rng.choice(vocabulary[:10]),
+        "two_words": lambda rng: " ".join(
+            [rng.choice(vocabulary[:100]), rng.choice(vocabulary[100:1000])]
+        ),
+        "prefix": lambda rng: rng.choice(vocabulary[100:1000])[:3],
+        "no_match": lambda rng: "xqxq" + rng.choice(vocabulary),
+    }
+
+
+async def seed_tasks(
+    connection, board_ids: List[int], count: int, corpus: Corpus
+) -> None:
+    """
+    Insert `count` tasks spread over the boards, in batches, then set the
+    boards' task counters to match.
+    """
+    from app.domain.entities.board import STATUS_COUNTERS, Board
+    from app.domain.entities.task import Task, TaskPriority, TaskStatus
+    from app.utils.datetime import get_current_utc_time
+
+    rng = corpus.rng
+    now = get_current_utc_time()
+    counters: Dict[int, Counter] = defaultdict(Counter)
+    for start in range(0, count, INSERT_BATCH_SIZE):
+        rows = []
+        for index in range(start, min(start + INSERT_BATCH_SIZE, count)):
+            board_id = rng.choice(board_ids)
+            task_status = rng.choice(list(TaskStatus))
+            counters[board_id][task_status] += 1
+            rows.append(
+                {
+                    "title": corpus.text(3, 8)[:100],
+                    "description": (
+                        corpus.text(8, 40)[:500] if rng.random() < 0.8 else None
+                    ),
+                    "status": task_status,
+                    "priority": rng.choice(list(TaskPriority)),
+                    "board_id": board_id,
+                    "asigned_user_id": None,
+                    "created_at": now - timedelta(seconds=count - index),
+                    "updated_at": None,
+                }
+            )
+        await connection.execute(insert(Task), rows)
+        logger.info("Inserted %d of %d tasks.", start + len(rows), count)
+
+    await connection.execute(
+        update(Board)
+        .where(Board.id == bindparam("board_id"))
+        .values(
+            task_count=bindparam("task_count"),
+            **{column: bindparam(column) for column in STATUS_COUNTERS.values()},
+        ),
+        [
+            {
+                "board_id": board_id,
+                "task_count": sum(statuses.values()),
+                **{
+                    column: statuses[task_status]
+                    for task_status, column in STATUS_COUNTERS.items()
+                },
+            }
+            for board_id, statuses in counters.items()
+        ],
+    )
+
+
+async def prepare_corpus(
+    args: argparse.Namespace, corpus: Corpus
+) -> Tuple[Dict[int, str], int]:
+    """
+    Reset and seed the database, or reuse it with --reuse.
+    Returns the seeded users as {id: email} and the number of tasks.
+    """
+    from app.core.database import engine
+    from app.domain.entities.task import Task
+    from app.domain.entities.user import User
+
+    if args.reuse:
+        async with engine.connect() as connection:
+            tasks = await connection.scalar(select(func.count(Task.id)))
+            users = (await connection.execute(select(User.id, User.email))).all()
+        if not tasks:
+            raise ValueError("--reuse needs a database seeded by a previous run.")
+        logger.info("Reusing %d users and %d tasks.", len(users), tasks)
+        return dict(users), tasks
+
+    spec = DatasetSpec(
+        users=args.users,
+        boards_per_user=args.boards_per_user,
+        tasks_per_board=0,
+        collaborators_per_board=args.collaborators_per_board,
+    )
+    started = time.perf_counter()
+    dataset = await prepare_database(spec, corpus.rng)
+    async with engine.begin() as connection:
+        await seed_tasks(
+            connection, [board.id for board in dataset.boards], args.tasks, corpus
+        )
+    logger.info("Seeded %d tasks in %.1fs.", args.tasks, time.perf_counter() - started)
+    return dataset.users, args.tasks
+
+
+async def run_query_class(
+    client: httpx.AsyncClient,
+    make_query: Callable[[random.Random], str],
+    headers: List[Dict[str, str]],
+    rounds: int,
+    limit: int,
+    rng: random.Random,
+) -> QueryResult:
+    latencies, hits = [], []
+    for _ in range(rounds):
+        params = {"q": make_query(rng), "limit": limit}
+        started = time.perf_counter()
+        response = await client.get(
+            "/api/v1/tasks/search", params=params, headers=rng.choice(headers)
+        )
+        latencies.append(time.perf_counter() - started)
+        response.raise_for_status()
+        hits.append(len(response.json()["items"]))
+    latencies.sort()
+    return QueryResult(
+        rounds=rounds,
+        p50_ms=round(statistics.median(latencies) * 1000, 2),
+        p95_ms=round(latencies[int(0.95 * (rounds - 1))] * 1000, 2),
+        max_ms=round(latencies[-1] * 1000, 2),
+        mean_hits=round(statistics.mean(hits), 1),
+    )
+
+
+async def run(args: argparse.Namespace) -> dict:
+    from app.core.settings import settings
+    from app.main import app
+    from app.utils.auth import create_access_token
+
+    rng = random.Random(args.seed)
+    vocabulary = build_vocabulary(args.vocabulary, rng)
+    corpus = Corpus(vocabulary, rng)
+    users, tasks = await prepare_corpus(args, corpus)
+    headers = [
+        {"Authorization": f"Bearer {create_access_token({'sub': email})}"}
+        for email in users.values()
+    ]
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://benchmark"
+        ) as client:
+            for name, make_query in query_classes(vocabulary).items():
+                query_rng = random.Random(f"{args.seed}-{name}")
+                # Warm-up: the first queries also page the index into memory.
+                await run_query_class(
+                    client, make_query, headers, args.warmup, args.limit, query_rng
+                )
+                result = await run_query_class(
+                    client, make_query, headers, args.rounds, args.limit, query_rng
+                )
+                logger.info(
+                    "%-12s p50 %8.2fms  p95 %8.2fms  max %8.2fms  %5.1f hits",
+                    name,
+                    result.p50_ms,
+                    result.p95_ms,
+                    result.max_ms,
+                    result.mean_hits,
+                )
+                results[name] = asdict(result)
+
+    return {
+        **git_revision(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "database": settings.database_url.partition(":")[0],
+        "tasks": tasks,
+        "users": len(users),
+        "vocabulary": args.vocabulary,
+        "seed": args.seed,
+        "limit": args.limit,
+        "queries": results,
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.search")
+    parser.add_argument(
+        "--database-url",
+        default=DEFAULT_DATABASE_URL,
+        help="Database to reset and seed. Never point this at real data.",
+    )
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--boards-per-user", type=int, default=5)
+    parser.add_argument("--collaborators-per-board", type=int, default=2)
+    parser.add_argument(
+        "--vocabulary", type=int, default=20_000, help="Distinct words in the corpus."
+    )
+    parser.add_argument(
+        "--reuse", action="store_true", help="Search the existing corpus."
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=50, help="Measured queries per class."
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=5, help="Unmeasured queries per class."
+    )
+    parser.add_argument("--limit", type=int, default=20, help="Results per page.")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed.")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here.")
+    return parser
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    logger.setLevel(logging.INFO)
+    logging.getLogger("app").setLevel(logging.ERROR)
+    args = build_parser().parse_args()
+
+    # Settings are read when the app is imported, so configure it first.
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault(
+        "SECRET_KEY", "search-benchmark-secret-key-not-for-production"
+    )
+
+    # The app prints to stdout in places; keep stdout for the report.
+    with contextlib.redirect_stdout(sys.stderr):
+        report = asyncio.run(run(args))
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Synthetic dataset for the load tests, written with bulk inserts.
+"""
+
+import random
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Dict, List, Tuple
+
+from passlib.context import CryptContext
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.domain.entities.board import STATUS_COUNTERS, Board
+from app.domain.entities.task import Task, TaskPriority, TaskStatus
+from app.domain.entities.user import User, UserBoardLink
+from app.utils.datetime import get_current_utc_time
+
+PASSWORD = "benchmark-password"
+
+
+@dataclass
+class DatasetSpec:
+    """
+    Size of the seeded dataset.
+    """
+
+    users: int = 50
+    boards_per_user: int = 2
+    tasks_per_board: int = 50
+    collaborators_per_board: int = 2
+
+
+@dataclass
+class SeededBoard:
+    id: int
+    admin_id: int
+    collaborator_ids: List[int]
+
+
+@dataclass
+class Dataset:
+    """
+    IDs of the seeded rows, used to build requests.
+    """
+
+    users: Dict[int, str] = field(default_factory=dict)  # id -> email
+    boards: List[SeededBoard] = field(default_factory=list)
+    tasks: List[Tuple[int, int]] = field(default_factory=list)  # (task_id, board_id)
+
+
+def _user_email(index: int) -> str:
+    return f"bench-user-{index}@example.com"
+
+
+async def _insert_returning_ids(
+    connection: AsyncConnection, model: type, rows: List[dict]
+) -> List[int]:
+    if not rows:
+        return []
+    result = await connection.execute(insert(model).returning(model.id), rows)
+    # IDs are assigned in VALUES order, so sorting restores input order.
+    return sorted(result.scalars().all())
+
+
+async def seed_dataset(
+    connection: AsyncConnection, spec: DatasetSpec, rng: random.Random
+) -> Dataset:
+    """
+    Insert users, boards, collaborator links and tasks described by `spec`.
+    Every user shares one password, so bcrypt runs once instead of per user.
+    """
+    if spec.collaborators_per_board >= spec.users:
+        raise ValueError("collaborators_per_board must be lower than users.")
+
+    dataset = Dataset()
+    now = get_current_utc_time()
+    password = CryptContext(schemes=["bcrypt"]).hash(PASSWORD)
+
+    user_rows = [
+        {
+            "email": _user_email(index),
+            "first_name": "Bench",
+            "last_name": str(index),
+            "password": password,
+            "is_active": True,
+            "created_at": now - timedelta(seconds=spec.users - index),
+        }
+        for index in range(spec.users)
+    ]
+    user_ids = await _insert_returning_ids(connection, User, user_rows)
+    dataset.users = {user_id: row["email"] for user_id, row in zip(user_ids, user_rows)}
+
+    # Statuses are drawn up front so board counters are correct on insert.
+    board_rows, board_statuses, board_collaborators = [], [], []
+    for admin_id in user_ids:
+        others = [user_id for user_id in user_ids if user_id != admin_id]
+        for index in range(spec.boards_per_user):
+            statuses = [
+                rng.choice(list(TaskStatus)) for _ in range(spec.tasks_per_board)
+            ]
+            row = {
+                "name": f"Board {admin_id}-{index}",
+                "admin_id": admin_id,
+                "created_at": now - timedelta(seconds=spec.boards_per_user - index),
+                "task_count": len(statuses),
+                "version": 0,
+            }
+            for task_status, column in STATUS_COUNTERS.items():
+                row[column] = statuses.count(task_status)
+            board_rows.append(row)
+            board_statuses.append(statuses)
+            board_collaborators.append(rng.sample(others, spec.collaborators_per_board))
+    board_ids = await _insert_returning_ids(connection, Board, board_rows)
+
+    link_rows = []
+    task_rows = []
+    for board_id, row, statuses, collaborator_ids in zip(
+        board_ids, board_rows, board_statuses, board_collaborators
+    ):
+        dataset.boards.append(SeededBoard(board_id, row["admin_id"], collaborator_ids))
+        link_rows.extend(
+            {"user_id": user_id, "board_id": board_id} for user_id in collaborator_ids
+        )
+        task_rows.extend(
+            {
+                "title": f"Task {board_id}-{index}",
+                "description": f"Synthetic task {index} of board {board_id}.",
+                "status": task_status,
+                "priority": rng.choice(list(TaskPriority)),
+                "board_id": board_id,
+                "asigned_user_id": None,
+                "created_at": now - timedelta(seconds=len(statuses) - index),
+                "updated_at": None,
+            }
+            for index, task_status in enumerate(statuses)
+        )
+    if link_rows:
+        await connection.execute(insert(UserBoardLink), link_rows)
+    task_ids = await _insert_returning_ids(connection, Task, task_rows)
+    dataset.tasks = [
+        (task_id, row["board_id"]) for task_id, row in zip(task_ids, task_rows)
+    ]
+    return dataset
@@ -0,0 +1,270 @@
+"""
+Task import benchmark: generates NDJSON and CSV files of synthetic tasks
+and streams them to POST /api/v1/boards/{board_id}/tasks/import, reporting
+rows per second for parsing alone and for the whole import, and the peak
+Python memory of the import at each file size, as JSON.
+
+Usage:
+    python -m benchmarks.task_import [--rows 10000 100000] [--output FILE]
+
+Bodies are generated chunk by chunk, so the benchmark itself never holds a
+whole file; a peak that stays flat as --rows grows shows the import does not
+either.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import csv
+import io
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import AsyncIterator, Callable, Dict, Iterator
+
+import httpx
+
+from benchmarks.load_test import git_revision, prepare_database
+from benchmarks.seed import DatasetSpec
+
+DEFAULT_DATABASE_URL = (
+    f"sqlite:///{Path(tempfile.gettempdir()) / 'crehana-import-bench.db'}"
+)
+CHUNK_SIZE = 64 * 1024
+STATUSES = ["TODO", "IN_PROGRESS", "DONE"]
+PRIORITIES = ["LOW", "MEDIUM", "HIGH"]
+
+logger = logging.getLogger("benchmarks.task_import")
+
+
+@dataclass
+class ImportResult:
+    rows: int
+    bytes: int
+    parse_rows_per_second: float
+    import_seconds: float
+    import_rows_per_second: float
+    imported: int
+    rejected: int
+    peak_memory_mib: float
+
+
+def generate_rows(count: int, seed: int) -> Iterator[Dict[str, str]]:
+    rng = random.Random(seed)
+    for index in range(count):
+        # Commas and quotes in some descriptions exercise CSV quoting.
+        description = f"Imported task {index}"
+        if index % 3 == 0:
+            description += ', with a "quoted" remark'
+        yield {
+            "title": f"Task {index}",
+            "description": description,
+            "status": rng.choice(STATUSES),
+            "priority": rng.choice(PRIORITIES),
+        }
+
+
+def encode_ndjson(rows: Iterator[Dict[str, str]]) -> Iterator[str]:
+    for row in rows:
+        yield json.dumps(row) + "\n"
+
+
+def encode_csv(rows: Iterator[Dict[str, str]]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(
+        buffer, fieldnames=["title", "description", "status", "priority"]
+    )
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+ENCODERS: Dict[str, Callable[[Iterator[Dict[str, str]]], Iterator[str]]] = {
+    "ndjson": encode_ndjson,
+    "csv": encode_csv,
+}
+
+
+def body_size(file_format: str, rows: int, seed: int) -> int:
+    encode = ENCODERS[file_format]
+    return sum(len(text.encode()) for text in encode(generate_rows(rows, seed)))
+
+
+async def body_chunks(file_format: str, rows: int, seed: int) -> AsyncIterator[bytes]:
+    """
+    The file as the client would upload it, in CHUNK_SIZE pieces.
+    """
+    pending = bytearray()
+    for text in ENCODERS[file_format](generate_rows(rows, seed)):
+        pending += text.encode()
+        if len(pending) >= CHUNK_SIZE:
+            yield bytes(pending)
+            pending.clear()
+    if pending:
+        yield bytes(pending)
+
+
+async def parse_rate(file_format: str, rows: int, seed: int) -> float:
+    from app.domain.entities.task import TaskFileFormat
+    from app.utils.task_import import parse_records
+
+    started = time.perf_counter()
+    parsed = 0
+    chunks = body_chunks(file_format, rows, seed)
+    async for _ in parse_records(chunks, TaskFileFormat(file_format)):
+        parsed += 1
+    if parsed != rows:
+        raise AssertionError(f"Parsed {parsed} {file_format} records, not {rows}.")
+    return rows / (time.perf_counter() - started)
+
+
+async def upload(
+    client: httpx.AsyncClient,
+    board_id: int,
+    headers: Dict[str, str],
+    file_format: str,
+    rows: int,
+    seed: int,
+) -> dict:
+    response = await client.post(
+        f"/api/v1/boards/{board_id}/tasks/import",
+        params={"format": file_format},
+        content=body_chunks(file_format, rows, seed),
+        headers=headers,
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+async def run(args: argparse.Namespace) -> dict:
+    from app.core.settings import settings
+    from app.main import app
+    from app.utils.auth import create_access_token
+
+    spec = DatasetSpec(
+        users=2, boards_per_user=1, tasks_per_board=0, collaborators_per_board=1
+    )
+    dataset = await prepare_database(spec, random.Random(args.seed))
+    board = dataset.boards[0]
+    email = dataset.users[board.admin_id]
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': email})}"}
+
+    results: Dict[str, Dict[str, dict]] = {}
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://benchmark", timeout=None
+        ) as client:
+            for file_format in args.format:
+                results[file_format] = {}
+                for rows in args.rows:
+                    parse_rows_per_second = await parse_rate(
+                        file_format, rows, args.seed
+                    )
+
+                    started = time.perf_counter()
+                    report = await upload(
+                        client, board.id, headers, file_format, rows, args.seed
+                    )
+                    import_seconds = time.perf_counter() - started
+
+                    # Measured apart from the timed import, which tracing
+                    # would slow down.
+                    tracemalloc.start()
+                    await upload(
+                        client, board.id, headers, file_format, rows, args.seed
+                    )
+                    _, peak = tracemalloc.get_traced_memory()
+                    tracemalloc.stop()
+
+                    result = ImportResult(
+                        rows=rows,
+                        bytes=body_size(file_format, rows, args.seed),
+                        parse_rows_per_second=round(parse_rows_per_second, 1),
+                        import_seconds=round(import_seconds, 3),
+                        import_rows_per_second=round(rows / import_seconds, 1),
+                        imported=report["imported"],
+                        rejected=report["rejected"],
+                        peak_memory_mib=round(peak / 2**20, 2),
+                    )
+                    logger.info(
+                        "%-6s %8d rows  parse %10.1f rows/s  "
+                        "import %9.1f rows/s  %7.2f MiB peak",
+                        file_format,
+                        rows,
+                        result.parse_rows_per_second,
+                        result.import_rows_per_second,
+                        result.peak_memory_mib,
+                    )
+                    results[file_format][str(rows)] = asdict(result)
+
+    return {
+        **git_revision(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "database": settings.database_url.partition(":")[0],
+        "seed": args.seed,
+        "chunk_size": CHUNK_SIZE,
+        "formats": results,
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.task_import")
+    parser.add_argument(
+        "--database-url",
+        default=DEFAULT_DATABASE_URL,
+        help="Database to reset and seed. Never point this at real data.",
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000],
+        help="File sizes to import, in rows.",
+    )
+    parser.add_argument(
+        "--format", nargs="+", choices=list(ENCODERS), default=list(ENCODERS)
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Random seed.")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here.")
+    return parser
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    logger.setLevel(logging.INFO)
+    logging.getLogger("app").setLevel(logging.ERROR)
+    args = build_parser().parse_args()
+
+    # Settings are read when the app is imported, so configure it first.
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault(
+        "SECRET_KEY", "import-benchmark-secret-key-not-for-production"
+    )
+
+    # The app prints to stdout in places; keep stdout for the report.
+    with contextlib.redirect_stdout(sys.stderr):
+        report = asyncio.run(run(args))
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
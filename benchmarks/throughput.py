@@ -0,0 +1,204 @@
+"""
+Concurrent throughput benchmark: seeds the load test dataset once, then
+runs the read scenarios at increasing numbers of concurrent clients and
+reports requests per second at each level as JSON.
+
+Usage:
+    python -m benchmarks.throughput [--concurrency 1 10 50 100] [--output FILE]
+    python -m benchmarks.throughput --baseline previous.json
+
+It needs the seeding and migrations of the current tree, so --baseline
+compares runs of this tree only. The default SQLite file has no round trips
+to overlap, so it is CPU bound after a few clients; point --database-url at
+a local PostgreSQL database for a meaningful sweep. To compare against
+checkouts from before the async engine, use benchmarks.db_latency.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import time
+from dataclasses import asdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+
+from benchmarks.load_test import (
+    DEFAULT_DATABASE_URL,
+    Workload,
+    git_revision,
+    prepare_database,
+    run_scenario,
+    send_requests,
+)
+from benchmarks.seed import DatasetSpec
+
+# Scenarios that leave the dataset unchanged, so every level sees the same.
+READ_SCENARIOS = ["board_list", "board_detail", "task_detail"]
+
+logger = logging.getLogger("benchmarks.throughput")
+
+
+async def run(args: argparse.Namespace) -> dict:
+    from app.core.settings import settings
+    from app.main import app
+    from app.utils.auth import create_access_token
+
+    rng = random.Random(args.seed)
+    spec = DatasetSpec(
+        users=args.users,
+        boards_per_user=args.boards_per_user,
+        tasks_per_board=args.tasks_per_board,
+        collaborators_per_board=args.collaborators_per_board,
+    )
+    seed_started = time.perf_counter()
+    dataset = await prepare_database(spec, rng)
+    logger.info(
+        "Seeded %d boards and %d tasks in %.2fs.",
+        len(dataset.boards),
+        len(dataset.tasks),
+        time.perf_counter() - seed_started,
+    )
+    tokens = {
+        user_id: create_access_token({"sub": email})
+        for user_id, email in dataset.users.items()
+    }
+    workload = Workload(dataset, tokens, rng)
+
+    levels = {}
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://benchmark"
+        ) as client:
+            for concurrency in args.concurrency:
+                results = {}
+                for name in args.scenario or READ_SCENARIOS:
+                    make_request = getattr(workload, name)
+                    if args.warmup:
+                        await send_requests(
+                            client, make_request, args.warmup, concurrency
+                        )
+                    result = await run_scenario(
+                        client, make_request, args.requests, concurrency
+                    )
+                    logger.info(
+                        "%4d clients  %-13s %8.1f req/s  p95 %8.2fms",
+                        concurrency,
+                        name,
+                        result.requests_per_second,
+                        result.p95_ms,
+                    )
+                    results[name] = asdict(result)
+                levels[str(concurrency)] = results
+
+    return {
+        **git_revision(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "database": settings.database_url.partition(":")[0],
+        "board_cache_backend": settings.board_cache_backend,
+        "dataset": asdict(spec),
+        "seed": args.seed,
+        "requests_per_scenario": args.requests,
+        "warmup_requests": args.warmup,
+        "levels": levels,
+    }
+
+
+def compare(report: dict, baseline: dict) -> None:
+    """
+    Log the change in requests per second at each level against a
+    previous report.
+    """
+    logger.info("Against %s:", (baseline.get("commit") or "baseline")[:12])
+    for concurrency, results in report["levels"].items():
+        previous_level = baseline.get("levels", {}).get(concurrency, {})
+        for name, result in results.items():
+            previous = previous_level.get(name)
+            if not previous or not previous["requests_per_second"]:
+                continue
+            change = result["requests_per_second"] / previous["requests_per_second"]
+            logger.info(
+                "%4s clients  %-13s %+6.1f%% req/s",
+                concurrency,
+                name,
+                (change - 1) * 100,
+            )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.throughput")
+    parser.add_argument(
+        "--database-url",
+        default=DEFAULT_DATABASE_URL,
+        help="Database to reset and seed. Never point this at real data.",
+    )
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--boards-per-user", type=int, default=2)
+    parser.add_argument("--tasks-per-board", type=int, default=50)
+    parser.add_argument("--collaborators-per-board", type=int, default=2)
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[1, 10, 50, 100],
+        help="Numbers of concurrent clients to run each scenario with.",
+    )
+    parser.add_argument(
+        "--requests", type=int, default=500, help="Measured requests per scenario."
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=20, help="Unmeasured requests per scenario."
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=READ_SCENARIOS,
+        help="Only run this scenario (repeatable). Defaults to all.",
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Random seed.")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here.")
+    parser.add_argument(
+        "--baseline", type=Path, help="Previous JSON report to compare against."
+    )
+    return parser
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    logger.setLevel(logging.INFO)
+    logging.getLogger("app").setLevel(logging.ERROR)
+    parser = build_parser()
+    args = parser.parse_args()
+    if args.requests < 1 or args.warmup < 0:
+        parser.error("--requests must be at least 1 and --warmup at least 0.")
+
+    # Settings are read when the app is imported, so configure it first.
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault(
+        "SECRET_KEY", "throughput-benchmark-secret-key-not-for-production"
+    )
+
+    # The app prints to stdout in places; keep stdout for the report.
+    with contextlib.redirect_stdout(sys.stderr):
+        report = asyncio.run(run(args))
+
+    if args.baseline:
+        compare(report, json.loads(args.baseline.read_text()))
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
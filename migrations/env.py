@@ -0,0 +1,88 @@
+import asyncio
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+
+from app.core.database import DATABASE_URL
+
+# Import all models to ensure they are registered with SQLModel
+from app.domain.entities.board import Board  # noqa: F401
+from app.domain.entities.task import Task  # noqa: F401
+from app.domain.entities.user import User  # noqa: F401
+
+config = context.config
+
+# Only the alembic CLI configures logging; the application keeps its own.
+if config.config_file_name is not None and "connection" not in config.attributes:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = SQLModel.metadata
+
+# Full-text search objects created by migration 0006, not by the models.
+SEARCH_OBJECTS = ("task_fts", "search_vector", "ix_task_search_vector")
+
+
+def include_object(object, name, type_, reflected, compare_to) -> bool:
+    """
+    Keep autogenerate from dropping the full-text search objects.
+    """
+    if reflected and compare_to is None:
+        return not name.startswith(SEARCH_OBJECTS)
+    return True
+
+
+def run_migrations_offline() -> None:
+    """
+    Emit the migration SQL to stdout without connecting to the database.
+    """
+    context.configure(
+        url=DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=DATABASE_URL.startswith("sqlite"),
+        include_object=include_object,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=connection.dialect.name == "sqlite",
+        include_object=include_object,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    engine = create_async_engine(DATABASE_URL)
+    async with engine.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+    await engine.dispose()
+
+
+def run_migrations_online() -> None:
+    """
+    Run migrations on the connection handed over by the application,
+    or on a new async engine when invoked from the alembic CLI.
+    """
+    connection = config.attributes.get("connection")
+    if connection is None:
+        asyncio.run(run_async_migrations())
+    else:
+        do_run_migrations(connection)
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
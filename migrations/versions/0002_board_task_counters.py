@@ -0,0 +1,47 @@
+"""board task counters
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 12:10:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTERS = {
+    "task_count": "",
+    "todo_count": "AND task.status = 'TODO'",
+    "in_progress_count": "AND task.status = 'IN_PROGRESS'",
+    "done_count": "AND task.status = 'DONE'",
+}
+
+
+def upgrade() -> None:
+    for column in COUNTERS:
+        op.add_column(
+            "board",
+            sa.Column(column, sa.Integer(), nullable=False, server_default="0"),
+        )
+
+    # Backfill from the existing tasks, same as `app.cli repair-board-counters`.
+    assignments = ", ".join(
+        f"{column} = (SELECT count(*) FROM task "
+        f"WHERE task.board_id = board.id {criteria})"
+        for column, criteria in COUNTERS.items()
+    )
+    op.execute(f"UPDATE board SET {assignments}")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("board") as batch_op:
+        for column in reversed(list(COUNTERS)):
+            batch_op.drop_column(column)
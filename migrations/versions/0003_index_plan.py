@@ -0,0 +1,66 @@
+"""index plan for hot lookups
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 12:20:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def check_unique_emails() -> None:
+    """
+    Refuse to upgrade while two users share an email. They cannot be merged
+    here: each may own boards and tasks, so the operator has to decide.
+    """
+    duplicates = op.get_bind().execute(
+        sa.text(
+            'SELECT email, count(*) FROM "user" GROUP BY email '
+            "HAVING count(*) > 1 ORDER BY email LIMIT 10"
+        )
+    )
+    emails = [f"{email} ({count} users)" for email, count in duplicates]
+    if emails:
+        raise RuntimeError(
+            "Cannot create the unique index on user.email: these emails belong "
+            f"to more than one user: {', '.join(emails)}. Rename or remove the "
+            "duplicates, then run `python -m app.cli migrate` again."
+        )
+
+
+def upgrade() -> None:
+    # Authentication resolves the user by email on every request. Emails
+    # were not unique before this revision, so duplicates stop the upgrade.
+    check_unique_emails()
+    op.create_index("ix_user_email", "user", ["email"], unique=True)
+    op.create_index("ix_user_created_at_id", "user", ["created_at", "id"])
+    # Leading admin_id also serves plain "boards of this admin" lookups.
+    op.create_index(
+        "ix_board_admin_id_created_at_id", "board", ["admin_id", "created_at", "id"]
+    )
+    # Leading board_id also serves plain "tasks of this board" lookups.
+    op.create_index(
+        "ix_task_board_id_status_priority", "task", ["board_id", "status", "priority"]
+    )
+    op.create_index("ix_task_asigned_user_id", "task", ["asigned_user_id"])
+    # The primary key leads with user_id, so board_id needs its own index.
+    op.create_index("ix_userboardlink_board_id", "userboardlink", ["board_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_userboardlink_board_id", table_name="userboardlink")
+    op.drop_index("ix_task_asigned_user_id", table_name="task")
+    op.drop_index("ix_task_board_id_status_priority", table_name="task")
+    op.drop_index("ix_board_admin_id_created_at_id", table_name="board")
+    op.drop_index("ix_user_created_at_id", table_name="user")
+    op.drop_index("ix_user_email", table_name="user")
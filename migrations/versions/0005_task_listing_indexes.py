@@ -0,0 +1,50 @@
+"""task listing indexes
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match TASK_STATUS_RANK and TASK_PRIORITY_RANK for queries to use them.
+STATUS_RANK = (
+    "(CASE WHEN (status = 'TODO') THEN 0 WHEN (status = 'IN_PROGRESS') THEN 1 "
+    "WHEN (status = 'DONE') THEN 2 END)"
+)
+PRIORITY_RANK = (
+    "(CASE WHEN (priority = 'LOW') THEN 0 WHEN (priority = 'MEDIUM') THEN 1 "
+    "WHEN (priority = 'HIGH') THEN 2 END)"
+)
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_task_board_id_created_at_id", "task", ["board_id", "created_at", "id"]
+    )
+    op.create_index(
+        "ix_task_board_id_status_rank_id",
+        "task",
+        ["board_id", sa.text(STATUS_RANK), "id"],
+    )
+    op.create_index(
+        "ix_task_board_id_priority_rank_id",
+        "task",
+        ["board_id", sa.text(PRIORITY_RANK), "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_board_id_priority_rank_id", table_name="task")
+    op.drop_index("ix_task_board_id_status_rank_id", table_name="task")
+    op.drop_index("ix_task_board_id_created_at_id", table_name="task")
@@ -0,0 +1,75 @@
+"""task search
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match TASK_SEARCH_CONFIG and the column list of task_fts.
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+)
+
+SQLITE_UPGRADE = [
+    # External content table: the index stores no copy of the text.
+    "CREATE VIRTUAL TABLE task_fts USING fts5("
+    "title, description, content='task', content_rowid='id')",
+    "CREATE TRIGGER task_fts_insert AFTER INSERT ON task BEGIN "
+    "INSERT INTO task_fts(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER task_fts_delete AFTER DELETE ON task BEGIN "
+    "INSERT INTO task_fts(task_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); END",
+    # Status, priority and assignment changes leave the index alone.
+    "CREATE TRIGGER task_fts_update AFTER UPDATE OF title, description ON task "
+    "BEGIN "
+    "INSERT INTO task_fts(task_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO task_fts(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+    "INSERT INTO task_fts(task_fts) VALUES ('rebuild')",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER task_fts_update",
+    "DROP TRIGGER task_fts_delete",
+    "DROP TRIGGER task_fts_insert",
+    "DROP TABLE task_fts",
+]
+
+POSTGRESQL_UPGRADE = [
+    f"ALTER TABLE task ADD COLUMN search_vector tsvector "
+    f"GENERATED ALWAYS AS ({SEARCH_VECTOR}) STORED",
+    "CREATE INDEX ix_task_search_vector ON task USING gin (search_vector)",
+]
+
+POSTGRESQL_DOWNGRADE = [
+    "DROP INDEX ix_task_search_vector",
+    "ALTER TABLE task DROP COLUMN search_vector",
+]
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    statements = SQLITE_UPGRADE if dialect == "sqlite" else POSTGRESQL_UPGRADE
+    for statement in statements:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    statements = SQLITE_DOWNGRADE if dialect == "sqlite" else POSTGRESQL_DOWNGRADE
+    for statement in statements:
+        op.execute(statement)
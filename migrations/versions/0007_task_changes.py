@@ -0,0 +1,51 @@
+"""task changes
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match TASK_CHANGED_AT for queries to use the index.
+CHANGED_AT = "(coalesce(updated_at, created_at))"
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_task_board_id_changed_at_id",
+        "task",
+        ["board_id", sa.text(CHANGED_AT), "id"],
+    )
+    op.create_table(
+        "tasktombstone",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("task_id", sa.Integer(), nullable=False),
+        sa.Column("board_id", sa.Integer(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["board_id"], ["board.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_tasktombstone_board_id_deleted_at_task_id",
+        "tasktombstone",
+        ["board_id", "deleted_at", "task_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_tasktombstone_board_id_deleted_at_task_id", table_name="tasktombstone"
+    )
+    op.drop_table("tasktombstone")
+    op.drop_index("ix_task_board_id_changed_at_id", table_name="task")
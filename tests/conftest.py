@@ -0,0 +1,38 @@
+import os
+import tempfile
+import uuid
+from pathlib import Path
+
+import pytest
+
+# Settings are read when the app is imported, so configure it first: a
+# scratch SQLite database that each test session starts from empty.
+DATABASE_PATH = Path(tempfile.mkdtemp(prefix="crehana-tests-")) / "test.db"
+os.environ["DATABASE_URL"] = f"sqlite:///{DATABASE_PATH}"
+os.environ.setdefault("SECRET_KEY", "test-secret-key-not-for-production")
+
+
+@pytest.fixture(scope="session")
+def client():
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def auth_headers(client):
+    """
+    Register a fresh user and return its bearer token header.
+    """
+    email = f"{uuid.uuid4().hex}@example.com"
+    client.post(
+        "/api/v1/auth/register", json={"email": email, "password": "password"}
+    ).raise_for_status()
+    response = client.post(
+        "/api/v1/auth/login", data={"username": email, "password": "password"}
+    )
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
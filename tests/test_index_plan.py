@@ -0,0 +1,154 @@
+"""
+The hot lookups must stay index searches. Each case runs a repository call
+on a SQLite database migrated to head and reads EXPLAIN QUERY PLAN for the
+statements it issued.
+"""
+
+import asyncio
+from datetime import timedelta
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+import pytest
+from sqlalchemy import event
+
+from app.core.database import async_session, engine, migrate_db
+from app.domain.entities.board import Board
+from app.domain.entities.task import (
+    SortOrder,
+    Task,
+    TaskSortField,
+    TaskStatus,
+    TaskTombstone,
+)
+from app.domain.entities.user import User, UserBoardLink
+from app.infrastructure.repositories.board_repository import BoardRepository
+from app.infrastructure.repositories.task_repository import TaskRepository
+from app.infrastructure.repositories.user_repository import UserRepository
+from app.utils.datetime import get_current_utc_time
+
+NOW = get_current_utc_time()
+AFTER = (NOW - timedelta(days=1), 1)
+
+# Lookup name: (repository call, index that must serve it).
+HOT_LOOKUPS: Dict[str, Tuple[Callable[..., Awaitable], str]] = {
+    "user by email": (
+        lambda session: UserRepository(session).get_user_by_email("a@example.com"),
+        "ix_user_email",
+    ),
+    "users page": (
+        lambda session: UserRepository(session).get_all(after=AFTER),
+        "ix_user_created_at_id",
+    ),
+    "boards page": (
+        lambda session: BoardRepository(session).get_all(admin_id=1, after=AFTER),
+        "ix_board_admin_id_created_at_id",
+    ),
+    "board detail tasks": (
+        lambda session: BoardRepository(session).get_by_id(
+            1, admin_id=1, status="TODO"
+        ),
+        "ix_task_board_id_status_priority",
+    ),
+    "board detail capped tasks": (
+        lambda session: BoardRepository(session).get_by_id(
+            1, admin_id=1, task_limit=10
+        ),
+        "ix_task_board_id_created_at_id",
+    ),
+    "collaborators": (
+        lambda session: BoardRepository(session).count_collaborators(1),
+        "ix_userboardlink_board_id",
+    ),
+    "tasks by created_at": (
+        lambda session: TaskRepository(session).list_by_board(1, limit=50, after=AFTER),
+        "ix_task_board_id_created_at_id",
+    ),
+    "tasks by status": (
+        lambda session: TaskRepository(session).list_by_board(
+            1, limit=50, sort=TaskSortField.STATUS, after=(1, 1)
+        ),
+        "ix_task_board_id_status_rank_id",
+    ),
+    "tasks by priority, descending": (
+        lambda session: TaskRepository(session).list_by_board(
+            1,
+            limit=50,
+            sort=TaskSortField.PRIORITY,
+            order=SortOrder.DESC,
+            after=(1, 1),
+        ),
+        "ix_task_board_id_priority_rank_id",
+    ),
+    "changed tasks": (
+        lambda session: TaskRepository(session).list_changes(1, limit=50, after=AFTER),
+        "ix_task_board_id_changed_at_id",
+    ),
+    "deleted tasks": (
+        lambda session: TaskRepository(session).list_changes(1, limit=50, after=AFTER),
+        "ix_tasktombstone_board_id_deleted_at_task_id",
+    ),
+}
+
+
+async def _seed() -> None:
+    async with async_session() as session:
+        session.add_all(
+            [
+                User(email="a@example.com", password="x"),
+                User(email="b@example.com", password="x"),
+                Board(name="board", admin_id=1),
+                UserBoardLink(user_id=2, board_id=1),
+                Task(title="task", board_id=1, status=TaskStatus.TODO),
+                TaskTombstone(task_id=2, board_id=1),
+            ]
+        )
+        await session.commit()
+
+
+async def _query_plans() -> Dict[str, List[str]]:
+    """
+    Plan of every SELECT issued by each lookup, one line per plan step.
+    """
+    await migrate_db()
+    await _seed()
+    statements: List[Tuple[str, tuple]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    plans = {}
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        for name, (lookup, _) in HOT_LOOKUPS.items():
+            statements.clear()
+            async with async_session() as session:
+                await lookup(session)
+            issued = list(statements)
+            async with engine.connect() as connection:
+                plans[name] = [
+                    row.detail
+                    for statement, parameters in issued
+                    for row in await connection.exec_driver_sql(
+                        f"EXPLAIN QUERY PLAN {statement}", parameters
+                    )
+                ]
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+        await engine.dispose()
+    return plans
+
+
+@pytest.fixture(scope="module")
+def query_plans() -> Dict[str, List[str]]:
+    return asyncio.run(_query_plans())
+
+
+@pytest.mark.parametrize("name", HOT_LOOKUPS)
+def test_hot_lookup_uses_index(name: str, query_plans: Dict[str, List[str]]):
+    index = HOT_LOOKUPS[name][1]
+    steps = query_plans[name]
+    assert any(
+        step.startswith("SEARCH ") and f" INDEX {index} " in f"{step} "
+        for step in steps
+    ), f"{name} does not search {index}:\n" + "\n".join(steps)
@@ -0,0 +1,37 @@
+"""
+Internal endpoints are only mounted when enabled, and then only answer
+signed-in users.
+"""
+
+import importlib
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import app.core.api
+from app.core.settings import settings
+
+
+@pytest.fixture
+def internal_client(monkeypatch):
+    monkeypatch.setattr(settings, "internal_endpoints_enabled", True)
+    api = importlib.reload(app.core.api)
+    enabled = FastAPI()
+    enabled.include_router(api.api_router)
+    yield TestClient(enabled)
+    monkeypatch.undo()
+    importlib.reload(app.core.api)
+
+
+def test_pool_is_not_mounted_by_default(client, auth_headers):
+    response = client.get("/api/v1/internal/pool", headers=auth_headers)
+    assert response.status_code == 404
+
+
+def test_pool_requires_a_signed_in_user(internal_client, auth_headers):
+    assert internal_client.get("/api/v1/internal/pool").status_code == 401
+
+    response = internal_client.get("/api/v1/internal/pool", headers=auth_headers)
+    assert response.status_code == 200
+    assert "checked_out" in response.json()
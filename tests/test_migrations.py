@@ -0,0 +1,46 @@
+"""
+Upgrades of existing databases: revision 0003 refuses to make user.email
+unique while duplicates exist.
+"""
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.core.database import _upgrade
+
+INSERT_USER = text(
+    'INSERT INTO "user" (email, password, is_active, created_at) '
+    "VALUES (:email, 'hash', 1, '2026-01-01 00:00:00')"
+)
+
+
+@pytest.fixture
+def database(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'upgrade.db'}")
+    yield engine
+    engine.dispose()
+
+
+def test_duplicate_emails_stop_the_unique_index(database):
+    with database.begin() as connection:
+        _upgrade(connection, "0002")
+        for email in ("a@example.com", "a@example.com", "b@example.com"):
+            connection.execute(INSERT_USER, {"email": email})
+
+    with pytest.raises(RuntimeError, match=r"a@example\.com \(2 users\)"):
+        with database.begin() as connection:
+            _upgrade(connection, "head")
+
+    with database.connect() as connection:
+        version = connection.execute(text("SELECT version_num FROM alembic_version"))
+        assert version.scalar() == "0002"
+
+
+def test_unique_emails_upgrade_to_head(database):
+    with database.begin() as connection:
+        _upgrade(connection, "0002")
+        for email in ("a@example.com", "b@example.com"):
+            connection.execute(INSERT_USER, {"email": email})
+
+    with database.begin() as connection:
+        _upgrade(connection, "head")
@@ -0,0 +1,33 @@
+"""
+Listing pages: limits are validated and the next cursor is only offered
+when a full page came back.
+"""
+
+import pytest
+
+
+@pytest.mark.parametrize("url", ["/api/v1/boards/", "/api/v1/users/"])
+def test_zero_limit_is_rejected(client, auth_headers, url):
+    response = client.get(url, params={"limit": 0}, headers=auth_headers)
+    assert response.status_code == 422
+
+
+def test_next_cursor_pages_through_boards(client, auth_headers):
+    for name in ("first", "second", "third"):
+        client.post(
+            "/api/v1/boards/", json={"name": name}, headers=auth_headers
+        ).raise_for_status()
+
+    page = client.get(
+        "/api/v1/boards/", params={"limit": 2}, headers=auth_headers
+    ).json()
+    assert len(page["items"]) == 2
+    assert page["next_cursor"]
+
+    page = client.get(
+        "/api/v1/boards/",
+        params={"limit": 2, "cursor": page["next_cursor"]},
+        headers=auth_headers,
+    ).json()
+    assert len(page["items"]) == 1
+    assert page["next_cursor"] is None
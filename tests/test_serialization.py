@@ -0,0 +1,107 @@
+"""
+Serialization benchmarks: rendering a board with many tasks as the board
+detail response, through FastAPI's response_model path (with the stdlib and
+orjson encoders) and through model_response, which validates once.
+
+Timing is off in plain test runs: only the smallest board is built, and
+each renderer renders it once to check they agree. Time every size with:
+
+    pytest tests/test_serialization.py --benchmark-enable
+"""
+
+import asyncio
+import json
+from typing import Callable, Dict
+
+import pytest
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from app.domain.entities.board import Board, BoardWithTasks
+from app.domain.entities.task import Task, TaskPriority, TaskStatus
+from app.domain.entities.user import User
+from app.main import app
+from app.utils.datetime import get_current_utc_time
+from app.utils.rendering import model_response
+
+SIZES = [1_000, 10_000, 50_000]
+
+
+def build_board(task_count: int) -> Board:
+    """
+    In-memory board with `task_count` tasks and a few collaborators, shaped
+    like one loaded by BoardRepository.get_by_id.
+    """
+    now = get_current_utc_time()
+    statuses, priorities = list(TaskStatus), list(TaskPriority)
+    board = Board(
+        id=1,
+        name="Benchmark board",
+        admin_id=1,
+        created_at=now,
+        updated_at=now,
+        task_count=task_count,
+        done_count=task_count // len(statuses),
+    )
+    board.collaborators = [
+        User(id=index, email=f"user{index}@example.com", password="", created_at=now)
+        for index in range(1, 4)
+    ]
+    board.tasks = [
+        Task(
+            id=index,
+            title=f"Task {index}",
+            description=f"Description of synthetic task number {index}.",
+            status=statuses[index % len(statuses)],
+            priority=priorities[index % len(priorities)],
+            board_id=1,
+            asigned_user_id=index % 3 or None,
+            created_at=now,
+            updated_at=now if index % 2 else None,
+        )
+        for index in range(task_count)
+    ]
+    return board
+
+
+def _fastapi_serialize(board: Board) -> dict:
+    # What a route returning a validated model goes through: FastAPI
+    # validates it again against response_model and dumps it to a dict.
+    route = next(
+        route
+        for route in app.routes
+        if isinstance(route, APIRoute) and route.path == "/api/v1/boards/{board_id}"
+    )
+    return asyncio.run(
+        serialize_response(
+            field=route.secure_cloned_response_field,
+            response_content=BoardWithTasks.model_validate(board),
+        )
+    )
+
+
+RENDERERS: Dict[str, Callable[[Board], bytes]] = {
+    "fastapi_json": lambda board: JSONResponse(_fastapi_serialize(board)).body,
+    "fastapi_orjson": lambda board: ORJSONResponse(_fastapi_serialize(board)).body,
+    "model_response": lambda board: model_response(BoardWithTasks, board).body,
+}
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=lambda size: f"{size}_tasks")
+def board(request) -> Board:
+    timed = request.config.getoption("benchmark_enable") or not (
+        request.config.getoption("benchmark_disable")
+    )
+    if request.param > SIZES[0] and not timed:
+        pytest.skip("Larger boards are only built with --benchmark-enable.")
+    return build_board(request.param)
+
+
+@pytest.mark.parametrize("renderer", RENDERERS)
+def test_render_board(benchmark, board, renderer):
+    benchmark.group = f"{len(board.tasks)} tasks"
+    body = benchmark.pedantic(
+        RENDERERS[renderer], args=(board,), rounds=5, warmup_rounds=1
+    )
+    expected = RENDERERS["model_response"](board)
+    assert json.loads(body) == json.loads(expected)
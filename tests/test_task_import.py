@@ -0,0 +1,82 @@
+"""
+Streamed task imports: CSV and NDJSON rows are read the same way, and no
+line is buffered past MAX_RECORD_SIZE.
+"""
+
+import asyncio
+from typing import AsyncIterator, List
+
+from app.domain.entities.task import TaskFileFormat
+from app.utils.task_import import MAX_RECORD_SIZE, OVERLONG_LINE, parse_records
+
+
+async def _chunks(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+def _parse(file_format: TaskFileFormat, *chunks: bytes) -> List[tuple]:
+    async def collect() -> List[tuple]:
+        return [record async for record in parse_records(_chunks(*chunks), file_format)]
+
+    return asyncio.run(collect())
+
+
+def test_blank_csv_cells_are_null():
+    records = _parse(TaskFileFormat.CSV, b"title,description,status,priority\nA,,,\n")
+    assert records == [
+        (1, {"title": "A", "description": None, "status": None, "priority": None})
+    ]
+
+
+def test_overlong_ndjson_line_is_a_row_error():
+    # Sent in pieces, as a client would, none of which ends the line.
+    piece = b"x" * (MAX_RECORD_SIZE // 4)
+    records = _parse(
+        TaskFileFormat.NDJSON,
+        b'{"title": "A"}\n{"title": "',
+        *[piece] * 5,
+        b'"}\n{"title": "B"}\n',
+    )
+    assert records == [
+        (1, {"title": "A"}),
+        (2, OVERLONG_LINE),
+        (3, {"title": "B"}),
+    ]
+
+
+def test_overlong_csv_line_ends_the_import():
+    piece = b"x" * (MAX_RECORD_SIZE // 4)
+    records = _parse(TaskFileFormat.CSV, b"title\nA\n", *[piece] * 5, b"\nB\n")
+    assert records == [(1, {"title": "A"}), (2, OVERLONG_LINE)]
+
+
+def test_csv_with_blank_optional_columns_imports(client, auth_headers):
+    board = client.post(
+        "/api/v1/boards/", json={"name": "import"}, headers=auth_headers
+    ).json()
+    body = (
+        "title,description,status,priority\n"
+        "Blank status,,,HIGH\n"
+        "Blank priority,notes,DONE,\n"
+        "Blank both,,,\n"
+    )
+    response = client.post(
+        f"/api/v1/boards/{board['id']}/tasks/import",
+        params={"format": "csv"},
+        content=body,
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    assert response.json()["imported"] == 3
+    assert response.json()["rejected"] == 0
+
+    tasks = client.get(f"/api/v1/boards/{board['id']}", headers=auth_headers).json()[
+        "tasks"
+    ]
+    statuses = {task["title"]: (task["status"], task["priority"]) for task in tasks}
+    assert statuses == {
+        "Blank status": ("TODO", "HIGH"),
+        "Blank priority": ("DONE", "MEDIUM"),
+        "Blank both": ("TODO", "MEDIUM"),
+    }
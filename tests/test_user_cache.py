@@ -0,0 +1,53 @@
+"""
+The authenticated user cache: a committed change to a user must not leave a
+stale copy behind, even one cached by another request mid-transaction.
+"""
+
+import asyncio
+
+from app.core.database import async_session, migrate_db
+from app.domain.entities.user import User
+from app.infrastructure.repositories.user_repository import user_cache
+from app.utils.datetime import get_current_utc_time
+
+
+def test_commit_evicts_user_cached_after_flush():
+    email = "deactivated@example.com"
+
+    async def deactivate() -> None:
+        await migrate_db()
+        async with async_session() as session:
+            user = User(email=email, password="hash", created_at=get_current_utc_time())
+            session.add(user)
+            await session.commit()
+
+            user.is_active = False
+            await session.flush()
+            # A request reading the row before the commit caches it active.
+            user_cache.set(email, User(email=email, password="hash", is_active=True))
+            await session.commit()
+
+    asyncio.run(deactivate())
+    assert user_cache.get(email) is None
+
+
+def test_rollback_discards_pending_evictions():
+    email = "rolled-back@example.com"
+
+    async def rename() -> None:
+        await migrate_db()
+        async with async_session() as session:
+            user = User(email=email, password="hash", created_at=get_current_utc_time())
+            session.add(user)
+            await session.commit()
+
+            user.first_name = "Renamed"
+            await session.flush()
+            await session.rollback()
+
+            cached = User(email=email, password="hash")
+            user_cache.set(email, cached)
+            await session.commit()
+            assert user_cache.get(email) is cached
+
+    asyncio.run(rename())